@@ -0,0 +1,111 @@
+"""Scoring for the career quiz and the skill confidence meter.
+
+The quiz from the catalog is compiled once into a sparse
+question x option x career weight matrix: every checkbox a user can tick
+(form field ``q<n>[]`` + option value) maps to the career it votes for and
+the question's weight. A submission is the set of ticked cells, so scoring
+it is a sparse matrix-vector product whose cost depends only on how many
+boxes were ticked, and the top careers come from a partial selection
+rather than a full sort.
+
+Both scorers also take whole batches of submissions for offline cohort
+scoring (see cohort.py), reusing the same compiled tables.
+"""
+import heapq
+from functools import lru_cache
+
+from catalog import get_catalog
+
+
+class QuizEngine:
+
+    def __init__(self, quiz, careers):
+        self.quiz = quiz
+        self.careers = list(careers)
+        self.names = [careers[c]["name"] for c in self.careers]
+        self.insights = [careers[c]["insight"] for c in self.careers]
+        index = {career: i for i, career in enumerate(self.careers)}
+
+        # field -> option value -> (career index, weight)
+        self._cells = {}
+        for n, question in enumerate(quiz, 1):
+            weight = question.get("weight", 1)
+            self._cells[self.field(n)] = {
+                value: (index[value], weight)
+                for value in question["options"].values()
+            }
+
+    @staticmethod
+    def field(n):
+        # Must match the checkbox names in templates/career_quiz.html.
+        return f"q{n}[]"
+
+    def score(self, answers):
+        """Career score vector for ``(field, [values])`` pairs, e.g. ``form.lists()``.
+
+        Fields or values that are not part of the quiz are ignored.
+        """
+        scores = [0] * len(self.careers)
+        cells = self._cells
+        for field, values in answers:
+            row = cells.get(field)
+            if row is None:
+                continue
+            for value in values:
+                cell = row.get(value)
+                if cell is not None:
+                    scores[cell[0]] += cell[1]
+        return scores
+
+    def top(self, scores, k=3):
+        """Indices of the ``k`` best careers; ties keep catalog order."""
+        return heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+
+    def top_careers(self, answers, k=3):
+        return self.top(self.score(answers), k)
+
+    def score_batch(self, batch, k=3):
+        """``(scores, top)`` for each submission in ``batch``."""
+        score, top = self.score, self.top
+        return [(s, top(s, k)) for s in map(score, batch)]
+
+
+class SkillConfidenceScorer:
+
+    def __init__(self, skills, levels, weak_at=33):
+        self.skills = tuple(skills)
+        self.levels = levels
+        self.weak_at = weak_at
+
+    def score(self, answers):
+        """One result row per skill from a ``skill -> level`` mapping."""
+        levels, weak_at = self.levels, self.weak_at
+        results = []
+        for skill in self.skills:
+            level = answers.get(skill)
+            score = levels.get(level, 0)
+            results.append({
+                "skill": skill,
+                "level": level,
+                "score": score,
+                "weak": score <= weak_at
+            })
+        return results
+
+    def score_batch(self, batch):
+        return [self.score(answers) for answers in batch]
+
+
+@lru_cache(maxsize=None)
+def get_quiz_engine():
+    catalog = get_catalog()
+    return QuizEngine(catalog.quiz, catalog.careers)
+
+
+@lru_cache(maxsize=None)
+def get_confidence_scorer(skills=None):
+    """The catalog's confidence scorer, optionally over a custom skill list."""
+    confidence = get_catalog().confidence
+    return SkillConfidenceScorer(
+        skills or confidence["skills"], confidence["levels"], confidence.get("weak_at", 33)
+    )
@@ -0,0 +1,214 @@
+"""Static asset build and serving.
+
+``build()`` turns each file in ``ASSETS`` into
+
+    static/dist/<name>.<hash>.<ext>        minified
+    static/dist/<name>.<hash>.<ext>.gz     gzip -9
+    static/dist/<name>.<hash>.<ext>.br     brotli, if the module is installed
+
+plus ``manifest.json`` mapping source names to built ones. The hash is
+taken over the minified content, so a built URL never changes meaning and
+is served with a one-year ``immutable`` Cache-Control.
+
+``init_app`` adds ``asset_url(endpoint, **values)`` to the templates. It
+takes the same arguments as ``url_for`` and only rewrites
+``('static', filename=<asset>)`` to the fingerprinted URL under
+``/assets/``, falling back to the plain static file before a build. The
+``/assets/`` view sends the ``.br`` or ``.gz`` variant when the client
+accepts it. Builds run with ``flask build-assets`` (or ``python
+assets.py``), and on start-up when the sources are newer than the
+manifest.
+
+The minifiers only remove comments and whitespace, outside string
+literals. The JS keeps its line breaks, since the widget relies on
+automatic semicolon insertion.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+import click
+from flask import current_app, request, send_from_directory, url_for
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(HERE, "static")
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+MANIFEST = "manifest.json"
+
+ASSETS = ("style.css", "chatbot.js")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# (suffix, Content-Encoding) in order of preference.
+ENCODINGS = ((".br", "br"), (".gz", "gzip"))
+
+try:
+    import brotli  # optional dependency, only used for the .br variants
+except ImportError:
+    brotli = None
+
+
+# -------------------- MINIFY --------------------
+
+_CSS_TOKENS = re.compile(r'(/\*.*?\*/)|("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|([^"\'/]+|.)', re.S)
+_JS_TOKENS = re.compile(
+    r'(/\*.*?\*/|//[^\n]*)|("(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`)|([^"\'`/]+|.)',
+    re.S
+)
+
+
+def _minify(tokens, source, squeeze):
+    out = []
+    code = []
+    for comment, string, other in tokens.findall(source):
+        if string:
+            out.append(squeeze("".join(code)))
+            code = []
+            out.append(string)
+        elif comment:
+            code.append(" ")
+        else:
+            code.append(other)
+    out.append(squeeze("".join(code)))
+    return "".join(out).strip()
+
+
+def _squeeze_css(code):
+    code = re.sub(r"\s+", " ", code)
+    code = re.sub(r" ?([{};,>]) ?", r"\1", code)
+    code = re.sub(r": ", ":", code)
+    return code.replace(";}", "}")
+
+
+def _squeeze_js(code):
+    lines = [line.strip() for line in code.split("\n")]
+    body = "\n".join(line for line in lines if line)
+    if not body:
+        return "\n" if len(lines) > 1 else code[:1]
+    # Keep a line break next to a string literal: it may end a statement.
+    lead = "\n" if len(lines) > 1 and not lines[0] else ""
+    trail = "\n" if len(lines) > 1 and not lines[-1] else ""
+    return lead + body + trail
+
+
+def minify_css(source):
+    return _minify(_CSS_TOKENS, source, _squeeze_css)
+
+
+def minify_js(source):
+    return _minify(_JS_TOKENS, source, _squeeze_js)
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+
+# -------------------- BUILD --------------------
+
+def _write(path, data):
+    # Write-then-rename, so a worker never serves a half-written file.
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(data)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+
+
+def build(static_dir=STATIC_DIR, dist_dir=DIST_DIR, assets=ASSETS):
+    """Build every asset; returns the manifest."""
+    os.makedirs(dist_dir, exist_ok=True)
+    manifest = {}
+    for name in assets:
+        stem, ext = os.path.splitext(name)
+        with open(os.path.join(static_dir, name), encoding="utf-8") as fh:
+            data = MINIFIERS[ext](fh.read()).encode()
+
+        built = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+        path = os.path.join(dist_dir, built)
+        if not os.path.exists(path):
+            _write(path + ".gz", gzip.compress(data, 9, mtime=0))
+            if brotli is not None:
+                _write(path + ".br", brotli.compress(data, quality=11))
+            _write(path, data)
+        manifest[name] = built
+
+    _write(os.path.join(dist_dir, MANIFEST), json.dumps(manifest, indent=2).encode())
+    return manifest
+
+
+def load_manifest(dist_dir=DIST_DIR):
+    try:
+        with open(os.path.join(dist_dir, MANIFEST), encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return {}
+
+
+def is_stale(static_dir=STATIC_DIR, dist_dir=DIST_DIR, assets=ASSETS):
+    try:
+        built = os.path.getmtime(os.path.join(dist_dir, MANIFEST))
+    except OSError:
+        return True
+    return any(os.path.getmtime(os.path.join(static_dir, name)) > built for name in assets)
+
+
+# -------------------- FLASK BINDING --------------------
+
+def asset_url(endpoint, **values):
+    """``url_for`` that points ``static`` assets at their built file."""
+    if endpoint == "static":
+        built = current_app.extensions["assets"].get(values.get("filename"))
+        if built:
+            values["filename"] = built
+            endpoint = "assets"
+    return url_for(endpoint, **values)
+
+
+def serve_asset(filename):
+    dist_dir = current_app.config["ASSETS_DIST_DIR"]
+    accepted = request.accept_encodings
+    for suffix, encoding in ENCODINGS:
+        if accepted[encoding] and os.path.exists(os.path.join(dist_dir, filename + suffix)):
+            response = send_from_directory(
+                dist_dir, filename + suffix, mimetype=_mimetype(filename), max_age=31536000
+            )
+            response.headers["Content-Encoding"] = encoding
+            break
+    else:
+        response = send_from_directory(dist_dir, filename, max_age=31536000)
+    response.headers["Cache-Control"] = IMMUTABLE
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _mimetype(filename):
+    return {".css": "text/css", ".js": "text/javascript"}.get(os.path.splitext(filename)[1])
+
+
+def init_app(app, dist_dir=DIST_DIR, auto_build=True):
+    """Serve built assets under /assets/ and add ``asset_url`` to templates.
+
+    With ``auto_build`` a missing or stale build is redone first, so a
+    preloading master builds once before the workers fork.
+    """
+    if auto_build and is_stale(dist_dir=dist_dir):
+        build(dist_dir=dist_dir)
+    app.config["ASSETS_DIST_DIR"] = dist_dir
+    app.extensions["assets"] = load_manifest(dist_dir)
+    app.add_url_rule("/assets/<path:filename>", "assets", serve_asset)
+    app.add_template_global(asset_url)
+
+    @app.cli.command("build-assets")
+    def build_assets_command():
+        """Minify, fingerprint and precompress the static assets."""
+        manifest = build(dist_dir=dist_dir)
+        app.extensions["assets"] = manifest
+        for name, built in manifest.items():
+            click.echo(f"{name} -> {built}")
+
+
+if __name__ == "__main__":
+    for name, built in build().items():
+        print(f"{name} -> {built}")
@@ -1,42 +1,164 @@
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify
-import boto3
-import uuid
-import random
+from flask import Flask, Response, render_template, request, redirect, url_for, session, jsonify
+import atexit
+import json
 import os
+import click
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key, Attr
 from werkzeug.security import generate_password_hash, check_password_hash
 
+import assets
+import aws_clients
+import bulk_import
+import cache
+import compressor
+import dynamo_access
+import notifications
+import page_cache
+import resume_ingest
+import sessions
+import storage
+from assessment import get_confidence_scorer, get_quiz_engine
+from aws_status import DEFAULT_INTERVAL, StatusPoller
+from catalog import get_catalog
+from goal_resolver import get_resolver
+from intents import get_intent_engine
+from matcher import KeywordMatcher
+from skill_matrix import get_skill_matrix
+from tips import get_tip_schedule
+
 app = Flask(__name__)
 app.secret_key = "aws_super_secret_key"
+app.config["MAX_RESUME_BYTES"] = int(os.getenv("MAX_RESUME_BYTES", resume_ingest.DEFAULT_MAX_BYTES))
+
+
+# The shared templates name endpoints the way app.py's blueprints do
+# ("auth.login"); this app registers its views flat ("login").
+def flat_endpoint(error, endpoint, values):
+    if "." in endpoint:
+        return url_for(endpoint.rsplit(".", 1)[1], **values)
+    raise error
+
+
+app.url_build_error_handlers.append(flat_endpoint)
+
+# Fingerprinted, minified and precompressed static assets; see assets.py.
+assets.init_app(app, auto_build=os.getenv("ASSETS_AUTO_BUILD", "1") == "1")
+
+# gzip (brotli/zstd when installed) for responses of COMPRESS_MIN_SIZE bytes and up.
+compression = compressor.init_app(
+    app,
+    int(os.getenv("COMPRESS_MIN_SIZE", compressor.DEFAULT_MIN_SIZE)),
+    int(os.getenv("COMPRESS_LEVEL", compressor.DEFAULT_LEVEL))
+)
+
+CATALOG = get_catalog()
+GOAL_RESOLVER = get_resolver()
+SKILL_MATRIX = get_skill_matrix()
+
 
 # ================= AWS CONFIG =================
 REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 
-dynamodb = boto3.resource("dynamodb", region_name=REGION)
-sns = boto3.client("sns", region_name=REGION)
-ec2 = boto3.client("ec2", region_name=REGION)
-iam = boto3.client("iam", region_name=REGION)
-
+# Clients are built on first use and shared across threads; pooling,
+# retries and timeouts come from the AWS_* settings in aws_clients.py.
+aws = aws_clients.AWSClients(REGION)
+
+sns = aws.lazy_client("sns")
+ec2 = aws.lazy_client("ec2")
+iam = aws.lazy_client("iam")
+
+# Users, admins, profiles and projects go through the shared storage
+# interface; the raw tables stay available for bulk import and export.
+STORAGE = storage.DynamoStorage.from_clients(aws)
+
+users_table = STORAGE.users
+profiles_table = STORAGE.profiles
+
+# Items per page on list views; reads follow LastEvaluatedKey cursors.
+PAGE_SIZE = int(os.getenv("DYNAMO_PAGE_SIZE", dynamo_access.DEFAULT_PAGE_SIZE))
+EXPORT_SEGMENTS = int(os.getenv("DYNAMO_EXPORT_SEGMENTS", dynamo_access.DEFAULT_SEGMENTS))
+
+# ================= READ CACHE =================
+# Profiles change when their owner saves the form; projects only when an
+# admin creates one. Both write paths below invalidate these caches.
+CACHE_MAXSIZE = int(os.getenv("CACHE_MAXSIZE", "10000"))
+cache_backend = cache.shared_backend()
+
+# Invalidations reach the other workers on this host through stamp files
+# here (empty disables them); other hosts only through the Redis tier
+# (see cache.py). Shared by the page cache and the read caches.
+CACHE_STAMP_DIR = os.getenv("CACHE_STAMP_DIR", os.path.join(app.root_path, ".cache_stamps")) or None
+
+# Rendered about/index/projects pages, plus compiled templates on disk.
+page_cache.init_app(
+    app,
+    page_cache.PageCache(
+        int(os.getenv("PAGE_CACHE_SIZE", page_cache.DEFAULT_MAXSIZE)),
+        float(os.getenv("PAGE_CACHE_TTL", page_cache.DEFAULT_TTL)),
+        tips=get_tip_schedule,
+        stamp_dir=CACHE_STAMP_DIR
+    ),
+    bytecode_dir=os.getenv("JINJA_CACHE_DIR", os.path.join(app.root_path, ".jinja_cache"))
+)
+
+profiles_cache = cache.ReadThroughCache(
+    "profiles", float(os.getenv("CACHE_PROFILES_TTL", "60")), CACHE_MAXSIZE, cache_backend,
+    stamp_dir=CACHE_STAMP_DIR
+)
+projects_cache = cache.ReadThroughCache(
+    "projects", float(os.getenv("CACHE_PROJECTS_TTL", "300")), CACHE_MAXSIZE, cache_backend,
+    stamp_dir=CACHE_STAMP_DIR
+)
+
+
+def get_profile(username):
+    return profiles_cache.get(username, lambda: STORAGE.get_profile(username))
+
+
+def get_projects_page(cursor=None):
+    # Pages are keyed by their cursor; the first page has none.
+    return projects_cache.get(
+        cursor or "",
+        lambda: STORAGE.list_projects(PAGE_SIZE, cursor)
+    )
 
-users_table = dynamodb.Table("Users")
-admins_table = dynamodb.Table("Admins")
-projects_table = dynamodb.Table("Projects")
-profiles_table = dynamodb.Table("Profiles")
+# ================= SESSIONS =================
+# Kept server side; the cookie only holds the session id. file (default,
+# shared by the workers of one host), dynamodb (the Sessions table, keyed
+# on "id", with TTL on "expires"), memory (single process) or cookie for
+# Flask's signed cookie session.
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "file")
+if SESSION_BACKEND != "cookie":
+    session_store = sessions.create_store(
+        SESSION_BACKEND,
+        directory=os.getenv("SESSION_DIR", os.path.join(app.root_path, ".sessions")),
+        table=aws.lazy_table(os.getenv("SESSION_TABLE", "Sessions")),
+        maxsize=int(os.getenv("SESSION_CACHE_SIZE", sessions.DEFAULT_MAXSIZE))
+    )
+    sessions.init_app(app, session_store)
 
 # Replace with your actual SNS Topic ARN after creating it in AWS Console
 SNS_TOPIC_ARN = 'arn:aws:sns:us-east-1:311141554074:aws_capstone_vcc'
 
+# Published in batches from a background thread, off the request path
+notifier = notifications.Notifier(
+    sns,
+    SNS_TOPIC_ARN,
+    maxsize=int(os.getenv("NOTIFY_QUEUE_SIZE", "1000")),
+    spill_path=os.getenv("NOTIFY_SPILL_PATH", "notifications.spill.ndjson")
+)
+atexit.register(notifier.close)
+
 # ================= LANDING =================
 @app.route("/")
 def index():
     if "username" in session:
         return redirect(url_for("home"))
-    return render_template("index.html")
+    return page_cache.render_cached("index.html")
 
 @app.route("/about")
 def about():
-    return render_template("about.html")
+    return page_cache.render_cached("about.html")
 
 # ================= USER AUTH =================
 @app.route("/signup", methods=["GET", "POST"])
@@ -48,34 +170,18 @@ def signup():
 
         try:
             # 1. Save to DynamoDB (Original Task)
-            users_table.put_item(
-                Item={
-                    "username": username,
-                    "email": email,
-                    "password": password
-                },
-                ConditionExpression="attribute_not_exists(username)"
-            )
-            
-            # 2. SNS Integration (New Task)
-            # This only runs if the DynamoDB put_item succeeds!
-            sns.publish(
-                TopicArn=SNS_TOPIC_ARN,
-                Message=f"New user registered: {username} ({email})",
-                Subject="New User Signup Alert"
-            )
-
+            if not STORAGE.create_user(username, email, password):
+                return "User already exists"
         except ClientError as e:
             print("DYNAMODB ERROR:", e.response["Error"])
-            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
-                return "User already exists"
             return e.response["Error"]["Message"]
 
-        except Exception as e:
-            # Catch SNS or other unexpected errors
-            print(f"Notification Failed: {e}")
-            # We still redirect because the user was created successfully
-            return redirect(url_for("login"))
+        # 2. SNS Integration: only queued once put_item succeeded; the
+        # notifier publishes it in the background.
+        notifier.notify(
+            f"New user registered: {username} ({email})",
+            subject="New User Signup Alert"
+        )
 
         return redirect(url_for("login"))
 
@@ -87,9 +193,7 @@ def login():
         username = request.form["username"]
         password = request.form["password"]
 
-        res = users_table.get_item(Key={"username": username})
-
-        if "Item" in res and res["Item"]["password"] == password:
+        if STORAGE.check_user(username, password):
             session["username"] = username
             return redirect(url_for("home"))
 
@@ -112,8 +216,13 @@ def home():
 # ================= PROJECTS =================
 @app.route("/projects")
 def projects():
-    res = projects_table.scan()
-    return render_template("projects_list.html", projects=res.get("Items", []))
+    cursor = request.args.get("cursor")
+
+    def load():
+        page = get_projects_page(cursor)
+        return {"projects": page.items, "next_cursor": page.cursor}
+
+    return page_cache.render_cached("projects_list.html", load, max_age=0, cursor=cursor)
 
 # ================= ADMIN SIGNUP =================
 @app.route("/admin/signup", methods=["GET", "POST"])
@@ -124,14 +233,8 @@ def admin_signup():
         password = request.form["password"]
 
         try:
-            admins_table.put_item(
-                Item={
-                    "email": email,
-                    "name": name,
-                    "password": password
-                },
-                ConditionExpression="attribute_not_exists(email)"
-            )
+            if not STORAGE.create_admin(name, email, password):
+                return "Admin already exists"
         except ClientError:
             return "Admin already exists"
 
@@ -146,9 +249,7 @@ def admin_login():
         email = request.form["email"]
         password = request.form["password"]
 
-        res = admins_table.get_item(Key={"email": email})
-
-        if "Item" in res and res["Item"]["password"] == password:
+        if STORAGE.check_admin(email, password):
             session["admin"] = email
             return redirect(url_for("admin_dashboard"))
 
@@ -167,13 +268,15 @@ def admin_dashboard():
     if "admin" not in session:
         return redirect(url_for("admin_login"))
 
-    users = users_table.scan().get("Items", [])
-    projects = projects_table.scan().get("Items", [])
+    # First page only; the full lists live behind their own paginated views.
+    users = STORAGE.list_users(PAGE_SIZE).items
+    projects = get_projects_page().items
 
     return render_template(
         "admin_dashboard.html",
         users=users,
-        projects=projects
+        projects=projects,
+        aws_status_url=url_for("aws_status")
     )
 
 @app.route("/admin/users")
@@ -181,38 +284,143 @@ def admin_users():
     if "admin" not in session:
         return redirect(url_for("admin_login"))
 
-    users = users_table.scan().get("Items", [])
-    return render_template("admin_users.html", users=users)
+    page = STORAGE.list_users(PAGE_SIZE, request.args.get("cursor"))
+    return render_template(
+        "admin_users.html",
+        users=page.items,
+        next_cursor=page.cursor,
+        export_url=url_for("admin_users_export")
+    )
+
+@app.route("/admin/users/export")
+def admin_users_export():
+    """Every user as NDJSON, read with a parallel segmented scan"""
+    if "admin" not in session:
+        return redirect(url_for("admin_login"))
+
+    def generate():
+        for user in dynamo_access.parallel_scan(users_table, EXPORT_SEGMENTS):
+            user.pop("password", None)
+            yield json.dumps(user, default=str) + "\n"
+
+    return Response(
+        generate(),
+        mimetype="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=users.ndjson"}
+    )
+
+@app.route("/admin/cache-stats")
+def admin_cache_stats():
+    if "admin" not in session:
+        return redirect(url_for("admin_login"))
+    return jsonify({
+        "profiles": profiles_cache.stats(),
+        "projects": projects_cache.stats(),
+        "pages": page_cache.get_page_cache().stats(),
+        "sessions": app.extensions["sessions"].stats() if "sessions" in app.extensions else None
+    })
+
+@app.route("/admin/compression-stats")
+def admin_compression_stats():
+    if "admin" not in session:
+        return redirect(url_for("admin_login"))
+    return jsonify(compression.stats())
+
+@app.route("/admin/notify-stats")
+def admin_notify_stats():
+    if "admin" not in session:
+        return redirect(url_for("admin_login"))
+    return jsonify(notifier.stats())
+
+# ================= BULK IMPORT =================
+IMPORT_WORKERS = int(os.getenv("IMPORT_WORKERS", "8"))
+
+
+def import_table(target):
+    return {"users": users_table, "profiles": profiles_table}[target]
+
+
+def run_import(target, rows, workers=IMPORT_WORKERS):
+    stats = bulk_import.import_items(
+        import_table(target), rows, bulk_import.TARGETS[target], workers,
+        keep_existing=target in bulk_import.KEEP_EXISTING
+    )
+    if target == "profiles":
+        profiles_cache.invalidate_all()
+    return stats
+
+@app.route("/admin/import/<target>", methods=["POST"])
+def admin_import(target):
+    """Bulk import an uploaded CSV/NDJSON ``file`` into users or profiles"""
+    if "admin" not in session:
+        return jsonify({"error": "admin login required"}), 401
+    if target not in bulk_import.TARGETS:
+        return jsonify({"error": "unknown import target"}), 404
+
+    upload = request.files.get("file")
+    if not upload:
+        return jsonify({"error": "no file uploaded"}), 400
+
+    fmt = request.args.get("format") or bulk_import.guess_format(upload.filename)
+    rows = bulk_import.read_items(bulk_import.text_stream(upload.stream), fmt)
+    workers = request.args.get("workers", IMPORT_WORKERS, type=int)
+    return jsonify(run_import(target, rows, workers))
+
+@app.route("/admin/users/lookup", methods=["POST"])
+def admin_users_lookup():
+    """Fetch many users at once: JSON body ``{"usernames": [...]}``"""
+    if "admin" not in session:
+        return jsonify({"error": "admin login required"}), 401
+
+    usernames = (request.get_json(silent=True) or {}).get("usernames") or []
+    return jsonify({"users": STORAGE.get_users(usernames)})
+
+@app.cli.command("import-items")
+@click.argument("target", type=click.Choice(sorted(bulk_import.TARGETS)))
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "fmt", type=click.Choice(["csv", "ndjson"]), default=None,
+              help="Input format (default: from the file extension).")
+@click.option("--workers", type=int, default=IMPORT_WORKERS, help="Concurrent batch writers.")
+def import_items_command(target, path, fmt, workers):
+    """Bulk import users or profiles from a CSV or NDJSON file."""
+    with open(path, newline="", encoding="utf-8") as fh:
+        rows = bulk_import.read_items(fh, fmt or bulk_import.guess_format(path))
+        stats = run_import(target, rows, workers)
+
+    click.echo(
+        f"imported {stats['items']} items in {stats['seconds']}s "
+        f"({stats['items_per_sec']} items/sec, {stats['retries']} retries, "
+        f"{stats['failed']} failed, {stats['skipped']} skipped, "
+        f"{stats['existing']} already present)",
+        err=True
+    )
 
 # ================= AWS INFRASTRUCTURE STATUS =================
 
+# Refreshed in the background; page views only read the snapshot.
+status_poller = StatusPoller(
+    ec2, iam, interval=float(os.getenv("AWS_STATUS_INTERVAL", DEFAULT_INTERVAL))
+)
+
 @app.route("/admin/aws-status")
 def aws_status():
     """Combined view of EC2 and IAM so you only need ONE new HTML file"""
     if "admin" not in session:
         return redirect(url_for("admin_login"))
 
-    # 1. Fetch EC2 Data
-    instances = []
-    try:
-        response = ec2.describe_instances()
-        for reservation in response["Reservations"]:
-            for inst in reservation["Instances"]:
-                instances.append({
-                    "id": inst["InstanceId"],
-                    "state": inst["State"]["Name"],
-                    "type": inst["InstanceType"]
-                })
-    except Exception as e:
-        instances = [{"id": "Error", "state": str(e), "type": "N/A"}]
-
-    # 2. Fetch IAM Data
-    try:
-        user_info = iam.get_user()["User"]
-    except Exception as e:
-        user_info = {"UserName": "Access Denied", "Arn": str(e)}
-
-    return render_template("admin_aws_status.html", instances=instances, user=user_info)
+    snapshot = status_poller.snapshot()
+    return render_template(
+        "admin_aws_status.html",
+        instances=snapshot["instances"],
+        user=snapshot["user"],
+        snapshot=snapshot
+    )
+
+@app.route("/admin/aws-status.json")
+def aws_status_json():
+    if "admin" not in session:
+        return jsonify({"error": "admin login required"}), 401
+    return jsonify(status_poller.snapshot())
 
 # ================= ADMIN CREATE PROJECT =================
 @app.route("/admin/create-project", methods=["GET", "POST"])
@@ -224,15 +432,9 @@ def admin_create_project():
         title = request.form["title"]
         description = request.form["description"]
 
-        project_id = str(uuid.uuid4())
-
-        projects_table.put_item(
-            Item={
-                "id": project_id,
-                "title": title,
-                "description": description
-            }
-        )
+        STORAGE.create_project(title, description)
+        projects_cache.invalidate_all()
+        page_cache.get_page_cache().invalidate("projects_list.html")
 
         return redirect(url_for("admin_dashboard"))
 
@@ -240,127 +442,59 @@ def admin_create_project():
 
 # ================= ROADMAP ================= #
 
-ROADMAPS = {
-    "software developer": [
-        "Learn Python or Java basics",
-        "Understand data structures and algorithms",
-        "Build small projects (calculator, todo app)",
-        "Learn Git & GitHub",
-        "Explore backend or frontend",
-        "Do internships or freelance projects",
-        "Apply for junior developer roles"
-    ],
-    "data scientist": [
-        "Learn Python and statistics",
-        "Master NumPy, Pandas, Matplotlib",
-        "Learn SQL and data cleaning",
-        "Understand machine learning basics",
-        "Build real datasets projects",
-        "Learn model deployment",
-        "Apply for data roles"
-    ],
-    "ui ux designer": [
-        "Understand design principles",
-        "Learn Figma or Adobe XD",
-        "Practice wireframing",
-        "Build design case studies",
-        "Learn user research",
-        "Create portfolio",
-        "Apply for design internships"
-    ]
-}
-
 @app.route("/roadmap")
 def roadmap():
     if "username" not in session:
         return redirect(url_for("login"))
 
-    res = profiles_table.get_item(Key={"user_id": session["username"]})
-    data = res.get("Item")
-
-    if data:
-        # Reference code uses a more flexible 'in' check (software developer vs developer)
-        goal = data["career_goal"].lower()
-        steps = [ 
-            "Understand basics of your chosen field",
-            "Learn required core skills",
-            "Build beginner projects",
-            "Gain practical experience",
-            "Create portfolio",
-            "Apply for roles"
-        ] # Default
-        for key, value in ROADMAPS.items():
-            if key in goal:
-                steps = value
-                break
-    else:
-        steps = []
+    data = get_profile(session["username"])
+
+    steps = GOAL_RESOLVER.roadmap_for(data["career_goal"]) if data else []
 
     return render_template("roadmap.html", steps=steps)
 
 # ================= CHATBOT ================= #
 
-def chatbot_reply(msg):
-    msg = msg.lower()
-
-    if "career" in msg:
-        return "Tell me your interests and strengths. I’ll help you choose a career path."
-
-    if "software" in msg:
-        return "Software development is a solid choice. Want a roadmap?"
-
-    if "data" in msg:
-        return "Data science needs math + coding. Want a learning plan?"
+CHATBOT = get_intent_engine()
 
-    if "confused" in msg or "help" in msg:
-        return "Totally normal. Career clarity takes time. Start with interests."
-
-    if "roadmap" in msg:
-        return "Go to Profile → enter your career goal → generate roadmap ✨"
-
-    return "I’m here for career guidance 🌱 Ask me about careers, skills, or roadmaps."
+def chatbot_reply(msg):
+    return CHATBOT.reply(msg)
 
 @app.route("/chat", methods=["POST"])
 def chat():
     msg = request.json.get("message")
     return jsonify({"reply": chatbot_reply(msg)})
 
+@app.route("/chat/stream", methods=["POST"])
+def chat_stream_sse():
+    # chat_stream builds its ASGI app on import; only load it when used.
+    import chat_stream
+
+    msg = (request.get_json(silent=True) or {}).get("message")
+    return Response(
+        chat_stream.sse_reply(chatbot_reply(msg)),
+        mimetype="text/event-stream",
+        headers=chat_stream.SSE_HEADERS
+    )
+
 # ================= SKILL CONFIDENCE ================= #
+CONFIDENCE = get_confidence_scorer((
+    "Python", "SQL", "HTML/CSS", "JavaScript",
+    "Machine Learning", "Communication"
+))
+
 @app.route("/skill-confidence", methods=["GET", "POST"])
 def skill_confidence():
-    skills = [
-        "Python", "SQL", "HTML/CSS", "JavaScript",
-        "Machine Learning", "Communication"
-    ]
-
     if request.method == "POST":
-        results = []
-
-        for skill in skills:
-            level = request.form.get(skill)
-            score = {"Beginner": 33, "Intermediate": 66, "Confident": 100}.get(level, 0)
-
-            results.append({
-                "skill": skill,
-                "level": level,
-                "score": score,
-                "weak": score <= 33
-            })
-
+        results = CONFIDENCE.score(request.form)
         return render_template("skill_confidence_result.html", results=results)
 
-    return render_template("skill_confidence.html", skills=skills)
+    return render_template("skill_confidence.html", skills=CONFIDENCE.skills)
 
 # ================= DAILY TIP =================
-CAREER_TIPS = [
-    {"tip": "Build projects, not certificates.", "quote": "Skills > Degrees"},
-    {"tip": "Consistency wins.", "quote": "Small steps matter"},
-    {"tip": "Learn deeply.", "quote": "Depth builds confidence"}
-]
-
 @app.context_processor
 def inject_daily_tip():
-    return {"daily_tip": random.choice(CAREER_TIPS)}
+    return {"daily_tip": get_tip_schedule().tip(session.get("username"))}
 
 # ================= PROFILE ================= #
 @app.route("/profile", methods=["GET", "POST"])
@@ -369,25 +503,14 @@ def profile():
         return redirect(url_for("login"))
 
     if request.method == "POST":
-        career_goal = request.form["career_goal"]
-        current_level = request.form["current_level"]
-        interests = request.form["interests"]
-        time = request.form["time_per_week"]
-
         # Saving user data to AWS DynamoDB Profiles table
-        profiles_table.put_item(
-            Item={
-                "user_id": session["username"],
-                "career_goal": career_goal,
-                "current_level": current_level,
-                "interests": interests,
-                "time_per_week": time
-            }
-        )
+        STORAGE.save_profile(session["username"], {
+            field: request.form[field] for field in storage.PROFILE_FIELDS
+        })
+        profiles_cache.invalidate(session["username"])
         return redirect(url_for("roadmap"))
 
-    res = profiles_table.get_item(Key={"user_id": session["username"]})
-    profile_data = res.get("Item")
+    profile_data = get_profile(session["username"])
     
     return render_template("profile.html", profile=profile_data)
 
@@ -398,49 +521,66 @@ def skill_gap():
     if "username" not in session:
         return redirect(url_for("login"))
 
-    SKILL_MAP_DATA = {
-    "software developer": ["Python", "Data Structures", "OOP", "Git", "HTML", "CSS", "JavaScript", "Flask / Django", "SQL"],
-    "data scientist": ["Python", "Statistics", "NumPy", "Pandas", "Data Visualization", "SQL", "Machine Learning", "Model Evaluation"],
-    "ui ux designer": ["Design Principles", "Color Theory", "Typography", "Figma", "Wireframing", "User Research", "Prototyping"]
-    }
-
     if request.method == "POST":
         role = request.form["role"]
         known_skills = request.form.getlist("skills")
-        required_skills = SKILL_MAP_DATA.get(role, [])
-        missing_skills = [s for s in required_skills if s not in known_skills]
+        missing_skills = SKILL_MATRIX.missing(role, known_skills)
+        closest = SKILL_MATRIX.closest_roles(known_skills, limit=3)
 
-        return render_template("skill_gap_result.html", role=role, known=known_skills, missing=missing_skills)
+        return render_template("skill_gap_result.html", role=role, known=known_skills, missing=missing_skills, closest=closest)
 
-    return render_template("skill_gap.html", skill_map=SKILL_MAP_DATA)
+    return render_template("skill_gap.html", skill_map=CATALOG.skill_maps)
 
 # ================= RESUME ANALYSIS ================= #
+RESUME_SECTIONS = {"education": 15, "skills": 15, "projects": 15, "experience": 15}
+
+RESUME_ROLE_SKILLS = {
+    "data scientist": ["python", "pandas", "sql", "machine learning"],
+    "software developer": ["python", "git", "flask", "css"],
+    "ai engineer": ["python", "machine learning", "deep learning", "tensorflow"]
+}
+
+# Compiled once at startup; one pass over the resume finds every keyword.
+RESUME_MATCHER = KeywordMatcher(
+    list(RESUME_SECTIONS) + [s for skills in RESUME_ROLE_SKILLS.values() for s in skills]
+)
+
 @app.route("/resume", methods=["GET", "POST"])
 def resume():
     analysis = None
     if request.method == "POST":
-        resume_text = request.form.get("resume_text", "").lower()
+        if (request.content_length or 0) > app.config["MAX_RESUME_BYTES"] + 64 * 1024:
+            return "Resume is too large", 413
+
         target_role = request.form.get("role", "").lower() # Ensure your HTML has this input
+        upload = request.files.get("resume_file")
+
+        if upload and upload.filename:
+            # Uploaded files are streamed through the matcher chunk by chunk
+            try:
+                found = resume_ingest.scan_upload(
+                    upload.stream, RESUME_MATCHER, upload.filename, upload.mimetype,
+                    max_bytes=app.config["MAX_RESUME_BYTES"]
+                )
+            except resume_ingest.ResumeTooLarge as e:
+                return str(e), 413
+            except resume_ingest.UnsupportedResume as e:
+                return str(e), 415
+        else:
+            found = RESUME_MATCHER.found(request.form.get("resume_text", ""))
         
         score = 0
         strengths = []
         
         # Section checks (Sync with reference logic)
-        sections = {"education": 15, "skills": 15, "projects": 15, "experience": 15}
-        for sec, pts in sections.items():
-            if sec in resume_text:
+        for sec, pts in RESUME_SECTIONS.items():
+            if sec in found:
                 score += pts
                 strengths.append(f"{sec.capitalize()} Section Found")
 
         # Role-based skill check (This makes it 'smart')
-        role_skills = {
-            "data scientist": ["python", "pandas", "sql", "machine learning"],
-            "software developer": ["python", "git", "flask", "css"],
-            "ai engineer": ["python", "machine learning", "deep learning", "tensorflow"]
-        }
-        
-        required = role_skills.get(target_role, [])
-        missing_skills = [s for s in required if s not in resume_text]
+        required = RESUME_ROLE_SKILLS.get(target_role, [])
+        missing_skills = [s for s in required if s not in found]
         score += max(0, 40 - (len(missing_skills) * 10))
 
         analysis = {"score": min(score, 100), "strengths": strengths, "missing_skills": missing_skills}
@@ -449,70 +589,19 @@ def resume():
 
 # ================= CAREER QUIZ ================= #
 
-CAREER_QUIZ_DATA = [
-    {
-        "question": "Do you enjoy logic or creativity more?",
-        "options": {
-            "Logic & problem solving": "developer",
-            "Data & patterns": "data_scientist",
-            "Creativity & design": "designer",
-            "Security & investigation": "cybersecurity",
-            "Planning & leadership": "product_manager"
-        }
-    },
-    {
-        "question": "How do you like to work?",
-        "options": {
-            "Independently with code": "developer",
-            "Analyzing data deeply": "data_scientist",
-            "Designing user experiences": "designer",
-            "Protecting systems": "cybersecurity",
-            "Coordinating teams": "product_manager"
-        }
-    },
-    {
-        "question": "Which tool excites you most?",
-        "options": {
-            "VS Code": "developer",
-            "Python & Pandas": "data_scientist",
-            "Figma": "designer",
-            "Firewalls & Networks": "cybersecurity",
-            "Roadmaps & Strategy": "product_manager"
-        }
-    }
-]
+QUIZ = get_quiz_engine()
 
 @app.route("/career-quiz", methods=["GET", "POST"])
 def career_quiz_page():
     if request.method == "POST":
-        # Updated to include all 5 categories from your app.py
-        scores = {
-            "developer": 0, "data_scientist": 0, "designer": 0, 
-            "cybersecurity": 0, "product_manager": 0
-        }
+        # Same compiled scoring as app.py; only the winner is kept here
+        winner = QUIZ.top_careers(request.form.lists(), k=1)[0]
         
-        # Logic to count votes
-        for key in request.form:
-            answer = request.form.get(key)
-            if answer in scores:
-                scores[answer] += 1
-        
-        # Get the highest score
-        winner = max(scores, key=scores.get)
-        
-        career_names = {
-            "developer": "Software Developer",
-            "data_scientist": "Data Scientist",
-            "designer": "UI/UX Designer",
-            "cybersecurity": "Cybersecurity Analyst",
-            "product_manager": "Product Manager"
-        }
-        
-        session["quiz_result"] = career_names[winner]
+        session["quiz_result"] = QUIZ.names[winner]
         return render_template("quiz_result.html", careers=[session["quiz_result"]], insight="Based on your interests!")
     
     # Passing the new dictionary to your template
-    return render_template("career_quiz.html", quiz=CAREER_QUIZ_DATA)
+    return render_template("career_quiz.html", quiz=QUIZ.quiz)
 
 # ================= RECOMMENDATIONS ================= #
 
@@ -520,46 +609,7 @@ def career_quiz_page():
 def recommendations():
     career = session.get("quiz_result", "Software Developer")
     
-    recs = {
-    "Data Analyst": {
-        "internships": [
-            "Data Analysis Internship",
-            "Business Intelligence Intern",
-            "Excel & SQL Intern"
-        ],
-        "projects": [
-            "Sales Data Dashboard",
-            "Customer Churn Analysis",
-            "COVID Data Visualization"
-        ]
-    },
-    "Software Developer": {
-        "internships": [
-            "Python Developer Intern",
-            "Web Developer Intern",
-            "Backend Developer Intern"
-        ],
-        "projects": [
-            "Flask Web App",
-            "Task Manager App",
-            "REST API using Python"
-        ]
-    },
-    "Machine Learning Engineer": {
-        "internships": [
-            "ML Internship",
-            "AI Research Intern",
-            "Data Science Intern"
-        ],
-        "projects": [
-            "Spam Email Classifier",
-            "Face Recognition System",
-            "Movie Recommendation System"
-        ]
-    }
-}
-    
-    data = recs.get(career)
+    data = CATALOG.recommendations.get(career)
     return render_template("recommendations.html", career=career, internships=data["internships"], projects=data["projects"])
 
 # ================= RUN =================
@@ -0,0 +1,92 @@
+"""Lazy, shared boto3 clients.
+
+Nothing here imports boto3 or resolves credentials until a client is
+actually used, so static pages and cold starts do not pay for it. Each
+client or resource is created once, under a lock, from a single session
+and then shared by every thread (botocore clients are thread-safe).
+
+Connection pooling, retries and timeouts come from the environment:
+
+    AWS_MAX_POOL_CONNECTIONS  urllib3 pool size per client (default 50)
+    AWS_MAX_ATTEMPTS          attempts per call, first one included (default 5)
+    AWS_RETRY_MODE            legacy | standard | adaptive (default standard)
+    AWS_CONNECT_TIMEOUT       seconds (default 2)
+    AWS_READ_TIMEOUT          seconds (default 10)
+    AWS_TCP_KEEPALIVE         1 / 0 (default 1)
+"""
+import os
+import threading
+
+
+def client_config():
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50")),
+        retries={
+            "total_max_attempts": int(os.getenv("AWS_MAX_ATTEMPTS", "5")),
+            "mode": os.getenv("AWS_RETRY_MODE", "standard"),
+        },
+        connect_timeout=float(os.getenv("AWS_CONNECT_TIMEOUT", "2")),
+        read_timeout=float(os.getenv("AWS_READ_TIMEOUT", "10")),
+        tcp_keepalive=os.getenv("AWS_TCP_KEEPALIVE", "1") == "1",
+    )
+
+
+class AWSClients:
+
+    def __init__(self, region=None):
+        self.region = region
+        self._lock = threading.Lock()
+        self._session = None
+        self._config = None
+        self._made = {}
+
+    def _get(self, kind, name):
+        key = (kind, name)
+        made = self._made.get(key)
+        if made is not None:
+            return made
+        with self._lock:
+            made = self._made.get(key)
+            if made is None:
+                if self._session is None:
+                    import boto3
+
+                    # Sessions are not thread-safe; only ever touched under the lock.
+                    self._session = boto3.session.Session(region_name=self.region)
+                    self._config = client_config()
+                factory = self._session.client if kind == "client" else self._session.resource
+                made = self._made[key] = factory(name, config=self._config)
+        return made
+
+    def client(self, name):
+        return self._get("client", name)
+
+    def resource(self, name):
+        return self._get("resource", name)
+
+    def lazy_client(self, name):
+        return Lazy(lambda: self.client(name))
+
+    def lazy_table(self, table_name):
+        return Lazy(lambda: self.resource("dynamodb").Table(table_name))
+
+
+class Lazy:
+    """Stands in for a client or table and builds it on first attribute access."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._target = None
+        self._lock = threading.Lock()
+
+    def _resolve(self):
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    self._target = self._factory()
+        return self._target
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
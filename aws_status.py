@@ -0,0 +1,135 @@
+"""Background-refreshed snapshot of the AWS infrastructure status.
+
+``StatusPoller`` refreshes the EC2 instance list (every page, through the
+``describe_instances`` paginator) and the IAM identity every
+``interval`` seconds on a daemon thread, running the two calls
+concurrently. The admin page and its JSON twin only read the latest
+snapshot, so a page view never waits on AWS and the APIs are called at a
+fixed rate however often the page is opened.
+
+A call that fails keeps the previous good value for its half of the
+snapshot and records the error next to it; before any success the same
+placeholders the page always showed are used. Each half carries the time
+it last succeeded (``succeeded_at``), and ``age_seconds`` is the age of
+the older half, so data kept through failures is not reported as fresh.
+``refreshed_at`` is the time of the last attempt.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_INTERVAL = 60.0
+
+
+class StatusPoller:
+
+    def __init__(self, ec2, iam, interval=DEFAULT_INTERVAL):
+        self.ec2 = ec2
+        self.iam = iam
+        self.interval = interval
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aws-status")
+
+    # -------------------- FETCHERS --------------------
+
+    def _instances(self):
+        instances = []
+        for page in self.ec2.get_paginator("describe_instances").paginate():
+            for reservation in page["Reservations"]:
+                for inst in reservation["Instances"]:
+                    instances.append({
+                        "id": inst["InstanceId"],
+                        "state": inst["State"]["Name"],
+                        "type": inst["InstanceType"]
+                    })
+        return instances
+
+    def _identity(self):
+        user = self.iam.get_user()["User"]
+        return {"UserName": user.get("UserName"), "Arn": user.get("Arn")}
+
+    # -------------------- REFRESH --------------------
+
+    def refresh(self):
+        """Fetch both halves concurrently and publish a new snapshot."""
+        with self._refresh_lock:
+            started = time.perf_counter()
+            instances = self._pool.submit(self._instances)
+            identity = self._pool.submit(self._identity)
+
+            previous = self._snapshot or {}
+            succeeded_at = dict(previous.get("succeeded_at") or {"instances": None, "user": None})
+            errors = {}
+            try:
+                instances = instances.result()
+                succeeded_at["instances"] = time.time()
+            except Exception as e:
+                errors["instances"] = str(e)
+                # Keep the last good list even when it is empty.
+                if succeeded_at["instances"] is not None:
+                    instances = previous["instances"]
+                else:
+                    instances = [{"id": "Error", "state": str(e), "type": "N/A"}]
+            try:
+                user = identity.result()
+                succeeded_at["user"] = time.time()
+            except Exception as e:
+                errors["user"] = str(e)
+                if succeeded_at["user"] is not None:
+                    user = previous["user"]
+                else:
+                    user = {"UserName": "Access Denied", "Arn": str(e)}
+
+            snapshot = {
+                "instances": instances,
+                "user": user,
+                "errors": errors,
+                "succeeded_at": succeeded_at,
+                "refreshed_at": time.time(),
+                "refresh_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+            with self._lock:
+                self._snapshot = snapshot
+            return snapshot
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                pass
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="aws-status-poller", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def snapshot(self):
+        """The latest snapshot plus ``ages`` (seconds since each half last
+        succeeded, None if it never has) and ``age_seconds``, the larger one.
+
+        The very first call refreshes synchronously and starts the poller.
+        """
+        if self._snapshot is None:
+            self.refresh()
+        self.start()
+        with self._lock:
+            snapshot = dict(self._snapshot)
+        now = time.time()
+        ages = {
+            part: None if at is None else round(now - at, 1)
+            for part, at in snapshot["succeeded_at"].items()
+        }
+        snapshot["ages"] = ages
+        snapshot["age_seconds"] = None if None in ages.values() else max(ages.values())
+        return snapshot
@@ -0,0 +1,58 @@
+"""Bytes sent per page view before and after the asset pipeline.
+
+    python benchmarks/bench_assets.py [--page /about]
+
+"before" is the page as it was: the chatbot script inline in every HTML
+response and style.css sent by Flask's static view uncompressed, then
+revalidated (a request and a 304) on every later view. "after" is the
+page with the built assets: minified, served pre-compressed, and
+immutable, so later views fetch nothing but the HTML.
+
+HTML bytes are uncompressed in both columns; compressing responses is a
+separate concern. Headers are not counted.
+"""
+import argparse
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page", default="/about")
+    args = parser.parse_args()
+
+    import app
+    import assets
+
+    flask_app = app.create_app({"STORAGE_BACKEND": "memory", "JINJA_CACHE_DIR": ""})
+    client = flask_app.test_client()
+    html = client.get(args.page).data
+
+    with open(os.path.join(assets.STATIC_DIR, "chatbot.js"), "rb") as fh:
+        inline_js = fh.read().split(b"\n", 1)[1]   # drop the file's header comment
+    with open(os.path.join(assets.STATIC_DIR, "style.css"), "rb") as fh:
+        css = fh.read()
+    html_before = re.sub(
+        rb'<script src="[^"]*"></script>', lambda m: b"<script>\n" + inline_js + b"</script>", html
+    )
+
+    urls = re.findall(rb'(?:href|src)="(/assets/[^"]+)"', html)
+    encodings = ["identity", "gzip"] + (["br"] if assets.brotli is not None else [])
+    sizes = {
+        enc: sum(len(client.get(url.decode(), headers={"Accept-Encoding": enc}).data) for url in urls)
+        for enc in encodings
+    }
+
+    print(f"page {args.page}")
+    print(f"{'':>24} {'first view':>12} {'repeat view':>12} {'requests':>9}")
+    print(f"{'before':>24} {len(html_before) + len(css):12,} {len(html_before):12,} {'2 / 2':>9}")
+    for enc in encodings:
+        print(f"{'after (' + enc + ')':>24} {len(html) + sizes[enc]:12,} {len(html):12,} {'3 / 1':>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Cold-start cost of aws_app.
+
+    python benchmarks/bench_aws_startup.py [--runs 5]
+
+Each run is a fresh interpreter that imports aws_app, serves one static
+page and then touches DynamoDB and SNS for the first time (building the
+clients, no network call). Reports the median of each step in ms.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, time
+t0 = time.perf_counter()
+import aws_app
+t1 = time.perf_counter()
+aws_app.app.test_client().get("/about")
+t2 = time.perf_counter()
+aws_app.users_table.name
+aws_app.sns.meta
+t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "first_request": t2 - t1, "first_aws_use": t3 - t2}))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    # Credentials are only needed to build clients, never to call AWS here.
+    env.setdefault("AWS_ACCESS_KEY_ID", "bench")
+    env.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+
+    samples = []
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+            capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(out.strip().splitlines()[-1]))
+
+    for step in ("import", "first_request", "first_aws_use"):
+        median = statistics.median(s[step] for s in samples) * 1000
+        print(f"{step:>14}: {median:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
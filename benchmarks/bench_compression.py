@@ -0,0 +1,69 @@
+"""Bytes saved and CPU spent by CompressionMiddleware.
+
+    python benchmarks/bench_compression.py [--users 500] [--requests 200]
+
+Fetches a few heavy pages (the admin user list, a resume analysis, the
+NDJSON user export of the in-memory store) with each available encoding
+and reports body size and the middleware's CPU time per response.
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESUME = ("Education: B.Tech computer science. Skills: python, pandas, numpy, sql, "
+          "machine learning. Projects: sales dashboard. Experience: data internship. ") * 20
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    import app
+    import compressor
+    from flask import Response
+
+    flask_app = app.create_app({"STORAGE_BACKEND": "memory", "JINJA_CACHE_DIR": ""})
+    store = flask_app.extensions["storage"]
+    for i in range(args.users):
+        store.create_user(f"user{i:05d}", f"user{i:05d}@example.com", "pw")
+    store.create_admin("bench", "bench@example.com", "pw")
+
+    @flask_app.route("/bench/export")
+    def export():
+        def rows():
+            for user in store.list_users(limit=args.users).items:
+                yield json.dumps(user) + "\n"
+        return Response(rows(), mimetype="application/x-ndjson")
+
+    client = flask_app.test_client()
+    client.post("/admin/login", data={"email": "bench@example.com", "password": "pw"})
+    middleware = flask_app.extensions["compression"]
+
+    pages = [
+        ("admin users", "get", "/admin/users", {}),
+        ("resume analysis", "post", "/resume", {"data": {"role": "data scientist", "resume_text": RESUME}}),
+        ("ndjson stream", "get", "/bench/export", {}),
+    ]
+    print(f"{'page':>16} {'encoding':>9} {'bytes':>9} {'ratio':>7} {'cpu us':>8}")
+    for label, method, path, kwargs in pages:
+        identity = len(getattr(client, method)(path, **kwargs).data)
+        print(f"{label:>16} {'identity':>9} {identity:9,} {'':>7} {'':>8}")
+        for encoding in middleware.encodings:
+            headers = {"Accept-Encoding": encoding}
+            before = middleware.stats()["encodings"][encoding]
+            size = 0
+            for _ in range(args.requests):
+                size = len(getattr(client, method)(path, headers=headers, **kwargs).data)
+            after = middleware.stats()["encodings"][encoding]
+            cpu = (after["cpu_seconds"] - before["cpu_seconds"]) / args.requests * 1e6
+            print(f"{label:>16} {encoding:>9} {size:9,} {size / identity:7.3f} {cpu:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Goal resolution latency against a large synthetic catalog.
+
+    python benchmarks/bench_goal_resolver.py            # 50k roles
+    python benchmarks/bench_goal_resolver.py --roles 200000
+
+Roles are built from a shared vocabulary ("senior cloud data engineer"),
+so trigram posting lists are realistically skewed. Queries mix exact
+names, names with a typo, longer free-text goals and unknown goals; all
+are timed with the LRU cache disabled, then once more through the cache.
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import Catalog  # noqa: E402
+from goal_resolver import GoalResolver  # noqa: E402
+
+LEVELS = ["junior", "senior", "lead", "principal", "staff", "associate", ""]
+TITLES = ["engineer", "developer", "analyst", "designer", "scientist", "manager",
+          "architect", "consultant", "specialist", "administrator"]
+
+
+def pseudo_word(rng):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+
+
+def build_catalog(rng, n):
+    domains = [pseudo_word(rng) for _ in range(max(50, n // 20))]
+    roles = set()
+    while len(roles) < n:
+        parts = [rng.choice(LEVELS), rng.choice(domains), rng.choice(domains), rng.choice(TITLES)]
+        roles.add(" ".join(p for p in parts if p))
+    roles = sorted(roles)
+    data = {
+        "roadmaps": {role: ["step"] for role in roles},
+        "default_roadmap": ["step"],
+        "skill_maps": {},
+        "recommendations": {},
+        "tips": [],
+    }
+    return Catalog(data), roles
+
+
+def typo(rng, text):
+    i = rng.randrange(len(text))
+    return text[:i] + text[i + 1:]
+
+
+def queries(rng, roles, n):
+    out = []
+    for i in range(n):
+        role = rng.choice(roles)
+        kind = i % 4
+        if kind == 0:
+            out.append(role)
+        elif kind == 1:
+            out.append(typo(rng, role))
+        elif kind == 2:
+            out.append(f"i want to become a {role} next year")
+        else:
+            out.append(f"{pseudo_word(rng)} {pseudo_word(rng)}")
+    return out
+
+
+def time_each(fn, items):
+    samples = []
+    for item in items:
+        started = time.perf_counter()
+        fn(item)
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return {
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--roles", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=4_000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    catalog, roles = build_catalog(rng, args.roles)
+
+    started = time.perf_counter()
+    uncached = GoalResolver(catalog, cache_size=0)
+    print(f"indexed {len(roles)} roles in {time.perf_counter() - started:.2f} s")
+
+    goals = queries(rng, roles, args.queries)
+    resolved = sum(uncached.resolve(g) is not None for g in goals)
+    print(f"resolved {resolved}/{len(goals)} goals\n")
+
+    stats = time_each(uncached.resolve, goals)
+    print("uncached  " + "  ".join(f"{k}={v:8.1f}" for k, v in stats.items()))
+
+    cached = GoalResolver(catalog)
+    for g in goals:
+        cached.resolve(g)
+    stats = time_each(cached.resolve, goals)
+    print("cached    " + "  ".join(f"{k}={v:8.1f}" for k, v in stats.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Chatbot intent engine throughput.
+
+    python benchmarks/bench_intents.py
+    python benchmarks/bench_intents.py --intents 500 --messages 200000
+
+Builds a synthetic set of intents (a few keywords each, random
+priorities) and replays a Zipf-skewed message stream, first with the
+reply cache disabled and then with it on. The target is 10k msgs/sec.
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from intents import IntentEngine  # noqa: E402
+
+TARGET = 10_000
+
+
+def word(rng):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+
+
+def build_intents(rng, n):
+    return [
+        {
+            "name": f"intent{i}",
+            "keywords": [word(rng) for _ in range(rng.randint(2, 6))],
+            "priority": rng.randint(0, 100),
+            "reply": f"reply {i}",
+        }
+        for i in range(n)
+    ]
+
+
+def build_messages(rng, intents, distinct, total):
+    keywords = [k for intent in intents for k in intent["keywords"]]
+    pool = []
+    for _ in range(distinct):
+        words = [word(rng) for _ in range(rng.randint(3, 15))]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords))
+        pool.append(" ".join(words))
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return rng.choices(pool, weights=weights, k=total)
+
+
+def throughput(engine_reply, messages):
+    started = time.perf_counter()
+    for msg in messages:
+        engine_reply(msg)
+    return len(messages) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--intents", type=int, default=300)
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=5_000)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    intents = build_intents(rng, args.intents)
+    messages = build_messages(rng, intents, args.distinct, args.messages)
+    print(f"{len(intents)} intents, {sum(len(i['keywords']) for i in intents)} keywords, "
+          f"{len(messages)} messages ({args.distinct} distinct)\n")
+
+    for label, cache_size in (("uncached", 0), ("cached", 10_000)):
+        engine = IntentEngine(intents, "fallback", cache_size=cache_size)
+        rate = throughput(engine.reply, messages)
+        verdict = "ok" if rate >= TARGET else "BELOW TARGET"
+        print(f"{label:>9}: {rate:>10,.0f} msgs/sec  [{verdict}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Resume keyword matching: one substring scan per keyword vs KeywordMatcher.
+
+    python benchmarks/bench_matcher.py
+    python benchmarks/bench_matcher.py --terms 10000 --sizes 1024 1048576
+
+The vocabulary mixes one- and two-word terms; resumes are random words
+with vocabulary terms sprinkled in, from 1 KB to 1 MB.
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matcher import KeywordMatcher  # noqa: E402
+
+SIZES = (1024, 16 * 1024, 256 * 1024, 1024 * 1024)
+
+
+def word(rng):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+
+
+def vocabulary(rng, n):
+    terms = set()
+    while len(terms) < n:
+        terms.add(word(rng) if rng.random() < 0.7 else f"{word(rng)} {word(rng)}")
+    return sorted(terms)
+
+
+def resume(rng, vocab, size):
+    parts, total = [], 0
+    while total < size:
+        piece = rng.choice(vocab) if rng.random() < 0.05 else word(rng)
+        parts.append(piece)
+        total += len(piece) + 1
+    return " ".join(parts)[:size]
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--terms", type=int, default=10_000)
+    parser.add_argument("--sizes", type=int, nargs="*", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    vocab = vocabulary(rng, args.terms)
+
+    started = time.perf_counter()
+    matcher = KeywordMatcher(vocab)
+    print(f"compiled {len(matcher)} terms in {(time.perf_counter() - started) * 1000:.1f} ms\n")
+
+    print(f"{'resume':>10}  {'substring ms':>13}  {'matcher ms':>11}  {'speedup':>8}")
+    for size in args.sizes:
+        text = resume(rng, vocab, size)
+
+        def naive():
+            lowered = text.lower()
+            return {k for k in vocab if k in lowered}
+
+        naive_s = best_of(naive, args.repeat)
+        matcher_s = best_of(lambda: matcher.found(text), args.repeat)
+        print(f"{size:>10}  {naive_s * 1000:>13.2f}  {matcher_s * 1000:>11.2f}  {naive_s / matcher_s:>7.1f}x",
+              flush=True)
+
+
+if __name__ == "__main__":
+    main()
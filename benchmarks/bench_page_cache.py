@@ -0,0 +1,108 @@
+"""Cost of serving the cached pages, and of compiling templates cold.
+
+    python benchmarks/bench_page_cache.py [--requests 2000]
+
+pages     per-request time for /about, / and /projects rendered through
+          render_template, served from the page cache, and answered 304
+          to a matching If-None-Match.
+compile   time for a fresh interpreter to load every template, without
+          and then with a warm Jinja bytecode cache directory.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Cached path -> template rendered by the uncached twin route.
+PATHS = {"/about": "about", "/": "index", "/projects": "projects"}
+
+COMPILE_PROBE = """
+import json, time, app
+flask_app = app.create_app()
+t0 = time.perf_counter()
+for name in flask_app.jinja_env.list_templates(extensions=("html",)):
+    flask_app.jinja_env.get_template(name)
+print(json.dumps(time.perf_counter() - t0))
+"""
+
+
+def timed(flask_app, path, n, headers=None):
+    # Straight WSGI calls on a prepared environ; the test client's own
+    # overhead would otherwise dwarf the difference being measured.
+    from werkzeug.test import EnvironBuilder
+
+    environ = EnvironBuilder(path=path, headers=headers).get_environ()
+    start_response = lambda status, headers, exc_info=None: None
+    best = None
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(n):
+            b"".join(flask_app(dict(environ), start_response))
+        elapsed = (time.perf_counter() - started) / n * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def pages(n):
+    import app
+    from flask import render_template
+
+    from blueprints.main import CAREER_PATHS
+
+    flask_app = app.create_app({"STORAGE_BACKEND": "memory", "JINJA_CACHE_DIR": ""})
+    client = flask_app.test_client()
+
+    @flask_app.route("/bench/uncached/<name>")
+    def uncached(name):
+        if name == "projects":
+            return render_template("projects_list.html", projects=CAREER_PATHS)
+        return render_template(f"{name}.html")
+
+    @flask_app.route("/bench/empty")
+    def empty():
+        return ""
+
+    floor = timed(flask_app, "/bench/empty", n)
+    print(f"empty Flask response: {floor:.1f} us (included in every figure below)")
+    print(f"{'page':>10} {'render us':>10} {'cached us':>10} {'304 us':>10}")
+    for path, name in PATHS.items():
+        assert client.get("/bench/uncached/" + name).status_code == 200
+        client.get(path)
+        etag = client.get(path).headers["ETag"]
+        render = timed(flask_app, "/bench/uncached/" + name, n)
+        cached = timed(flask_app, path, n)
+        revalidated = timed(flask_app, path, n, {"If-None-Match": etag})
+        print(f"{path:>10} {render:10.1f} {cached:10.1f} {revalidated:10.1f}")
+
+
+def compile_times():
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, STORAGE_BACKEND="memory")
+        results = {}
+        for label, cache_dir in (("no bytecode cache", ""), ("cold bytecode cache", tmp),
+                                 ("warm bytecode cache", tmp)):
+            out = subprocess.run(
+                [sys.executable, "-c", COMPILE_PROBE], cwd=ROOT,
+                env=dict(env, JINJA_CACHE_DIR=cache_dir), capture_output=True, text=True, check=True
+            ).stdout
+            results[label] = json.loads(out.strip().splitlines()[-1]) * 1000
+    for label, ms in results.items():
+        print(f"{label:>20}: {ms:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    pages(args.requests)
+    compile_times()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Profile lookup latency as the profiles table grows.
+
+    python benchmarks/bench_profiles.py            # 1k .. 1M rows
+    python benchmarks/bench_profiles.py --legacy   # also time the old unkeyed table
+
+Each size gets a fresh temporary database built by the real migrations,
+then times the exact statements /profile and /roadmap run.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import migrations  # noqa: E402
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+LOOKUPS = 20_000
+
+LEGACY_DDL = """
+CREATE TABLE profiles (
+    user_id INTEGER, career_goal TEXT, current_level TEXT,
+    interests TEXT, time_per_week INTEGER
+)
+"""
+
+
+def fill(conn, n):
+    rows = (
+        (i, "data scientist", "Beginner", "python, ml", 5)
+        for i in range(1, n + 1)
+    )
+    conn.executemany("INSERT INTO profiles VALUES (?, ?, ?, ?, ?)", rows)
+    conn.commit()
+
+
+def time_lookups(conn, n, lookups):
+    ids = [random.randint(1, n) for _ in range(lookups)]
+    cur = conn.cursor()
+    started = time.perf_counter()
+    for user_id in ids:
+        cur.execute("SELECT * FROM profiles WHERE user_id=?", (user_id,)).fetchone()
+        cur.execute("SELECT career_goal FROM profiles WHERE user_id=?", (user_id,)).fetchone()
+    elapsed = time.perf_counter() - started
+    return elapsed / (lookups * 2) * 1e6
+
+
+def run(size, legacy):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "bench.db"))
+        if legacy:
+            conn.execute(LEGACY_DDL)
+        else:
+            migrations.migrate(conn)
+        fill(conn, size)
+        # The legacy table scans every row per lookup; keep its run short.
+        lookups = LOOKUPS if not legacy else max(20, LOOKUPS * 1_000 // size)
+        per_lookup = time_lookups(conn, size, lookups)
+        conn.close()
+    return per_lookup
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--legacy", action="store_true")
+    parser.add_argument("--sizes", type=int, nargs="*", default=SIZES)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}  {'keyed us/lookup':>16}" + (f"  {'legacy us/lookup':>17}" if args.legacy else ""))
+    for size in args.sizes:
+        line = f"{size:>10}  {run(size, False):>16.2f}"
+        if args.legacy:
+            line += f"  {run(size, True):>17.2f}"
+        print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Cookie size and per-request cost of each session backend.
+
+    python benchmarks/bench_sessions.py [--requests 2000] [--history 0]
+
+For Flask's signed cookie and the memory and sqlite stores, logs a user in
+(with ``--history`` extra quiz results in the session, to show how the
+cookie grows) and times, per request,
+
+read       a route that reads the session (/bench/read)
+write      a route that modifies it (/bench/write)
+untouched  a route that never looks at it (/bench/untouched)
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+BACKENDS = ("cookie", "memory", "sqlite")
+ROUTES = ("read", "write", "untouched")
+
+
+def timed(flask_app, path, n, cookie):
+    from werkzeug.test import EnvironBuilder
+
+    environ = EnvironBuilder(path=path, headers={"Cookie": f"session={cookie}"}).get_environ()
+    start_response = lambda status, headers, exc_info=None: None
+    best = None
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(n):
+            b"".join(flask_app(dict(environ), start_response))
+        elapsed = (time.perf_counter() - started) / n * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench(backend, db_path, n, history):
+    import app
+    from flask import session
+
+    flask_app = app.create_app({
+        "STORAGE_BACKEND": "memory", "SESSION_BACKEND": backend,
+        "DB_NAME": db_path, "JINJA_CACHE_DIR": "",
+    })
+
+    @flask_app.route("/bench/login")
+    def login():
+        session["user_id"] = 1
+        session["username"] = "bench-user"
+        session["quiz_result"] = "Data Scientist"
+        session["quiz_history"] = [
+            {"career": "Data Scientist", "score": 0.75, "answers": ["python", "statistics", "sql"]}
+        ] * history
+        return ""
+
+    @flask_app.route("/bench/read")
+    def read():
+        return session.get("username", "")
+
+    @flask_app.route("/bench/write")
+    def write():
+        session["visits"] = session.get("visits", 0) + 1
+        return ""
+
+    @flask_app.route("/bench/untouched")
+    def untouched():
+        return ""
+
+    client = flask_app.test_client()
+    client.get("/bench/login")
+    cookie = client.get_cookie("session").value
+    times = [timed(flask_app, "/bench/" + route, n, cookie) for route in ROUTES]
+    return len(cookie), times
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--history", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'backend':>8} {'cookie B':>9} " + " ".join(f"{r + ' us':>12}" for r in ROUTES))
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in BACKENDS:
+            size, times = bench(backend, os.path.join(tmp, "career.db"), args.requests, args.history)
+            print(f"{backend:>8} {size:9d} " + " ".join(f"{t:12.1f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
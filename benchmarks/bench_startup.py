@@ -0,0 +1,117 @@
+"""Worker boot cost of app.py, with and without a preloading master.
+
+    python benchmarks/bench_startup.py [--runs 5] [--workers 4]
+
+cold     a fresh interpreter per run imports app, calls create_app()
+         (migrating a scratch database) and serves the first requests --
+         what every worker pays when gunicorn runs without preload_app.
+preload  one master imports app, builds it with WARM_ON_START=1 and
+         forks ``--workers`` children, like gunicorn with preload_app;
+         each child only serves its first requests.
+
+Reports the median of each step in ms. The preload mode needs os.fork.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# A landing page plus views that need the catalog, the quiz and the chatbot.
+FIRST_REQUESTS = (
+    ("get", "/about", None),
+    ("get", "/career-quiz", None),
+    ("post", "/chat", {"message": "how do I learn python?"}),
+)
+
+COLD_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import app
+t1 = time.perf_counter()
+flask_app = app.create_app()
+t2 = time.perf_counter()
+client = flask_app.test_client()
+for method, path, body in json.loads(sys.argv[1]):
+    getattr(client, method)(path, json=body)
+t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "create_app": t2 - t1, "first_requests": t3 - t2}))
+"""
+
+
+def first_requests(client):
+    for method, path, body in FIRST_REQUESTS:
+        res = getattr(client, method)(path, json=body)
+        assert res.status_code == 200, (path, res.status_code)
+
+
+def cold(runs, env):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", COLD_PROBE, json.dumps(FIRST_REQUESTS)],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(out.strip().splitlines()[-1]))
+    return samples
+
+
+def preload(workers, env):
+    os.environ.update(env)
+    started = time.perf_counter()
+    import app
+    flask_app = app.create_app({"WARM_ON_START": True})
+    master = time.perf_counter() - started
+
+    samples = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            t0 = time.perf_counter()
+            first_requests(flask_app.test_client())
+            t1 = time.perf_counter()
+            os.write(write_fd, json.dumps({"first_requests": t1 - t0}).encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as fh:
+            samples.append(json.loads(fh.read()))
+        os.waitpid(pid, 0)
+    return master, samples
+
+
+def report(samples, steps):
+    for step in steps:
+        median = statistics.median(s[step] for s in samples) * 1000
+        print(f"  {step:>15}: {median:8.1f} ms")
+    total = statistics.median(sum(s[step] for step in steps) for s in samples) * 1000
+    print(f"  {'per worker':>15}: {total:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, CAREER_DB=os.path.join(tmp, "career.db"), STORAGE_BACKEND="sqlite")
+
+        print(f"cold ({args.runs} fresh interpreters)")
+        report(cold(args.runs, env), ("import", "create_app", "first_requests"))
+
+        if hasattr(os, "fork"):
+            master, samples = preload(args.workers, env)
+            print(f"preload ({args.workers} forked workers, master boot {master * 1000:.1f} ms once)")
+            report(samples, ("first_requests",))
+
+
+if __name__ == "__main__":
+    main()
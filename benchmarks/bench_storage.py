@@ -0,0 +1,132 @@
+"""Per-operation latency and throughput of each storage backend.
+
+    python benchmarks/bench_storage.py                      # memory + sqlite
+    python benchmarks/bench_storage.py --users 5000
+    python benchmarks/bench_storage.py --dynamodb-endpoint http://localhost:8000
+
+Every backend runs the same workload: sign up N users, log each one in,
+save and read back a profile per user, page through the user list,
+create and list projects and look users up in bulk. SQLite runs on a
+fresh temporary career.db with the app's pool and pragmas. DynamoDB only
+runs when an endpoint (e.g. DynamoDB Local) is given; its four tables
+are created there first.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db  # noqa: E402
+import migrations  # noqa: E402
+import storage  # noqa: E402
+
+
+def make_sqlite(tmp):
+    pool = db.ConnectionPool(os.path.join(tmp, "career.db"))
+    with pool.connection() as conn:
+        migrations.migrate(conn)
+    return storage.create_storage("sqlite", pool=pool)
+
+
+def make_dynamodb(endpoint, region):
+    import boto3
+
+    resource = boto3.resource("dynamodb", endpoint_url=endpoint, region_name=region)
+    keys = {"Users": "username", "Admins": "email", "Profiles": "user_id", "Projects": "id"}
+    tables = {}
+    for name, key in keys.items():
+        table = resource.Table(f"bench-{name}")
+        try:
+            table.delete()
+            table.wait_until_not_exists()
+        except resource.meta.client.exceptions.ResourceNotFoundException:
+            pass
+        table = resource.create_table(
+            TableName=f"bench-{name}",
+            KeySchema=[{"AttributeName": key, "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": key, "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        table.wait_until_exists()
+        tables[name.lower()] = table
+    return storage.DynamoStorage(tables)
+
+
+def timed(samples, fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    samples.append(time.perf_counter() - started)
+    return result
+
+
+def run_workload(store, n):
+    ops = {}
+
+    def op(name):
+        return ops.setdefault(name, [])
+
+    users = [f"bench{i:06d}" for i in range(n)]
+    for u in users:
+        timed(op("create_user"), store.create_user, u, f"{u}@example.com", "pw")
+
+    ids = {}
+    for u in users:
+        ids[u] = timed(op("check_user"), store.check_user, u, "pw")["id"]
+
+    profile = {"career_goal": "data scientist", "current_level": "Beginner",
+               "interests": "ml", "time_per_week": "5"}
+    for u in users:
+        timed(op("save_profile"), store.save_profile, ids[u], profile)
+    for u in users:
+        timed(op("get_profile"), store.get_profile, ids[u])
+
+    cursor, pages = None, 0
+    while True:
+        page = timed(op("list_users(25)"), store.list_users, 25, cursor)
+        pages += 1
+        cursor = page.cursor
+        if not cursor:
+            break
+
+    for i in range(max(1, n // 10)):
+        timed(op("create_project"), store.create_project, f"Project {i}", "desc")
+    timed(op("list_projects(25)"), store.list_projects, 25)
+
+    for i in range(0, n, 100):
+        timed(op("get_users(100)"), store.get_users, users[i:i + 100])
+    return ops
+
+
+def report(name, ops):
+    print(f"\n== {name} ==")
+    print(f"{'operation':>18} {'calls':>7} {'mean µs':>9} {'p99 µs':>9} {'ops/sec':>10}")
+    for op, samples in ops.items():
+        samples.sort()
+        mean = statistics.fmean(samples)
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        print(f"{op:>18} {len(samples):>7} {mean * 1e6:>9.1f} {p99 * 1e6:>9.1f} {1 / mean:>10,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--dynamodb-endpoint", default=None)
+    parser.add_argument("--region", default="us-east-1")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = [("memory", storage.MemoryStorage()), ("sqlite", make_sqlite(tmp))]
+        if args.dynamodb_endpoint:
+            backends.append(("dynamodb", make_dynamodb(args.dynamodb_endpoint, args.region)))
+
+        print(f"{args.users} users per backend")
+        for name, store in backends:
+            report(name, run_workload(store, args.users))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Blueprints of the career counselor app; ``create_app`` in app.py
+registers them all.
+
+Views fetch catalogs and engines through the cached ``get_*`` helpers
+when they first need them, and heavier modules (resume batch scoring,
+the SSE chat stream) are imported inside the views that use them, so
+importing a blueprint stays cheap.
+"""
+from blueprints.admin import bp as admin_bp
+from blueprints.assessment import bp as assessment_bp
+from blueprints.auth import bp as auth_bp
+from blueprints.chat import bp as chat_bp
+from blueprints.main import bp as main_bp
+from blueprints.resume import bp as resume_bp
+
+BLUEPRINTS = (main_bp, auth_bp, assessment_bp, resume_bp, chat_bp, admin_bp)
+
+
+def register_blueprints(app):
+    for blueprint in BLUEPRINTS:
+        app.register_blueprint(blueprint)
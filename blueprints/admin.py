@@ -0,0 +1,101 @@
+from flask import Blueprint, current_app, jsonify, redirect, render_template, request, session, url_for
+
+from page_cache import get_page_cache
+from storage import get_storage
+
+bp = Blueprint("admin", __name__)
+
+
+# ================= ADMIN AUTH =================
+
+@bp.route("/admin")
+def admin_home():
+    if "admin" not in session:
+        return redirect(url_for("admin.admin_login"))
+    return render_template("admin.html")
+
+@bp.route("/admin/login", methods=["GET", "POST"])
+def admin_login():
+    if request.method == "POST":
+        email = request.form["email"]
+        password = request.form["password"]
+
+        admin = get_storage().check_admin(email, password)
+
+        if admin:
+            session["admin"] = admin["email"]
+            return redirect(url_for("admin.admin_home"))
+
+        return "Invalid admin credentials"
+
+    return render_template("admin_login.html")
+
+
+@bp.route("/admin/signup", methods=["GET", "POST"])
+def admin_signup():
+    if request.method == "POST":
+        name = request.form["name"]
+        email = request.form["email"]
+        password = request.form["password"]
+
+        if not get_storage().create_admin(name, email, password):
+            return "Admin already exists"
+
+        return redirect(url_for("admin.admin_login"))
+
+    return render_template("admin_signup.html")
+
+@bp.route("/admin/dashboard")
+def admin_dashboard():
+    if "admin" not in session:
+        return redirect(url_for("admin.admin_login"))
+    return render_template("admin_dashboard.html")
+
+@bp.route("/admin/users")
+def admin_users():
+    if "admin" not in session:
+        return redirect(url_for("admin.admin_login"))
+
+    page = get_storage().list_users(cursor=request.args.get("cursor"))
+    return render_template("admin_users.html", users=page.items, next_cursor=page.cursor)
+
+@bp.route("/admin/db-stats")
+def admin_db_stats():
+    if "admin" not in session:
+        return redirect(url_for("admin.admin_login"))
+    return jsonify(get_storage().stats())
+
+@bp.route("/admin/cache-stats")
+def admin_cache_stats():
+    if "admin" not in session:
+        return redirect(url_for("admin.admin_login"))
+    stats = {"pages": get_page_cache().stats()}
+    if "sessions" in current_app.extensions:
+        stats["sessions"] = current_app.extensions["sessions"].stats()
+    return jsonify(stats)
+
+@bp.route("/admin/compression-stats")
+def admin_compression_stats():
+    if "admin" not in session:
+        return redirect(url_for("admin.admin_login"))
+    return jsonify(current_app.extensions["compression"].stats())
+
+@bp.route("/admin/create-project", methods=["GET", "POST"])
+def admin_create_project():
+    if "admin" not in session:
+        return redirect(url_for("admin.admin_login"))
+
+    if request.method == "POST":
+        title = request.form["title"]
+        description = request.form["description"]
+
+        get_storage().create_project(title, description)
+
+        return redirect(url_for("admin.admin_dashboard"))
+
+    return render_template("admin_create_project.html")
+
+@bp.route("/admin/logout")
+def admin_logout():
+    session.pop("admin", None)
+    return redirect(url_for("admin.admin_login"))
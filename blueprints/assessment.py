@@ -0,0 +1,138 @@
+import click
+from flask import Blueprint, redirect, render_template, request, session, url_for
+
+import cohort
+from assessment import get_confidence_scorer, get_quiz_engine
+from catalog import get_catalog
+from goal_resolver import get_resolver
+from skill_matrix import get_skill_matrix
+from storage import PROFILE_FIELDS, get_storage
+
+bp = Blueprint("assessment", __name__, cli_group=None)
+
+
+# ================= PROFILE & ROADMAP ================= #
+
+def generate_roadmap(goal):
+    # Exact role/synonym match first, then typo-tolerant fuzzy match
+    return get_resolver().roadmap_for(goal)
+
+
+@bp.route("/profile", methods=["GET", "POST"])
+def profile():
+    if "user_id" not in session:
+        return redirect(url_for("auth.login"))
+
+    if request.method == "POST":
+        get_storage().save_profile(session["user_id"], {
+            field: request.form[field] for field in PROFILE_FIELDS
+        })
+        return redirect(url_for("assessment.roadmap"))
+
+    profile = get_storage().get_profile(session["user_id"])
+
+    return render_template("profile.html", profile=profile)
+
+
+@bp.route("/roadmap")
+def roadmap():
+    if "user_id" not in session:
+        return redirect(url_for("auth.login"))
+
+    data = get_storage().get_profile(session["user_id"])
+
+    steps = generate_roadmap(data["career_goal"]) if data else []
+    return render_template("roadmap.html", steps=steps)
+
+
+@bp.route("/skill-gap", methods=["GET", "POST"])
+def skill_gap():
+    if "user_id" not in session:
+        return redirect(url_for("auth.login"))
+
+    if request.method == "POST":
+        role = request.form["role"]
+        known_skills = request.form.getlist("skills")
+        matrix = get_skill_matrix()
+
+        missing_skills = matrix.missing(role, known_skills)
+
+        return render_template(
+            "skill_gap_result.html",
+            role=role,
+            known=known_skills,
+            missing=missing_skills,
+            closest=matrix.closest_roles(known_skills, limit=3)
+        )
+
+    return render_template("skill_gap.html", skill_map=get_catalog().skill_maps)
+
+
+# ================= CAREER QUIZ ================= #
+
+@bp.route("/career-quiz", methods=["GET", "POST"])
+def career_quiz_page():
+    quiz = get_quiz_engine()
+
+    if request.method == "POST":
+        top_careers = quiz.top_careers(request.form.lists(), k=3)
+
+        return render_template(
+            "quiz_result.html",
+            careers=[quiz.names[c] for c in top_careers],
+            insight=quiz.insights[top_careers[0]]
+        )
+
+    return render_template("career_quiz.html", quiz=quiz.quiz)
+
+
+# ================= INTERSHIP & PROJECTS RECOMMENDATION ================= #
+
+@bp.route("/recommendations")
+def recommendations():
+    # For now, assume quiz result is stored in session
+    career = session.get("quiz_result", "Data Analyst")
+
+    data = get_catalog().recommendations.get(career)
+
+    return render_template(
+        "recommendations.html",
+        career=career,
+        internships=data["internships"],
+        projects=data["projects"]
+    )
+
+
+@bp.route("/skill-confidence", methods=["GET", "POST"])
+def skill_confidence():
+    confidence = get_confidence_scorer()
+
+    if request.method == "POST":
+        results = confidence.score(request.form)
+        return render_template("skill_confidence_result.html", results=results)
+
+    return render_template("skill_confidence.html", skills=confidence.skills)
+
+
+@bp.cli.command("score-cohort")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--assessment", type=click.Choice(["quiz", "confidence", "both"]), default="both")
+@click.option("--format", "fmt", type=click.Choice(["csv", "ndjson"]), default=None,
+              help="Input format (default: from the file extension).")
+@click.option("--output", "-o", default="-", help="Output file; .csv writes CSV, anything else NDJSON.")
+@click.option("--batch-size", type=int, default=cohort.DEFAULT_BATCH_SIZE)
+def score_cohort_command(path, assessment, fmt, output, batch_size):
+    """Score quiz and skill-confidence answers for a whole cohort file."""
+    fmt = fmt or ("csv" if path.lower().endswith(".csv") else "ndjson")
+    quiz = get_quiz_engine() if assessment in ("quiz", "both") else None
+    confidence = get_confidence_scorer() if assessment in ("confidence", "both") else None
+
+    with open(path, newline="", encoding="utf-8") as fh, \
+            click.open_file(output, "w", encoding="utf-8") as out:
+        writer = cohort.CsvWriter(out) if output.lower().endswith(".csv") else cohort.NdjsonWriter(out)
+        stats = cohort.run(cohort.read_rows(fh, fmt), writer, quiz, confidence, batch_size)
+
+    click.echo(
+        f"scored {stats['rows']} rows in {stats['seconds']}s ({stats['rows_per_sec']} rows/sec)",
+        err=True
+    )
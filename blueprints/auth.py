@@ -0,0 +1,51 @@
+from flask import Blueprint, redirect, render_template, request, session, url_for
+
+from storage import get_storage
+
+bp = Blueprint("auth", __name__)
+
+
+@bp.route("/signup", methods=["GET", "POST"])
+def signup():
+    if "user_id" in session:
+        return redirect(url_for("main.home"))
+
+    if request.method == "POST":
+        username = request.form["username"]
+        email = request.form["email"]
+        password = request.form["password"]
+
+        if not get_storage().create_user(username, email, password):
+            return "User already exists"
+
+        return redirect(url_for("auth.login"))
+
+    return render_template("signup.html")
+
+
+@bp.route("/login", methods=["GET", "POST"])
+def login():
+    # 🚫 Already logged in? straight to dashboard
+    if "user_id" in session:
+        return redirect(url_for("main.home"))
+
+    if request.method == "POST":
+        username = request.form["username"]
+        password = request.form["password"]
+
+        user = get_storage().check_user(username, password)
+
+        if user:
+            session["user_id"] = user["id"]
+            session["username"] = user["username"]
+            return redirect(url_for("main.home"))
+
+        return "Invalid credentials"
+
+    return render_template("login.html")
+
+
+@bp.route("/logout")
+def logout():
+    session.clear()
+    return redirect(url_for("main.index"))
@@ -0,0 +1,32 @@
+from flask import Blueprint, Response, jsonify, request
+
+from intents import get_intent_engine
+
+bp = Blueprint("chat", __name__)
+
+
+def chatbot_reply(msg):
+    return get_intent_engine().reply(msg)
+
+
+@bp.route("/chat", methods=["POST"])
+def chat():
+    msg = request.json.get("message")
+    reply = chatbot_reply(msg)
+    return jsonify({"reply": reply})
+
+
+# Same reply as /chat, streamed word by word as Server-Sent Events. The
+# asyncio version in chat_stream.py serves this path for many idle chats;
+# this route keeps the widget working on a plain WSGI deployment.
+@bp.route("/chat/stream", methods=["POST"])
+def chat_stream_sse():
+    # chat_stream builds its ASGI app on import; only load it when used.
+    import chat_stream
+
+    msg = (request.get_json(silent=True) or {}).get("message")
+    return Response(
+        chat_stream.sse_reply(chatbot_reply(msg)),
+        mimetype="text/event-stream",
+        headers=chat_stream.SSE_HEADERS
+    )
@@ -0,0 +1,55 @@
+from flask import Blueprint, redirect, render_template, session, url_for
+
+from page_cache import render_cached
+from tips import get_tip_schedule
+
+bp = Blueprint("main", __name__)
+
+CAREER_PATHS = (
+    {
+        "title": "Software Developer",
+        "problem_statement": "Build applications, websites, and systems"
+    },
+    {
+        "title": "Data Scientist",
+        "problem_statement": "Analyze data and build predictive models"
+    },
+    {
+        "title": "UI/UX Designer",
+        "problem_statement": "Design user-friendly digital experiences"
+    }
+)
+
+
+# 🔥 LANDING PAGE LOGIC (IMPORTANT)
+@bp.route("/")
+def index():
+    if "user_id" in session:
+        return redirect(url_for("main.home"))
+    return render_cached("index.html")
+
+
+@bp.route("/about")
+def about():
+    return render_cached("about.html")
+
+
+# 🎯 DASHBOARD (HOME)
+@bp.route("/home")
+def home():
+    if "user_id" not in session:
+        return redirect(url_for("auth.login"))
+    return render_template("home.html")
+
+
+@bp.route("/projects")
+def projects():
+    return render_cached("projects_list.html", lambda: {"projects": CAREER_PATHS})
+
+
+@bp.app_context_processor
+def inject_daily_tip():
+    # Same tip all day (per bucket), so pages showing it stay cacheable.
+    return {
+        "daily_tip": get_tip_schedule().tip(session.get("username"))
+    }
@@ -0,0 +1,128 @@
+import click
+from flask import Blueprint, Response, current_app, jsonify, render_template, request, session, stream_with_context
+
+import resume_ingest
+
+bp = Blueprint("resume", __name__, cli_group=None)
+
+# resume_scoring compiles its keyword matcher and resume_batch pulls in the
+# process pool machinery on import, so both are imported where first used.
+
+
+# ================= RESUME ANALYSIS ================= #
+
+def scan_resume_upload(stream, filename, content_type):
+    """Stream an uploaded resume through the matcher; (found, error) pair."""
+    from resume_scoring import RESUME_MATCHER
+
+    try:
+        found = resume_ingest.scan_upload(
+            stream, RESUME_MATCHER, filename, content_type,
+            max_bytes=current_app.config["MAX_RESUME_BYTES"]
+        )
+    except resume_ingest.ResumeTooLarge as e:
+        return None, (str(e), 413)
+    except resume_ingest.UnsupportedResume as e:
+        return None, (str(e), 415)
+    return found, None
+
+
+@bp.route("/resume", methods=["GET", "POST"])
+def resume():
+    from resume_scoring import score_found, score_resume
+
+    analysis = None
+
+    if request.method == "POST":
+        # Reject oversized bodies before the form parser touches them.
+        if (request.content_length or 0) > current_app.config["MAX_RESUME_BYTES"] + 64 * 1024:
+            return "Resume is too large", 413
+
+        target_role = request.form.get("role", "")
+        upload = request.files.get("resume_file")
+
+        if upload and upload.filename:
+            found, error = scan_resume_upload(upload.stream, upload.filename, upload.mimetype)
+            if error:
+                return error
+            analysis = score_found(found, target_role)
+        else:
+            resume_text = request.form.get("resume_text", "")
+            analysis = score_resume(resume_text, target_role)
+
+    return render_template("resume.html", analysis=analysis)
+
+
+@bp.route("/api/resume/upload", methods=["POST"])
+def resume_upload_api():
+    """Score a raw .txt/.docx/.pdf request body without buffering it."""
+    from resume_scoring import score_found
+
+    filename = request.args.get("filename", "")
+    found, error = scan_resume_upload(request.stream, filename, request.mimetype)
+    if error:
+        message, status = error
+        return jsonify({"error": message}), status
+    return jsonify(score_found(found, request.args.get("role", "")))
+
+
+@bp.route("/api/resume/batch", methods=["POST"])
+def resume_batch_api():
+    """Score many resumes: NDJSON body, or an NDJSON/zip upload in ``file``."""
+    import resume_batch
+
+    if "admin" not in session:
+        return jsonify({"error": "admin login required"}), 401
+
+    role = request.args.get("role", "")
+    workers = request.args.get("workers", type=int)
+    if workers is not None and workers < 1:
+        return jsonify({"error": "workers must be at least 1"}), 400
+
+    if not resume_batch.try_acquire_slot():
+        return jsonify({"error": "too many batches running, retry later"}), 429
+    try:
+        upload = request.files.get("file")
+        if upload:
+            docs = resume_batch.read_documents(upload.stream, upload.filename or "", role)
+        else:
+            docs = resume_batch.read_ndjson(request.stream, role)
+
+        results = resume_batch.score_batch(docs, workers=workers, pool=resume_batch.get_pool())
+        response = Response(
+            stream_with_context(resume_batch.to_ndjson(results)),
+            mimetype="application/x-ndjson"
+        )
+    except resume_batch.BatchRejected as e:
+        resume_batch.release_slot()
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        resume_batch.release_slot()
+        raise
+    # Held until the stream is finished or the client goes away.
+    response.call_on_close(resume_batch.release_slot)
+    return response
+
+
+@bp.cli.command("score-resumes")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--role", default="", help="Target role for documents that do not name one.")
+@click.option("--workers", type=click.IntRange(0), default=None,
+              help="Worker processes (0 = in-process).")
+@click.option("--chunk-size", type=click.IntRange(1), default=None,
+              help="Documents per worker task (default 64).")
+@click.option("--output", "-o", type=click.File("w"), default="-")
+def score_resumes_command(path, role, workers, chunk_size, output):
+    """Score an NDJSON file or a zip of .txt resumes, writing NDJSON."""
+    import resume_batch
+
+    with open(path, "rb") as fh:
+        try:
+            docs = resume_batch.read_documents(fh, path, role)
+        except resume_batch.BatchRejected as e:
+            raise click.ClickException(str(e))
+        results = resume_batch.score_batch(
+            docs, workers=workers, chunk_size=chunk_size or resume_batch.DEFAULT_CHUNK_SIZE
+        )
+        for line in resume_batch.to_ndjson(results):
+            output.write(line)
@@ -0,0 +1,96 @@
+"""Bulk import of users and profiles into DynamoDB.
+
+Input is CSV (header row) or NDJSON, read one row at a time and handed to
+``dynamo_access.batch_write`` as a stream, so a 20k-student file never
+sits in memory whole. NDJSON numbers become ``Decimal`` (DynamoDB rejects
+floats) and empty CSV cells are dropped rather than stored as "".
+
+``BatchWriteItem`` puts cannot carry a condition, so targets in
+``KEEP_EXISTING`` are checked first: each chunk of rows is looked up with
+``batch_get`` and rows whose key already exists are left out and counted,
+instead of replacing that account (password included) the way
+``create_user``'s ``attribute_not_exists`` guard forbids. A signup that
+lands between the check and the write can still be overwritten.
+"""
+import csv
+import io
+import json
+from decimal import Decimal
+from itertools import islice
+
+import dynamo_access
+
+# target -> key attribute every row must carry
+TARGETS = {
+    "users": "username",
+    "profiles": "user_id",
+}
+
+# targets whose existing items an import must never replace
+KEEP_EXISTING = {"users"}
+
+# rows checked per BatchGetItem call (the API limit)
+LOOKUP_CHUNK = 100
+
+
+def read_items(fh, fmt):
+    if fmt == "csv":
+        for row in csv.DictReader(fh):
+            yield {k: v for k, v in row.items() if k and v not in (None, "")}
+    else:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line, parse_float=Decimal)
+
+
+def text_stream(binary, encoding="utf-8"):
+    """Text view of an uploaded file's binary stream."""
+    return io.TextIOWrapper(binary, encoding=encoding, newline="")
+
+
+def guess_format(filename):
+    return "csv" if (filename or "").lower().endswith(".csv") else "ndjson"
+
+
+def import_items(table, rows, key, workers=4, keep_existing=False):
+    """Write every row that has ``key``; rows without it are skipped.
+
+    With ``keep_existing`` rows whose key is already in ``table`` are left
+    out too. Returns the ``batch_write`` stats plus ``skipped`` and
+    ``existing`` counts.
+    """
+    skipped = 0
+    existing = 0
+
+    def valid():
+        nonlocal skipped
+        for row in rows:
+            if row.get(key) in (None, ""):
+                skipped += 1
+                continue
+            yield row
+
+    def new_only(rows):
+        nonlocal existing
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, LOOKUP_CHUNK))
+            if not chunk:
+                return
+            found = {
+                item[key] for item in dynamo_access.batch_get(
+                    table, [{key: row[key]} for row in chunk], workers=1,
+                    ProjectionExpression="#k", ExpressionAttributeNames={"#k": key}
+                )
+            }
+            for row in chunk:
+                if row[key] in found:
+                    existing += 1
+                else:
+                    yield row
+
+    items = new_only(valid()) if keep_existing else valid()
+    stats = dynamo_access.batch_write(table, items, workers=workers, key_names=[key])
+    stats["skipped"] = skipped
+    stats["existing"] = existing
+    return stats
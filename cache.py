@@ -0,0 +1,243 @@
+"""Read-through caching for DynamoDB lookups.
+
+Each ``ReadThroughCache`` fronts one table. It has its own TTL and a
+bounded in-process LRU, and can optionally use a backend shared by every
+worker, such as Redis. A lookup goes through three layers in turn:
+
+1. the local LRU;
+2. the shared backend, if one is configured;
+3. the loader, which does the actual DynamoDB read.
+
+A result is stored in both tiers. Misses are cached too (the loader's
+None), so a user without a profile does not cost a read on every page.
+
+Write paths call ``invalidate(key)`` or ``invalidate_all()``. That clears
+the local tier and deletes the key from the shared backend. Other workers
+may still hold the old value in their own LRU. Two things bound that:
+
+* ``FileStamp`` files under ``stamp_dir`` (``CACHE_STAMP_DIR``): keys
+  hash into ``STAMP_BUCKETS`` buckets, each with its own stamp file at
+  ``<stamp_dir>/<cache name>/<bucket>``. ``invalidate(key)`` bumps only
+  the key's bucket (``invalidate_all()`` bumps them all), and a local
+  entry is only served while its bucket's stamp is the one it was loaded
+  under. That costs one ``stat()`` per lookup and gives read-your-writes
+  across the workers of one host, which is what a profile save followed
+  by its redirect needs, while a save only drops the other workers'
+  entries that share its bucket;
+* with a shared backend, local entries live at most
+  ``LOCAL_TTL_WITH_SHARED`` seconds, which bounds staleness on *other*
+  hosts. Without one, several hosts only converge when the TTL expires,
+  so multi-host deployments should set ``CACHE_REDIS_URL``.
+"""
+import os
+import pickle
+import tempfile
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+
+LOCAL_TTL_WITH_SHARED = 5.0
+STAMP_BUCKETS = 64
+
+MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize=1024, ttl=60.0, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires, value = entry
+            if expires <= self.clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires = self.clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class RedisBackend:
+    """Shared tier on Redis; values are pickled, keys are namespaced."""
+
+    def __init__(self, url, prefix="vcc:"):
+        import redis  # optional dependency, only needed when configured
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return MISSING if raw is None else pickle.loads(raw)
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=max(1, int(ttl)))
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def delete_prefix(self, prefix):
+        keys = list(self.client.scan_iter(match=self.prefix + prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+class FileStamp:
+    """A version every process on the host can read with one ``stat()``.
+
+    ``bump()`` replaces the file and moves its mtime strictly forward, so
+    the (inode, mtime) pair changes even if the inode is reused or the
+    clock has not ticked since the last bump.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def read(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns
+
+    def bump(self):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".")
+        with os.fdopen(fd, "w") as fh:
+            fh.write(uuid.uuid4().hex)
+        previous = self.read()
+        mtime = time.time_ns()
+        if previous is not None and mtime <= previous[1]:
+            mtime = previous[1] + 1000
+        os.utime(tmp, ns=(mtime, mtime))
+        os.replace(tmp, self.path)
+
+
+class ReadThroughCache:
+    """``stamp_dir`` is an optional directory shared by every worker for
+    the invalidation stamps; see the module docstring."""
+
+    def __init__(self, name, ttl, maxsize=1024, backend=None, stamp_dir=None,
+                 buckets=STAMP_BUCKETS):
+        self.name = name
+        self.ttl = ttl
+        self.backend = backend
+        self.buckets = buckets
+        self.stamps = None
+        if stamp_dir:
+            self.stamps = [FileStamp(os.path.join(stamp_dir, name, str(i))) for i in range(buckets)]
+        local_ttl = min(ttl, LOCAL_TTL_WITH_SHARED) if backend else ttl
+        self.local = TTLCache(maxsize, local_ttl)
+        self.loads = 0
+        self.shared_hits = 0
+
+    def _stamp(self, key):
+        # crc32 rather than hash(): every worker must pick the same bucket.
+        return self.stamps[zlib.crc32(str(key).encode()) % self.buckets]
+
+    def _key(self, key):
+        return f"{self.name}:{key}"
+
+    def get(self, key, loader):
+        """Cached value for ``key``, calling ``loader()`` on a miss.
+
+        ``loader`` returns the value, or None when there is none; that
+        None is cached and returned like any other value.
+        """
+        # Read the stamp before loading: a write that lands meanwhile
+        # bumps it, so the entry stored below is already stale.
+        stamp = self._stamp(key).read() if self.stamps is not None else None
+        entry = self.local.get(key)
+        if entry is not MISSING and entry[0] == stamp:
+            return entry[1]
+
+        if self.backend is not None:
+            value = self.backend.get(self._key(key))
+            if value is not MISSING:
+                self.shared_hits += 1
+                self.local.set(key, (stamp, value))
+                return value
+
+        value = loader()
+        self.loads += 1
+        self.local.set(key, (stamp, value))
+        if self.backend is not None:
+            self.backend.set(self._key(key), value, self.ttl)
+        return value
+
+    def invalidate(self, key):
+        self.local.delete(key)
+        if self.backend is not None:
+            self.backend.delete(self._key(key))
+        if self.stamps is not None:
+            self._stamp(key).bump()
+
+    def invalidate_all(self):
+        self.local.clear()
+        if self.backend is not None:
+            self.backend.delete_prefix(self._key(""))
+        if self.stamps is not None:
+            for stamp in self.stamps:
+                stamp.bump()
+
+    def stats(self):
+        stats = self.local.stats()
+        stats.update(ttl=self.ttl, shared_hits=self.shared_hits, loads=self.loads)
+        return stats
+
+
+def shared_backend():
+    """Redis backend from ``CACHE_REDIS_URL``, or None for local-only caching."""
+    url = os.getenv("CACHE_REDIS_URL")
+    return RedisBackend(url) if url else None
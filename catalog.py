@@ -0,0 +1,90 @@
+"""Career catalog: roadmaps, skill maps, recommendations and tips.
+
+Loaded once from ``data/catalog.json`` into read-only structures (mapping
+proxies and tuples of interned strings) that every worker thread can share
+without copying. Free-text career goals are resolved to roles by
+``goal_resolver``, which builds its indexes on ``TokenIndex`` below.
+"""
+import json
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+from matcher import tokenize
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "catalog.json")
+CATALOG_PATH = os.getenv("CATALOG_PATH", DEFAULT_PATH)
+
+
+def freeze(value):
+    """Recursively turn JSON data into mapping proxies, tuples and interned strings."""
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+class TokenIndex:
+    """Find which of a set of names are fully contained in a query.
+
+    ``names`` is a sequence of ``(name, value)`` pairs. A name matches when
+    all of its words appear in the query; when several match, the earliest
+    pair wins. Each name is filed under its rarest token only: a query can
+    only match a name if it contains that token, and no posting list ends
+    up holding every "... developer" role.
+    """
+
+    def __init__(self, names):
+        entries = [(frozenset(tokenize(name)), value) for name, value in names]
+
+        frequency = {}
+        for tokens, _ in entries:
+            for tok in tokens:
+                frequency[tok] = frequency.get(tok, 0) + 1
+
+        index = {}
+        for order, (tokens, value) in enumerate(entries):
+            if tokens:
+                anchor = min(tokens, key=lambda t: (frequency[t], t))
+                index.setdefault(sys.intern(anchor), []).append((order, tokens, value))
+        self._index = MappingProxyType({tok: tuple(posts) for tok, posts in index.items()})
+
+    def lookup(self, tokens):
+        tokens = frozenset(tokens)
+        best = None
+        for tok in tokens:
+            for post in self._index.get(tok, ()):
+                if post[1] <= tokens and (best is None or post[0] < best[0]):
+                    best = post
+        return best[2] if best else None
+
+
+class Catalog:
+
+    def __init__(self, data):
+        self.roadmaps = freeze(data["roadmaps"])
+        self.default_roadmap = freeze(data["default_roadmap"])
+        self.synonyms = freeze(data.get("synonyms", {}))
+        self.skill_maps = freeze(data["skill_maps"])
+        self.recommendations = freeze(data["recommendations"])
+        self.tips = freeze(data["tips"])
+        self.careers = freeze(data.get("careers", {}))
+        self.quiz = freeze(data.get("quiz", []))
+        self.confidence = freeze(data.get("confidence", {}))
+        self.intents = freeze(data.get("intents", []))
+        self.fallback_reply = freeze(data.get("fallback_reply", ""))
+
+
+def load_catalog(path=CATALOG_PATH):
+    with open(path, encoding="utf-8") as fh:
+        return Catalog(json.load(fh))
+
+
+@lru_cache(maxsize=None)
+def get_catalog():
+    """The process-wide catalog, loaded on first use."""
+    return load_catalog()
@@ -0,0 +1,250 @@
+"""Streaming chatbot replies over Server-Sent Events.
+
+``POST /chat/stream`` takes the same body as ``/chat`` (``{"message": ...}``)
+and answers with an ``text/event-stream``: one ``data: {"token": ...}``
+event per word of the reply, then ``event: done`` carrying
+``{"reply": ...}`` -- the ``/chat`` response -- so a client that ignores
+the tokens still gets the full answer.
+
+Two ways to serve it:
+
+* ``ChatStream`` below is a plain ASGI application (no framework needed),
+  meant to run in its own asyncio process under uvicorn -- either
+  ``python chat_stream.py`` (binds ``CHAT_HOST``:``CHAT_PORT``, default
+  127.0.0.1:8001) or ``uvicorn chat_stream:app`` -- with the reverse proxy
+  sending ``/chat/stream`` there and everything else to the WSGI workers.
+  An idle chat is then a coroutine and a socket instead of a whole WSGI
+  worker.
+* both Flask apps also expose ``/chat/stream`` through ``sse_reply()`` so
+  the widget keeps working when only the WSGI app is deployed.
+
+Limits:
+
+* ``max_connections`` caps concurrent streams; extra ones get a 503 with
+  ``Retry-After`` and the widget falls back to plain ``/chat``;
+* ``max_workers`` caps how many replies are computed at once in the
+  thread pool, so a burst of chats cannot pile up threads;
+* tokens pass through a small bounded queue: when a client reads slowly
+  the producer waits instead of buffering the whole reply, and a client
+  that disconnects cancels its producer straight away;
+* while a reply is being computed the stream sends ``: ping`` comments
+  every ``heartbeat`` seconds so proxies do not drop the connection;
+* if computing the reply fails the stream ends with ``event: error`` and
+  the widget falls back to plain ``/chat``.
+"""
+import asyncio
+import json
+import os
+import re
+
+from intents import get_intent_engine
+
+MAX_CONNECTIONS = int(os.getenv("CHAT_MAX_CONNECTIONS", "10000"))
+MAX_WORKERS = int(os.getenv("CHAT_MAX_WORKERS", "32"))
+MAX_BODY_BYTES = 16 * 1024
+HEARTBEAT_SECONDS = 15.0
+QUEUE_SIZE = 16
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stop nginx from buffering the stream.
+    "X-Accel-Buffering": "no",
+}
+
+TOKEN_RE = re.compile(r"\S+\s*")
+
+
+# -------------------- SSE FORMAT --------------------
+
+def sse_event(data, event=None):
+    payload = f"data: {json.dumps(data)}\n\n"
+    if event:
+        payload = f"event: {event}\n" + payload
+    return payload.encode()
+
+
+def reply_tokens(reply):
+    """Split a reply into words, keeping the whitespace after each one."""
+    return TOKEN_RE.findall(reply or "")
+
+
+def sse_reply(reply):
+    """Synchronous event stream for one reply (used by the Flask routes)."""
+    for token in reply_tokens(reply):
+        yield sse_event({"token": token})
+    yield sse_event({"reply": reply}, "done")
+
+
+# -------------------- ASGI APP --------------------
+
+class ChatStream:
+
+    def __init__(self, reply, path="/chat/stream", max_connections=MAX_CONNECTIONS,
+                 max_workers=MAX_WORKERS, heartbeat=HEARTBEAT_SECONDS, token_delay=0.0):
+        self.reply = reply
+        self.path = path
+        self.max_connections = max_connections
+        self.heartbeat = heartbeat
+        self.token_delay = token_delay
+        self._max_workers = max_workers
+        self._workers = None  # created inside the running loop
+
+        self.active = 0
+        self.peak = 0
+        self.served = 0
+        self.rejected = 0
+        self.failed = 0
+
+    def stats(self):
+        return {
+            "active": self.active,
+            "peak": self.peak,
+            "served": self.served,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "max_connections": self.max_connections,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["path"] != self.path:
+            await self._respond(send, 404, b"Not found")
+            return
+        if scope["method"] != "POST":
+            await self._respond(send, 405, b"Method not allowed", [(b"allow", b"POST")])
+            return
+        if self.active >= self.max_connections:
+            self.rejected += 1
+            await self._respond(send, 503, b"Too many chats", [(b"retry-after", b"1")])
+            return
+
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await self._stream(receive, send)
+        finally:
+            self.active -= 1
+
+    async def _stream(self, receive, send):
+        body = await self._read_body(receive)
+        if body is None:
+            await self._respond(send, 413, b"Message too large")
+            return
+        try:
+            message = json.loads(body or b"{}").get("message")
+        except (ValueError, AttributeError):
+            await self._respond(send, 400, b"Invalid JSON")
+            return
+
+        if self._workers is None:
+            self._workers = asyncio.Semaphore(self._max_workers)
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/event-stream; charset=utf-8")]
+                       + [(k.lower().encode(), v.encode()) for k, v in SSE_HEADERS.items()],
+        })
+
+        queue = asyncio.Queue(QUEUE_SIZE)
+        producer = asyncio.create_task(self._produce(message, queue))
+        watcher = asyncio.create_task(self._wait_disconnect(receive))
+        waiting = {watcher, producer}
+        try:
+            while True:
+                get = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait(
+                    {get} | waiting, timeout=self.heartbeat, return_when=asyncio.FIRST_COMPLETED
+                )
+                if watcher in done:
+                    get.cancel()
+                    return
+                if producer in done:
+                    waiting.discard(producer)
+                    if producer.exception() is not None:
+                        get.cancel()
+                        self.failed += 1
+                        await send({"type": "http.response.body",
+                                    "body": sse_event({"error": "Reply failed"}, "error")})
+                        return
+                if get not in done:
+                    get.cancel()
+                    if not done:
+                        await send({"type": "http.response.body", "body": b": ping\n\n", "more_body": True})
+                    continue
+
+                item = get.result()
+                if isinstance(item, dict):
+                    await send({"type": "http.response.body", "body": sse_event(item, "done")})
+                    self.served += 1
+                    return
+                await send({"type": "http.response.body", "body": sse_event({"token": item}), "more_body": True})
+        finally:
+            producer.cancel()
+            watcher.cancel()
+
+    async def _produce(self, message, queue):
+        async with self._workers:
+            reply = await asyncio.get_running_loop().run_in_executor(None, self.reply, message)
+        for token in reply_tokens(reply):
+            # Blocks while the queue is full, i.e. while the client lags.
+            await queue.put(token)
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+        await queue.put({"reply": reply})
+
+    @staticmethod
+    async def _wait_disconnect(receive):
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    @staticmethod
+    async def _read_body(receive):
+        chunks = []
+        size = 0
+        while True:
+            event = await receive()
+            if event["type"] == "http.disconnect":
+                return b""
+            chunk = event.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                return None
+            chunks.append(chunk)
+            if not event.get("more_body"):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _respond(send, status, body, headers=()):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"text/plain; charset=utf-8")] + list(headers),
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _lifespan(receive, send):
+        while True:
+            event = await receive()
+            if event["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif event["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+# Same engine the Flask apps' chatbot_reply() wraps.
+app = ChatStream(get_intent_engine().reply)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host=os.getenv("CHAT_HOST", "127.0.0.1"),
+                port=int(os.getenv("CHAT_PORT", "8001")))
@@ -0,0 +1,119 @@
+"""Offline scoring of quiz and skill-confidence answers for whole cohorts.
+
+Rows are streamed from CSV or NDJSON, scored in fixed-size batches with
+the same engines the web forms use, and written out batch by batch, so
+memory stays flat however long the file is.
+
+Row layout (CSV header or NDJSON keys):
+
+* ``id`` -- optional, defaults to the row number;
+* ``q1``, ``q2``, ... (or ``q1[]`` ...) -- the career values ticked for
+  each quiz question; several values are separated by ``;`` in CSV and
+  may be a list in NDJSON;
+* one column per skill-confidence skill holding ``Beginner``,
+  ``Intermediate`` or ``Confident``.
+"""
+import csv
+import json
+import time
+from itertools import islice
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+# -------------------- INPUT --------------------
+
+def read_rows(fh, fmt):
+    if fmt == "csv":
+        return csv.DictReader(fh)
+    return (json.loads(line) for line in fh if line.strip())
+
+
+def _quiz_answers(row):
+    for key, value in row.items():
+        if not key or not key.startswith("q"):
+            continue
+        field = key if key.endswith("[]") else key + "[]"
+        if isinstance(value, str):
+            value = [v.strip() for v in value.split(";") if v.strip()]
+        elif value is None:
+            value = []
+        yield field, value
+
+
+# -------------------- SCORING --------------------
+
+def score_rows(rows, quiz=None, confidence=None, batch_size=DEFAULT_BATCH_SIZE, stats=None):
+    """Yield lists of result dicts, one list per batch of input rows."""
+    rows = iter(rows)
+    first_id = 1
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+
+        results = [{"id": row.get("id") or first_id + i} for i, row in enumerate(batch)]
+
+        if quiz is not None:
+            scored = quiz.score_batch([list(_quiz_answers(row)) for row in batch])
+            for result, (scores, top) in zip(results, scored):
+                result["careers"] = [quiz.names[c] for c in top]
+                result["scores"] = dict(zip(quiz.careers, scores))
+
+        if confidence is not None:
+            for result, skills in zip(results, confidence.score_batch(batch)):
+                result["confidence"] = {s["skill"]: s["score"] for s in skills}
+                result["weak_skills"] = [s["skill"] for s in skills if s["weak"]]
+
+        first_id += len(batch)
+        if stats is not None:
+            stats["rows"] = stats.get("rows", 0) + len(batch)
+        yield results
+
+
+# -------------------- OUTPUT --------------------
+
+class NdjsonWriter:
+
+    def __init__(self, fh):
+        self.fh = fh
+
+    def write_batch(self, results):
+        self.fh.write("".join(json.dumps(r) + "\n" for r in results))
+
+
+class CsvWriter:
+    """Flattens results into columns; the header comes from the first batch."""
+
+    def __init__(self, fh):
+        self.fh = fh
+        self.writer = None
+
+    def _flatten(self, result):
+        row = {"id": result["id"]}
+        for i, career in enumerate(result.get("careers", []), 1):
+            row[f"career_{i}"] = career
+        for skill, score in result.get("confidence", {}).items():
+            row[skill] = score
+        if "weak_skills" in result:
+            row["weak_skills"] = ";".join(result["weak_skills"])
+        return row
+
+    def write_batch(self, results):
+        rows = [self._flatten(r) for r in results]
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.fh, fieldnames=list(rows[0]), extrasaction="ignore")
+            self.writer.writeheader()
+        self.writer.writerows(rows)
+
+
+def run(rows, writer, quiz=None, confidence=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Score and write every row; return ``{"rows", "seconds", "rows_per_sec"}``."""
+    stats = {"rows": 0}
+    started = time.perf_counter()
+    for results in score_rows(rows, quiz, confidence, batch_size, stats):
+        writer.write_batch(results)
+    elapsed = time.perf_counter() - started
+    stats["seconds"] = round(elapsed, 3)
+    stats["rows_per_sec"] = round(stats["rows"] / elapsed, 1) if elapsed else None
+    return stats
@@ -0,0 +1,309 @@
+"""Response compression as WSGI middleware.
+
+``CompressionMiddleware`` wraps ``app.wsgi_app`` and negotiates an encoding
+from ``Accept-Encoding``: zstd and brotli when their modules are installed
+(``zstandard``, ``brotli``; both optional), gzip always. The client's
+q-values decide; ties go to the first of ``PREFERENCE``.
+
+A response is passed through untouched when
+
+* it already has a ``Content-Encoding`` (the pre-compressed /assets/ files),
+* its type is in ``SKIP_TYPES`` (images, archives, fonts ...) or is an
+  event stream, whose tiny events would only grow,
+* it says ``Cache-Control: no-transform``, is a 1xx/204/304, or
+* its body is shorter than ``min_size`` bytes,
+
+and so is every response to a request with a ``Range`` header, and any
+206: an encoded body would no longer match its ``Content-Range``.
+
+Bodies without a ``Content-Length`` (generator responses such as the NDJSON
+exports) are compressed as they are produced: up to ``min_size`` bytes are
+read ahead to apply the threshold, then every chunk is compressed and
+flushed on its own, so nothing waits for the whole body.
+
+``stats()`` reports, per encoding, responses, bytes in and out, the
+compression ratio and the CPU time spent compressing, plus why responses
+were skipped.
+"""
+import threading
+import time
+import zlib
+from itertools import chain
+
+from werkzeug.http import parse_accept_header
+
+DEFAULT_MIN_SIZE = 512
+DEFAULT_LEVEL = 6
+
+SKIP_TYPES = (
+    "image/", "video/", "audio/", "font/",
+    "application/zip", "application/gzip", "application/x-gzip", "application/pdf",
+    "application/octet-stream", "text/event-stream",
+)
+# Compressible despite the image/ prefix.
+COMPRESSIBLE_IMAGES = ("image/svg+xml",)
+
+try:
+    import brotli  # optional dependency
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard  # optional dependency
+except ImportError:
+    zstandard = None
+
+
+# -------------------- ENCODERS --------------------
+
+class GzipEncoder:
+
+    def __init__(self, level):
+        self._z = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._z.compress(data)
+
+    def flush(self):
+        return self._z.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._z.flush()
+
+
+class BrotliEncoder:
+
+    def __init__(self, level):
+        # Brotli's top qualities are far too slow for per-request use.
+        self._b = brotli.Compressor(quality=min(level, 5))
+
+    def compress(self, data):
+        return self._b.process(data)
+
+    def flush(self):
+        return self._b.flush()
+
+    def finish(self):
+        return self._b.finish()
+
+
+class ZstdEncoder:
+
+    def __init__(self, level):
+        self._z = zstandard.ZstdCompressor(level=min(level, 6)).compressobj()
+
+    def compress(self, data):
+        return self._z.compress(data)
+
+    def flush(self):
+        return self._z.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._z.flush()
+
+
+ENCODERS = {"gzip": GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = BrotliEncoder
+if zstandard is not None:
+    ENCODERS["zstd"] = ZstdEncoder
+
+PREFERENCE = ("zstd", "br", "gzip")
+
+
+# -------------------- MIDDLEWARE --------------------
+
+class CompressionMiddleware:
+
+    def __init__(self, app, min_size=DEFAULT_MIN_SIZE, level=DEFAULT_LEVEL, encodings=None):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+        self.encodings = [e for e in PREFERENCE if e in ENCODERS and (encodings is None or e in encodings)]
+
+        self._lock = threading.Lock()
+        self._totals = {e: {"responses": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0}
+                        for e in self.encodings}
+        self._skipped = {}
+
+    def negotiate(self, accept_encoding):
+        if not accept_encoding:
+            return None
+        accepted = parse_accept_header(accept_encoding)
+        best, best_q = None, 0
+        for encoding in self.encodings:
+            q = accepted.quality(encoding)
+            if q > best_q:
+                best, best_q = encoding, q
+        return best
+
+    def __call__(self, environ, start_response):
+        encoding = self.negotiate(environ.get("HTTP_ACCEPT_ENCODING"))
+        if encoding is None or environ.get("REQUEST_METHOD") == "HEAD":
+            return self.app(environ, start_response)
+        if "HTTP_RANGE" in environ:
+            self._skip("range")
+            return self.app(environ, start_response)
+
+        state = {"writes": []}
+
+        def capture(status, headers, exc_info=None):
+            if exc_info and state.get("started"):
+                raise exc_info[1].with_traceback(exc_info[2])
+            state.update(status=status, headers=headers, exc_info=exc_info)
+            return state["writes"].append
+
+        body = self.app(environ, capture)
+        return _Closing(self._respond(body, state, encoding, start_response), body)
+
+    def _skip_reason(self, status, headers):
+        code = int(status.split(None, 1)[0])
+        if code < 200 or code in (204, 206, 304):
+            return "status"
+        for name, value in headers:
+            name = name.lower()
+            if name == "content-encoding":
+                return "encoded"
+            if name == "content-type":
+                ctype = value.split(";", 1)[0].strip().lower()
+                if ctype.startswith(SKIP_TYPES) and ctype not in COMPRESSIBLE_IMAGES:
+                    return "type"
+            if name == "cache-control" and "no-transform" in value.lower():
+                return "no-transform"
+            if name == "content-length" and int(value) < self.min_size:
+                return "small"
+        return None
+
+    def _respond(self, body, state, encoding, start_response):
+        chunks = iter(body)
+        # A generator app may only call start_response on its first chunk.
+        ahead = [] if "status" in state else [next(chunks, b"")]
+        ahead = state["writes"] + ahead
+        status, headers = state["status"], state["headers"]
+
+        reason = self._skip_reason(status, headers)
+        streamed = not any(name.lower() == "content-length" for name, _ in headers)
+        if reason is None:
+            size = sum(len(c) for c in ahead)
+            while size < self.min_size:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    reason = "small"
+                    break
+                ahead.append(chunk)
+                size += len(chunk)
+
+        if reason is not None:
+            self._skip(reason)
+            state["started"] = True
+            start_response(status, headers, state["exc_info"])
+            yield from ahead
+            yield from chunks
+            return
+
+        start_response(status, self._headers(headers, encoding), state["exc_info"])
+        state["started"] = True
+        yield from self._compress(chain(ahead, chunks), encoding, streamed)
+
+    def _headers(self, headers, encoding):
+        out = []
+        vary = None
+        for name, value in headers:
+            lower = name.lower()
+            if lower == "content-length":
+                continue
+            if lower == "etag" and not value.startswith("W/"):
+                # The bytes differ from the identity body the tag was made for.
+                value = "W/" + value
+            if lower == "vary":
+                vary = value
+                continue
+            out.append((name, value))
+        out.append(("Content-Encoding", encoding))
+        if vary is None:
+            out.append(("Vary", "Accept-Encoding"))
+        elif "accept-encoding" in vary.lower() or vary.strip() == "*":
+            out.append(("Vary", vary))
+        else:
+            out.append(("Vary", f"{vary}, Accept-Encoding"))
+        return out
+
+    def _compress(self, chunks, encoding, streamed):
+        encoder = ENCODERS[encoding](self.level)
+        bytes_in = bytes_out = 0
+        cpu = 0.0
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                started = time.thread_time()
+                out = encoder.compress(chunk)
+                if streamed:
+                    out += encoder.flush()
+                cpu += time.thread_time() - started
+                bytes_in += len(chunk)
+                if out:
+                    bytes_out += len(out)
+                    yield out
+            started = time.thread_time()
+            out = encoder.finish()
+            cpu += time.thread_time() - started
+            bytes_out += len(out)
+            yield out
+        finally:
+            with self._lock:
+                totals = self._totals[encoding]
+                totals["responses"] += 1
+                totals["bytes_in"] += bytes_in
+                totals["bytes_out"] += bytes_out
+                totals["cpu_seconds"] += cpu
+
+    def _skip(self, reason):
+        with self._lock:
+            self._skipped[reason] = self._skipped.get(reason, 0) + 1
+
+    def stats(self):
+        with self._lock:
+            encodings = {}
+            for encoding, totals in self._totals.items():
+                totals = dict(totals)
+                totals["ratio"] = (
+                    round(totals["bytes_out"] / totals["bytes_in"], 4) if totals["bytes_in"] else None
+                )
+                totals["cpu_ms_per_mb"] = (
+                    round(totals["cpu_seconds"] * 1000 / (totals["bytes_in"] / 1e6), 3)
+                    if totals["bytes_in"] else None
+                )
+                totals["cpu_seconds"] = round(totals["cpu_seconds"], 6)
+                encodings[encoding] = totals
+            return {"min_size": self.min_size, "encodings": encodings, "skipped": dict(self._skipped)}
+
+
+class _Closing:
+    """Our response iterable; ``close()`` also closes the app's, even if
+    the server never started iterating (Flask tears down the request
+    context there)."""
+
+    def __init__(self, iterable, body):
+        self._iterable = iterable
+        self._body = body
+
+    def __iter__(self):
+        return iter(self._iterable)
+
+    def close(self):
+        try:
+            self._iterable.close()
+        finally:
+            if hasattr(self._body, "close"):
+                self._body.close()
+
+
+# -------------------- FLASK BINDING --------------------
+
+def init_app(app, min_size=DEFAULT_MIN_SIZE, level=DEFAULT_LEVEL):
+    """Compress ``app``'s responses; the middleware is kept for its stats."""
+    middleware = CompressionMiddleware(app.wsgi_app, min_size, level)
+    app.wsgi_app = middleware
+    app.extensions["compression"] = middleware
+    return middleware
@@ -0,0 +1,156 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import current_app, g, has_app_context
+
+# -------------------- PRAGMAS --------------------
+# WAL lets readers run while a writer holds the lock, and NORMAL sync is
+# safe under WAL (only the last transactions can be lost on power failure).
+PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("cache_size", -16000),        # ~16 MB page cache per connection
+    ("mmap_size", 128 * 1024 * 1024),
+    ("temp_store", "MEMORY"),
+    ("busy_timeout", 5000),
+)
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections shared by the worker threads.
+
+    Idle connections are kept on a LIFO stack so the most recently used
+    (warmest) connection is handed out first. Each connection keeps its own
+    prepared statement cache (``cached_statements``), so reusing connections
+    also reuses compiled statements.
+    """
+
+    def __init__(self, path, size=8, timeout=10.0, statement_cache=256):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self.statement_cache = statement_cache
+
+        self._idle = []
+        self._open = 0
+        self._cond = threading.Condition()
+
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            cached_statements=self.statement_cache,
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in PRAGMAS:
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    def acquire(self):
+        with self._cond:
+            if self._idle:
+                self.hits += 1
+                return self._idle.pop()
+
+            if self._open >= self.size:
+                self.waits += 1
+                started = time.perf_counter()
+                deadline = started + self.timeout
+                while not self._idle:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        self.wait_time += time.perf_counter() - started
+                        raise PoolTimeout(f"no free connection after {self.timeout}s")
+                    self._cond.wait(remaining)
+                self.wait_time += time.perf_counter() - started
+                self.hits += 1
+                return self._idle.pop()
+
+            self._open += 1
+            self.misses += 1
+
+        try:
+            return self._connect()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, conn):
+        # Never hand a half-finished transaction to the next request.
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        with self._cond:
+            while self._idle:
+                self._idle.pop().close()
+                self._open -= 1
+
+    def stats(self):
+        with self._cond:
+            return {
+                "size": self.size,
+                "open": self._open,
+                "idle": len(self._idle),
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "wait_time_ms": round(self.wait_time * 1000, 3),
+            }
+
+
+# -------------------- FLASK BINDING --------------------
+
+def init_app(app, pool):
+    """Bind ``pool`` to ``app`` so each request borrows at most one connection."""
+    app.extensions["db_pool"] = pool
+    app.teardown_appcontext(_release_db)
+
+
+def get_db():
+    """Return the connection borrowed for the current app context."""
+    if "db" not in g:
+        g.db = current_app.extensions["db_pool"].acquire()
+    return g.db
+
+
+@contextmanager
+def connection(pool):
+    """A connection from ``pool``: the request's own when ``pool`` is the
+    app's, so a request never holds two; otherwise one borrowed just for
+    the block (CLI, benchmarks)."""
+    if has_app_context() and current_app.extensions.get("db_pool") is pool:
+        yield get_db()
+    else:
+        with pool.connection() as conn:
+            yield conn
+
+
+def _release_db(exc):
+    conn = g.pop("db", None)
+    if conn is not None:
+        current_app.extensions["db_pool"].release(conn)
@@ -0,0 +1,274 @@
+"""Paginated and batched DynamoDB access.
+
+A single ``table.scan()`` only returns the first 1 MB of a table and
+``LastEvaluatedKey`` has to be followed for the rest; single-item calls
+cost one round trip each. The helpers here cover both:
+
+* ``scan_all`` / ``query_all`` -- iterate every item, one page at a time;
+* ``parallel_scan`` -- split the table into ``Segment``s scanned by a
+  thread pool, for admin exports of large tables;
+* ``scan_page`` / ``query_page`` -- one page of ``limit`` items plus an
+  opaque cursor for the next one, so a page view costs O(page size);
+* ``batch_write`` / ``batch_get`` -- bulk BatchWriteItem / BatchGetItem on
+  a bounded thread pool, retrying unprocessed entries with backoff.
+
+Everything takes boto3 ``Table`` resources, so it works the same against
+AWS, DynamoDB Local or moto.
+"""
+import base64
+import json
+import queue
+import random
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
+
+DEFAULT_PAGE_SIZE = 25
+DEFAULT_SEGMENTS = 4
+
+Page = namedtuple("Page", "items cursor")
+
+# -------------------- CURSORS --------------------
+
+def encode_cursor(key):
+    """URL-safe token for a ``LastEvaluatedKey`` (None stays None)."""
+    if not key:
+        return None
+    # Imported here: boto3 is only loaded once DynamoDB is actually used.
+    from boto3.dynamodb.types import TypeSerializer
+
+    serializer = TypeSerializer()
+    wire = {name: serializer.serialize(value) for name, value in key.items()}
+    raw = json.dumps(wire, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """Inverse of ``encode_cursor``; a missing or mangled token means page one."""
+    if not token:
+        return None
+    from boto3.dynamodb.types import TypeDeserializer
+
+    deserializer = TypeDeserializer()
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        wire = json.loads(raw)
+        return {name: deserializer.deserialize(value) for name, value in wire.items()}
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+# -------------------- FULL READS --------------------
+
+def _paginate(call, kwargs):
+    kwargs = dict(kwargs)
+    while True:
+        res = call(**kwargs)
+        yield from res.get("Items", [])
+        key = res.get("LastEvaluatedKey")
+        if not key:
+            return
+        kwargs["ExclusiveStartKey"] = key
+
+
+def scan_all(table, **kwargs):
+    return _paginate(table.scan, kwargs)
+
+
+def query_all(table, **kwargs):
+    return _paginate(table.query, kwargs)
+
+
+def parallel_scan(table, segments=DEFAULT_SEGMENTS, **kwargs):
+    """Yield every item of ``table`` using ``segments`` concurrent scans.
+
+    Item order is not defined. Pages are handed over through a bounded
+    queue, so a slow consumer pauses the scanners instead of letting the
+    whole table pile up in memory. Each worker uses its own ``Table``
+    from a fresh session, as boto3 resources are not thread-safe.
+    """
+    if segments <= 1:
+        yield from scan_all(table, **kwargs)
+        return
+
+    import boto3
+
+    pages = queue.Queue(maxsize=segments * 2)
+    stop = threading.Event()
+    done = object()
+    client = table.meta.client
+    region = client.meta.region_name
+    endpoint = client.meta.endpoint_url
+
+    def worker(segment):
+        try:
+            resource = boto3.session.Session().resource(
+                "dynamodb", region_name=region, endpoint_url=endpoint, config=client.meta.config
+            )
+            own = resource.Table(table.name)
+            args = dict(kwargs, Segment=segment, TotalSegments=segments)
+            while not stop.is_set():
+                res = own.scan(**args)
+                pages.put(res.get("Items", []))
+                key = res.get("LastEvaluatedKey")
+                if not key:
+                    break
+                args["ExclusiveStartKey"] = key
+            pages.put(done)
+        except Exception as e:
+            pages.put(e)
+
+    threads = [
+        threading.Thread(target=worker, args=(segment,), daemon=True)
+        for segment in range(segments)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        remaining = segments
+        while remaining:
+            page = pages.get()
+            if page is done:
+                remaining -= 1
+            elif isinstance(page, Exception):
+                raise page
+            else:
+                yield from page
+    finally:
+        # Consumer gave up or failed: let the workers drain out.
+        stop.set()
+        while any(t.is_alive() for t in threads):
+            try:
+                pages.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+# -------------------- PAGES --------------------
+
+def _page(call, limit, cursor, kwargs):
+    kwargs = dict(kwargs, Limit=limit)
+    start = decode_cursor(cursor)
+    if start:
+        kwargs["ExclusiveStartKey"] = start
+    res = call(**kwargs)
+    return Page(res.get("Items", []), encode_cursor(res.get("LastEvaluatedKey")))
+
+
+def scan_page(table, limit=DEFAULT_PAGE_SIZE, cursor=None, **kwargs):
+    """One page of a scan; ``cursor`` comes from the previous ``Page``."""
+    return _page(table.scan, limit, cursor, kwargs)
+
+
+def query_page(table, limit=DEFAULT_PAGE_SIZE, cursor=None, **kwargs):
+    return _page(table.query, limit, cursor, kwargs)
+
+
+# -------------------- BATCHES --------------------
+
+def _backoff(attempt, base_delay, max_delay):
+    # Exponential backoff with full jitter.
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+def _bounded_map(fn, chunks, workers):
+    """``fn`` over ``chunks`` on a thread pool, at most ``2 * workers`` in flight."""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(fn, chunk))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def batch_write(table, items, workers=4, key_names=None, max_attempts=8,
+                base_delay=0.05, max_delay=5.0):
+    """Put ``items`` into ``table`` with concurrent BatchWriteItem calls.
+
+    Items are streamed in batches of 25 (the API limit). ``UnprocessedItems``
+    are resent with exponential backoff for up to ``max_attempts`` rounds;
+    whatever is still unprocessed then counts as failed. Items repeating a
+    key within one batch are collapsed (the last one wins), since DynamoDB
+    rejects such batches outright.
+
+    Returns ``{"items", "batches", "retries", "failed", "seconds",
+    "items_per_sec"}``.
+    """
+    if key_names is None:
+        key_names = [k["AttributeName"] for k in table.key_schema]
+    # The resource's client takes and returns plain Python values and,
+    # unlike the resource itself, is safe to share between threads.
+    client = table.meta.client
+    name = table.name
+
+    def write(batch):
+        unique = {tuple(item[k] for k in key_names): item for item in batch}
+        requests = {name: [{"PutRequest": {"Item": item}} for item in unique.values()]}
+        retries = 0
+        while True:
+            res = client.batch_write_item(RequestItems=requests)
+            requests = res.get("UnprocessedItems") or {}
+            left = len(requests.get(name, []))
+            if not left:
+                return len(unique), retries, 0
+            if retries + 1 >= max_attempts:
+                return len(unique) - left, retries, left
+            time.sleep(_backoff(retries, base_delay, max_delay))
+            retries += 1
+
+    stats = {"items": 0, "batches": 0, "retries": 0, "failed": 0}
+    started = time.perf_counter()
+    for written, retries, failed in _bounded_map(write, _chunks(items, 25), workers):
+        stats["items"] += written
+        stats["batches"] += 1
+        stats["retries"] += retries
+        stats["failed"] += failed
+    elapsed = time.perf_counter() - started
+    stats["seconds"] = round(elapsed, 3)
+    stats["items_per_sec"] = round(stats["items"] / elapsed, 1) if elapsed else None
+    return stats
+
+
+def batch_get(table, keys, workers=4, max_attempts=8, base_delay=0.05, max_delay=5.0, **kwargs):
+    """Yield the items for ``keys`` using concurrent BatchGetItem calls.
+
+    Keys are deduplicated and sent 100 at a time; ``UnprocessedKeys`` are
+    retried with backoff like ``batch_write``. Missing keys are simply
+    absent from the output, and the order of items is not defined. Extra
+    keyword arguments (``ProjectionExpression`` ...) go into the request.
+    """
+    client = table.meta.client
+    name = table.name
+    unique = {tuple(sorted(key.items())): key for key in keys}
+
+    def read(chunk):
+        requests = {name: dict(kwargs, Keys=chunk)}
+        found = []
+        for attempt in range(max_attempts):
+            if attempt:
+                time.sleep(_backoff(attempt - 1, base_delay, max_delay))
+            res = client.batch_get_item(RequestItems=requests)
+            found.extend(res.get("Responses", {}).get(name, []))
+            requests = res.get("UnprocessedKeys") or {}
+            if not requests:
+                break
+        return found
+
+    for found in _bounded_map(read, _chunks(unique.values(), 100), workers):
+        yield from found
@@ -0,0 +1,140 @@
+"""Resolve free-text career goals to catalog roles.
+
+Resolution runs in three steps, each cheaper than the next one:
+
+1. an LRU cache keyed on the normalized goal (the same goals repeat a lot);
+2. exact word containment against role names *and* their synonyms, so
+   "senior backend engineer" finds the role listed for "backend engineer";
+3. fuzzy matching on character trigrams for typos ("data scienist"). A
+   fuzzy match must also cover every word of the name with a similar word
+   of the goal (``word_threshold``, a little looser since single words
+   are short), so a generic "engineer" is not read as "ml engineer" and
+   falls through to the default roadmap instead.
+
+The trigram step uses prefix filtering: for a similarity threshold ``t``
+any name that qualifies must share at least one trigram with the rarest
+few trigrams of the goal, so only those posting lists are read. Posting
+lists longer than ``max_postings`` (trigrams of "engineer", "senior", ...)
+are too unselective to be worth reading and are skipped, and only the
+``max_candidates`` names sharing the most trigrams are scored exactly.
+The work depends on the goal, not on how many roles the catalog holds.
+"""
+import math
+import sys
+from collections import Counter
+from functools import lru_cache
+
+from catalog import TokenIndex, get_catalog
+from matcher import tokenize
+
+DEFAULT_THRESHOLD = 0.6
+DEFAULT_WORD_THRESHOLD = 0.5
+DEFAULT_CACHE_SIZE = 4096
+MAX_POSTINGS = 400
+MAX_CANDIDATES = 32
+
+
+def normalize(goal):
+    return " ".join(tokenize(goal or ""))
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def dice(a, b):
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+class GoalResolver:
+
+    def __init__(self, catalog, threshold=DEFAULT_THRESHOLD, cache_size=DEFAULT_CACHE_SIZE,
+                 max_postings=MAX_POSTINGS, max_candidates=MAX_CANDIDATES,
+                 word_threshold=DEFAULT_WORD_THRESHOLD):
+        self.catalog = catalog
+        self.threshold = threshold
+        self.word_threshold = word_threshold
+        self.max_postings = max_postings
+        self.max_candidates = max_candidates
+
+        names = [(role, role) for role in catalog.roadmaps]
+        for role, synonyms in catalog.synonyms.items():
+            if role in catalog.roadmaps:
+                names.extend((synonym, role) for synonym in synonyms)
+
+        self._exact = TokenIndex(names)
+
+        self._roles = []
+        self._grams = []
+        self._words = []
+        postings = {}
+        for name_id, (name, role) in enumerate(names):
+            grams = trigrams(normalize(name))
+            self._roles.append(role)
+            self._grams.append(grams)
+            self._words.append(tuple(trigrams(word) for word in tokenize(name)))
+            for gram in grams:
+                postings.setdefault(sys.intern(gram), []).append(name_id)
+        self._postings = {gram: tuple(ids) for gram, ids in postings.items()}
+
+        self._cached = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def resolve(self, goal):
+        """Return the best matching role for ``goal``, or None."""
+        return self._cached(normalize(goal))
+
+    def roadmap_for(self, goal):
+        role = self.resolve(goal)
+        return self.catalog.roadmaps[role] if role else self.catalog.default_roadmap
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+    def _resolve(self, goal):
+        if not goal:
+            return None
+        role = self._exact.lookup(goal.split())
+        if role is not None:
+            return role
+        return self._fuzzy(goal)
+
+    def _fuzzy(self, goal):
+        grams = trigrams(goal)
+        postings = self._postings
+        t = self.threshold
+
+        # Dice(A, B) >= t needs |A & B| >= t|A| / (2 - t); a qualifying name
+        # must therefore hit one of the |A| - that + 1 rarest goal trigrams.
+        needed = math.ceil(t * len(grams) / (2 - t))
+        known = sorted((g for g in grams if g in postings), key=lambda g: len(postings[g]))
+        if len(known) < needed:
+            return None
+
+        hits = Counter()
+        for gram in known[:len(known) - needed + 1]:
+            posting = postings[gram]
+            if len(posting) > self.max_postings:
+                break
+            hits.update(posting)
+
+        # Highest similarity wins; ties go to the name listed first.
+        goal_words = [trigrams(word) for word in goal.split()]
+        best = None
+        for name_id, _ in hits.most_common(self.max_candidates):
+            score = dice(grams, self._grams[name_id])
+            if score < t or (best is not None and (score, -name_id) <= best):
+                continue
+            if self._covers(goal_words, name_id):
+                best = (score, -name_id)
+        return self._roles[-best[1]] if best else None
+
+    def _covers(self, goal_words, name_id):
+        """Every word of the name is close to some word of the goal."""
+        t = self.word_threshold
+        return all(any(dice(word, g) >= t for g in goal_words) for word in self._words[name_id])
+
+
+@lru_cache(maxsize=None)
+def get_resolver():
+    return GoalResolver(get_catalog())
@@ -0,0 +1,16 @@
+# gunicorn -c gunicorn.conf.py
+#
+# The master imports app.py and builds the app once -- migrating
+# career.db and loading every catalog and engine -- then forks the
+# workers, which start already warm and share those pages of memory.
+import multiprocessing
+import os
+
+os.environ.setdefault("WARM_ON_START", "1")
+
+wsgi_app = "app:create_app()"
+preload_app = True
+
+bind = os.getenv("BIND", "127.0.0.1:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
@@ -0,0 +1,94 @@
+"""Chatbot intent engine.
+
+Intents come from the catalog as ``{name, keywords, priority, reply}``.
+All keywords of all intents are compiled into one regex, factored as a
+character trie so shared prefixes are only tried once, and a message is
+scanned once no matter how many intents exist. Every keyword
+found votes for its intent; the intent with the highest priority wins
+(ties go to the one declared first), so the outcome no longer depends on
+the order of an if-chain. Keywords match anywhere in the message, as the
+original ``in`` checks did ("careers" still hits "career").
+
+Replies for normalized messages are memoized in a bounded LRU, since chat
+messages repeat a lot ("help", "hi", "roadmap").
+"""
+import re
+from functools import lru_cache
+
+from catalog import get_catalog
+
+DEFAULT_CACHE_SIZE = 10_000
+
+
+def normalize(msg):
+    return " ".join((msg or "").lower().split())
+
+
+def trie_pattern(words):
+    """Regex source matching any of ``words``, longest alternative first."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        ends = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends:
+            # Greedy optional: a longer keyword is preferred over its prefix.
+            body = (body if len(branches) > 1 else "(?:" + body + ")") + "?"
+        return body
+
+    return build(trie)
+
+
+class IntentEngine:
+
+    def __init__(self, intents, fallback, cache_size=DEFAULT_CACHE_SIZE):
+        self.intents = list(intents)
+        self.fallback = fallback
+
+        # keyword -> intent indices (a keyword may belong to several intents)
+        self._owners = {}
+        for i, intent in enumerate(self.intents):
+            for keyword in intent["keywords"]:
+                self._owners.setdefault(keyword.lower(), []).append(i)
+
+        # The longest keyword wins at a given position ("data science" over
+        # "data"); the lookahead reports a match at every position, so
+        # overlapping keywords are all seen.
+        self._pattern = re.compile(f"(?=({trie_pattern(self._owners)}))") if self._owners else None
+        self._rank = [(-intent.get("priority", 0), i) for i, intent in enumerate(self.intents)]
+
+        self._cached = lru_cache(maxsize=cache_size)(self._reply)
+
+    def match(self, msg):
+        """The winning intent for ``msg``, or None."""
+        text = normalize(msg)
+        if self._pattern is None:
+            return None
+        hits = {i for kw in self._pattern.findall(text) for i in self._owners[kw]}
+        if not hits:
+            return None
+        return self.intents[min(hits, key=self._rank.__getitem__)]
+
+    def _reply(self, text):
+        intent = self.match(text)
+        return intent["reply"] if intent else self.fallback
+
+    def reply(self, msg):
+        return self._cached(normalize(msg))
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+
+@lru_cache(maxsize=None)
+def get_intent_engine():
+    catalog = get_catalog()
+    return IntentEngine(catalog.intents, catalog.fallback_reply)
@@ -0,0 +1,155 @@
+"""Multi-keyword matcher used by the resume analysis routes.
+
+All keywords are compiled once into an Aho-Corasick automaton whose
+alphabet is *words* rather than characters: the text is tokenized with a
+single regex pass and every token advances the automaton by one step. A
+resume is therefore scanned once no matter how many keywords there are,
+matches always fall on word boundaries ("sql" does not fire inside
+"mysql"), and multi-word keywords such as "machine learning" are matched
+as a sequence of tokens.
+"""
+import re
+from collections import deque, namedtuple
+
+WORD_RE = re.compile(r"\w+")
+
+Match = namedtuple("Match", "keyword start end")
+
+# A word longer than this is flushed as-is instead of being carried over to
+# the next chunk, so a pathological input cannot grow the carry buffer.
+MAX_CARRY = 256
+
+
+def tokenize(text):
+    return [t.lower() for t in WORD_RE.findall(text)]
+
+
+class KeywordMatcher:
+
+    def __init__(self, keywords):
+        # keyword -> tuple of lowercase tokens; keywords that tokenize to
+        # nothing (pure punctuation) can never match and are dropped.
+        self.keywords = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for keyword in dict.fromkeys(keywords):
+            tokens = tokenize(keyword)
+            if tokens:
+                self._insert(keyword, tokens)
+
+        self._build_failure_links()
+        self.max_tokens = max((n for _, n in self.keywords), default=0)
+
+    def _insert(self, keyword, tokens):
+        state = 0
+        for tok in tokens:
+            nxt = self._goto[state].get(tok)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][tok] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] += (len(self.keywords),)
+        self.keywords.append((keyword, len(tokens)))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for tok, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and tok not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(tok, 0)
+                # Inherit shorter keywords that end at the same token.
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def _step(self, state, tok):
+        goto, fail = self._goto, self._fail
+        while state and tok not in goto[state]:
+            state = fail[state]
+        return goto[state].get(tok, 0)
+
+    def finditer(self, text):
+        """Yield a ``Match`` for every keyword occurrence, overlaps included."""
+        out, keywords = self._out, self.keywords
+        starts = deque(maxlen=self.max_tokens or 1)
+        state = 0
+        for m in WORD_RE.finditer(text):
+            starts.append(m.start())
+            state = self._step(state, m.group().lower())
+            for idx in out[state]:
+                keyword, length = keywords[idx]
+                yield Match(keyword, starts[-length], m.end())
+
+    def found(self, text):
+        """Return the set of keywords that occur in ``text``."""
+        out, keywords = self._out, self.keywords
+        root = self._goto[0]
+        hits = set()
+        state = 0
+        for tok in WORD_RE.findall(text):
+            tok = tok.lower()
+            if not state and tok not in root:
+                continue
+            state = self._step(state, tok)
+            hits.update(out[state])
+        return {keywords[idx][0] for idx in hits}
+
+    def scanner(self):
+        return Scanner(self)
+
+
+class Scanner:
+    """Incremental ``KeywordMatcher.found`` over a text fed in chunks.
+
+    A word cut in half by a chunk boundary is carried over and matched
+    once the next chunk completes it, so feeding ``"pyt"`` then ``"hon"``
+    finds "python". Only the current chunk is ever held in memory.
+    """
+
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self.state = 0
+        self.carry = ""
+        self._hits = set()
+
+    def _advance(self, tok):
+        matcher = self.matcher
+        tok = tok.lower()
+        if not self.state and tok not in matcher._goto[0]:
+            return
+        self.state = matcher._step(self.state, tok)
+        self._hits.update(matcher._out[self.state])
+
+    def feed(self, chunk):
+        text = self.carry + chunk if self.carry else chunk
+        self.carry = ""
+        tokens = WORD_RE.findall(text)
+        if tokens and text[-1:] and WORD_RE.match(text[-1]):
+            last = tokens.pop()
+            if len(last) < MAX_CARRY:
+                self.carry = last
+            else:
+                tokens.append(last)
+        for tok in tokens:
+            self._advance(tok)
+
+    def close(self):
+        if self.carry:
+            self._advance(self.carry)
+            self.carry = ""
+        return self.found
+
+    @property
+    def found(self):
+        keywords = self.matcher.keywords
+        return {keywords[idx][0] for idx in self._hits}
@@ -0,0 +1,151 @@
+"""Versioned schema migrations for career.db.
+
+The applied version is stored in SQLite's ``PRAGMA user_version``. Each
+migration runs inside its own ``BEGIN IMMEDIATE`` transaction, so several
+workers booting at once apply it exactly once.
+"""
+
+MIGRATIONS = []
+
+
+def migration(func):
+    MIGRATIONS.append(func)
+    return func
+
+
+# -------------------- MIGRATIONS --------------------
+# Append only. Never edit a migration once it has shipped.
+
+@migration
+def create_base_tables(cur):
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE,
+        email TEXT,
+        password TEXT
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS profiles (
+        user_id INTEGER,
+        career_goal TEXT,
+        current_level TEXT,
+        interests TEXT,
+        time_per_week INTEGER
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS admins (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        email TEXT UNIQUE,
+        password TEXT
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS projects (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT,
+        description TEXT
+    )
+    """)
+
+
+@migration
+def key_profiles_by_user(cur):
+    # One profile per user, looked up by primary key instead of a scan.
+    # Older databases may hold duplicates from before the upsert; keep the
+    # most recently written row for each user.
+    cur.execute("""
+    CREATE TABLE profiles_keyed (
+        user_id INTEGER PRIMARY KEY,
+        career_goal TEXT,
+        current_level TEXT,
+        interests TEXT,
+        time_per_week INTEGER
+    )
+    """)
+    cur.execute("""
+    INSERT INTO profiles_keyed
+    SELECT user_id, career_goal, current_level, interests, time_per_week
+    FROM profiles
+    WHERE rowid IN (
+        SELECT MAX(rowid) FROM profiles
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+    )
+    """)
+    cur.execute("DROP TABLE profiles")
+    cur.execute("ALTER TABLE profiles_keyed RENAME TO profiles")
+
+
+# Title and description of the career paths seed_default_projects added.
+SEEDED_PROJECTS = (
+    ("Software Developer", "Build applications, websites, and systems"),
+    ("Data Scientist", "Analyze data and build predictive models"),
+    ("UI/UX Designer", "Design user-friendly digital experiences"),
+)
+
+
+@migration
+def seed_default_projects(cur):
+    # Withdrawn: this used to copy the static /projects list into the
+    # projects table. The slot stays so later versions keep their numbers;
+    # remove_default_projects undoes it where it already ran.
+    pass
+
+
+@migration
+def create_sessions_table(cur):
+    # Server-side sessions (sessions.py); expires is a Unix timestamp.
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS sessions (
+        id TEXT PRIMARY KEY,
+        data BLOB NOT NULL,
+        expires REAL NOT NULL
+    )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires)")
+
+
+@migration
+def remove_default_projects(cur):
+    # Only rows that still match the seed exactly; anything an admin
+    # edited or created is kept.
+    cur.executemany(
+        "DELETE FROM projects WHERE title = ? AND description = ?", SEEDED_PROJECTS
+    )
+
+
+# -------------------- RUNNER --------------------
+
+def current_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """Apply every pending migration and return the resulting version."""
+    target = len(MIGRATIONS)
+
+    while current_version(conn) < target:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another worker may have migrated while we waited for the lock.
+            version = current_version(conn)
+            if version >= target:
+                conn.rollback()
+                break
+
+            cur = conn.cursor()
+            MIGRATIONS[version](cur)
+            cur.execute(f"PRAGMA user_version = {version + 1}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    return current_version(conn)
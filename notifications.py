@@ -0,0 +1,245 @@
+"""Background SNS notifications.
+
+``Notifier.notify()`` only enqueues and returns, so request handlers
+never wait on SNS. A daemon thread drains the bounded queue:
+
+* it gathers up to 10 events (the ``PublishBatch`` limit), waiting at most
+  ``linger`` seconds for a batch to fill, and drops exact duplicates
+  within a batch;
+* it publishes them with one ``PublishBatch`` call. Entries SNS reports
+  as failed on its side, and calls that raise, are retried with
+  exponential backoff. Entries rejected as the sender's fault are
+  dropped and counted, since resending cannot fix them;
+* an event is appended to a local NDJSON spill file when the queue is
+  full, or when its batch is still failing after ``max_attempts``. The
+  spill file is replayed into the queue the next time the notifier
+  starts, so a burst or an SNS outage does not lose events. A replay
+  that cannot be read is left on disk as ``<spill>.<id>.replay`` and
+  picked up again by the next start. Events that
+  cannot be spilled either (disk full, read-only directory) are counted
+  as ``lost``.
+
+Nothing here raises into the request that calls ``notify()``: a failed
+replay or spill is counted and the event dropped instead.
+
+The SNS client is passed in, so tests can use a stub with a
+``publish_batch`` method.
+"""
+import glob
+import json
+import os
+import queue
+import random
+import threading
+import time
+import uuid
+
+BATCH_LIMIT = 10
+
+
+class Notifier:
+
+    def __init__(self, client, topic_arn, maxsize=1000, linger=0.5, max_attempts=5,
+                 base_delay=0.2, max_delay=10.0, spill_path="notifications.spill.ndjson"):
+        self.client = client
+        self.topic_arn = topic_arn
+        self.linger = linger
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.spill_path = spill_path
+
+        self._queue = queue.Queue(maxsize)
+        self._spill_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._stopping = threading.Event()
+
+        self.published = 0
+        self.failed = 0
+        self.retries = 0
+        self.spilled = 0
+        self.lost = 0
+        self.batches = 0
+
+    # -------------------- PRODUCER SIDE --------------------
+
+    def notify(self, message, subject=None):
+        """Queue one notification; never blocks and never raises."""
+        event = {"message": message, "subject": subject}
+        try:
+            self.start()
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self._spill([event])
+        except Exception:
+            self.lost += 1
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                try:
+                    self._replay_spill()
+                except Exception:
+                    # A replay that fails must not keep the worker down; its
+                    # file stays on disk as *.replay for the next start.
+                    pass
+                self._thread = threading.Thread(target=self._run, name="sns-notifier", daemon=True)
+                self._thread.start()
+
+    def flush(self, timeout=10.0):
+        """Wait until everything queued so far has been handled."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return not self._queue.unfinished_tasks
+
+    def close(self, timeout=10.0):
+        """Drain the queue, then stop the worker; leftovers are spilled."""
+        if self._thread is None:
+            return
+        self.flush(timeout)
+        self._stopping.set()
+        self._thread.join(timeout)
+        leftovers = []
+        while True:
+            try:
+                leftovers.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+            self._queue.task_done()
+        if leftovers:
+            self._spill(leftovers)
+
+    def stats(self):
+        return {
+            "queued": self._queue.qsize(),
+            "published": self.published,
+            "batches": self.batches,
+            "retries": self.retries,
+            "failed": self.failed,
+            "spilled": self.spilled,
+            "lost": self.lost,
+        }
+
+    # -------------------- WORKER --------------------
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.linger
+            while len(batch) < BATCH_LIMIT:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._publish(batch)
+            except Exception:
+                self._spill(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _publish(self, batch):
+        unique = {(e["subject"], e["message"]): e for e in batch}
+        pending = {str(i): e for i, e in enumerate(unique.values())}
+        self.batches += 1
+
+        for attempt in range(self.max_attempts):
+            if attempt:
+                self.retries += 1
+                time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+            try:
+                res = self.client.publish_batch(
+                    TopicArn=self.topic_arn,
+                    PublishBatchRequestEntries=[self._entry(i, e) for i, e in pending.items()]
+                )
+            except Exception:
+                continue
+
+            self.published += len(res.get("Successful", []))
+            retry = {}
+            for failure in res.get("Failed", []):
+                if failure.get("SenderFault"):
+                    self.failed += 1
+                else:
+                    retry[failure["Id"]] = pending[failure["Id"]]
+            pending = retry
+            if not pending:
+                return
+
+        self._spill(pending.values())
+
+    @staticmethod
+    def _entry(entry_id, event):
+        entry = {"Id": entry_id, "Message": event["message"]}
+        if event["subject"]:
+            entry["Subject"] = event["subject"]
+        return entry
+
+    # -------------------- SPILL FILE --------------------
+
+    def _spill(self, events):
+        events = list(events)
+        try:
+            with self._spill_lock:
+                with open(self.spill_path, "a", encoding="utf-8") as fh:
+                    for event in events:
+                        fh.write(json.dumps(event) + "\n")
+                    fh.flush()
+                    os.fsync(fh.fileno())
+        except OSError:
+            self.lost += len(events)
+            return
+        self.spilled += len(events)
+
+    def _replay_spill(self):
+        # Claim the spill file, and any replay an earlier start could not
+        # finish, by moving it to a fresh name first, so new spills do not
+        # mix into the replay. Workers starting together race for each
+        # file; the losers find it gone.
+        leftovers = glob.glob(glob.escape(self.spill_path) + ".*.replay")
+        for path in [self.spill_path] + leftovers:
+            replay = f"{self.spill_path}.{uuid.uuid4().hex}.replay"
+            try:
+                with self._spill_lock:
+                    os.replace(path, replay)
+            except FileNotFoundError:
+                continue
+            try:
+                self._replay_file(replay)
+            except OSError:
+                continue  # left on disk; the next start tries it again
+
+    def _replay_file(self, replay):
+        # Read the whole file before queueing anything: if reading fails,
+        # nothing has been sent yet and a later replay starts over cleanly.
+        with open(replay, "rb") as fh:
+            lines = fh.readlines()
+
+        overflow = []
+        for line in lines:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue  # blank, torn by a crash mid-write, or not UTF-8
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                overflow.append(event)
+        if overflow:
+            self._spill(overflow)
+            self.spilled -= len(overflow)
+        os.remove(replay)
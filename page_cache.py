@@ -0,0 +1,186 @@
+"""Rendered-page cache and persistent Jinja bytecode.
+
+Pages such as about, index and the projects list only depend on static
+templates, a little context and whether the visitor is logged in (the
+navbar). ``PageCache`` keeps each rendered page as a *shell* keyed on
+
+    (template, generation, login flags, normalized context)
+
+and serves it without touching Jinja again. The daily tip changes
+independently of the page, so the shell holds a placeholder where
+base.html would print it; every response renders the small
+``_daily_tip.html`` fragment and splices it in. Responses carry an ETag
+built from the shell's digest and the tip's, answer ``If-None-Match``
+with 304, and may be kept by the browser until the daily tip changes.
+
+``invalidate(template)`` bumps that template's generation, so writes (a
+new project) make every cached variant of the page stale at once. With a
+``stamp_dir`` the generation is a ``cache.FileStamp`` there, which every
+worker on the host checks (one ``stat()`` per page); without one it only
+lives in this process and other workers serve their old shell until it
+expires.
+
+``init_app`` can also give the app a ``FileSystemBytecodeCache``: compiled
+templates are written to disk, so a freshly started worker loads them
+instead of parsing and compiling every template again.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app, make_response, render_template, request, session
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
+
+from cache import MISSING, FileStamp, TTLCache
+
+TIP_SLOT = "<!--daily-tip-->"
+TIP_TEMPLATE = "_daily_tip.html"
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAXSIZE = 512
+
+
+class PageCache:
+    """``tips`` returns the ``tips.TipSchedule`` behind ``daily_tip`` (it is
+    called on first use, so the catalog loads lazily). The tip fragment is
+    then kept per tip and responses may be cached by the browser until the
+    tip changes. Without it the fragment goes through
+    ``render_template`` on every response and pages are always revalidated."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL, tips=None, stamp_dir=None):
+        self.shells = TTLCache(maxsize, ttl)
+        self.tips = tips
+        self.stamp_dir = stamp_dir
+        self._tips = {}
+        self._generations = {}
+        self._stamps = {}
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.not_modified = 0
+
+    def _key(self, template, context):
+        flags = (bool(session.get("username")), bool(session.get("admin")))
+        normalized = json.dumps(context, sort_keys=True, default=str, separators=(",", ":"))
+        return template, self._generation(template), flags, normalized
+
+    def _stamp(self, template):
+        stamp = self._stamps.get(template)
+        if stamp is None:
+            name = "page-" + template.replace("/", "_")
+            stamp = self._stamps[template] = FileStamp(os.path.join(self.stamp_dir, name))
+        return stamp
+
+    def _generation(self, template):
+        local = self._generations.get(template, 0)
+        if self.stamp_dir is None:
+            return local
+        return local, self._stamp(template).read()
+
+    def shell(self, template, loader=None, **context):
+        """``(html, digest)`` of the page with ``TIP_SLOT`` where the tip goes.
+
+        ``context`` is part of the cache key; ``loader()`` is only called on
+        a miss and returns extra context (e.g. rows from storage) that is
+        fully determined by the keyed context.
+        """
+        key = self._key(template, context)
+        shell = self.shells.get(key)
+        if shell is MISSING:
+            extra = loader() if loader else {}
+            html = render_template(template, daily_tip_slot=Markup(TIP_SLOT), **context, **extra)
+            shell = html, _digest(html)
+            self.shells.set(key, shell)
+            self.renders += 1
+        return shell
+
+    def tip_fragment(self):
+        """``(html, digest)`` of the daily tip fragment."""
+        if self.tips is None:
+            html = render_template(TIP_TEMPLATE)
+            return html, _digest(html)
+        tip = self.tips().tip(session.get("username"))
+        key = (tip["tip"], tip["quote"])
+        fragment = self._tips.get(key)
+        if fragment is None:
+            if len(self._tips) >= 1024:
+                self._tips.clear()
+            html = current_app.jinja_env.get_template(TIP_TEMPLATE).render(daily_tip=tip)
+            fragment = self._tips[key] = html, _digest(html)
+        return fragment
+
+    def render(self, template, loader=None, max_age=None, **context):
+        """A conditional response for ``template`` with the current tip in place.
+
+        Browsers may reuse it until the tip changes, or for ``max_age``
+        seconds if that is shorter; ``max_age=0`` means always revalidate.
+        """
+        html, digest = self.shell(template, loader, **context)
+        tip, tip_digest = self.tip_fragment()
+        etag = f"{digest}-{tip_digest}"
+
+        # Weak comparison: CompressionMiddleware sends the tag back as W/"...".
+        if request.if_none_match.contains_weak(etag):
+            self.not_modified += 1
+            response = current_app.response_class(status=304)
+        else:
+            response = make_response(html.replace(TIP_SLOT, tip, 1))
+        response.set_etag(etag)
+        response.vary.add("Cookie")
+        self._set_lifetime(response, max_age)
+        return response
+
+    def _set_lifetime(self, response, max_age):
+        lifetime, expires = 0, None
+        if self.tips is not None:
+            schedule = self.tips()
+            lifetime, expires = schedule.max_age(), schedule.expires()
+        if max_age is not None and max_age < lifetime:
+            lifetime = max_age
+            expires = datetime.now(timezone.utc) + timedelta(seconds=max_age)
+        if lifetime <= 0:
+            # Let browsers keep the page but revalidate it, which costs a 304.
+            response.headers["Cache-Control"] = "no-cache"
+            return
+        # Private: the navbar and the tip bucket depend on the session.
+        response.headers["Cache-Control"] = f"private, max-age={lifetime}"
+        response.expires = expires
+
+    def invalidate(self, template):
+        with self._lock:
+            self._generations[template] = self._generations.get(template, 0) + 1
+        if self.stamp_dir is not None:
+            self._stamp(template).bump()
+
+    def clear(self):
+        self.shells.clear()
+
+    def stats(self):
+        stats = self.shells.stats()
+        stats.update(renders=self.renders, not_modified=self.not_modified)
+        return stats
+
+
+def _digest(text):
+    return hashlib.blake2b(text.encode(), digest_size=12).hexdigest()
+
+
+# -------------------- FLASK BINDING --------------------
+
+def init_app(app, page_cache=None, bytecode_dir=None):
+    """Attach ``page_cache`` to ``app`` and, with ``bytecode_dir``, a
+    persistent Jinja bytecode cache (set before any template is loaded)."""
+    if bytecode_dir:
+        os.makedirs(bytecode_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
+    app.extensions["page_cache"] = page_cache or PageCache()
+
+
+def get_page_cache():
+    return current_app.extensions["page_cache"]
+
+
+def render_cached(template, loader=None, **context):
+    return get_page_cache().render(template, loader, **context)
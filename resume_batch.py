@@ -0,0 +1,261 @@
+"""Batch resume scoring for cohort intake.
+
+Input is either NDJSON (one ``{"id", "text", "role"}`` object per line) or
+a zip of ``.txt`` resumes. Documents are grouped into chunks and scored on
+a process pool; results come back as NDJSON lines in completion order,
+followed by one ``{"summary": ...}`` line with throughput figures.
+
+An input line or zip member that cannot be used (bad JSON, not an object,
+over the size cap, a damaged member) becomes an ``{"id", "error"}`` line
+in the output instead of stopping the batch. A zip is checked up front:
+more than ``MAX_ZIP_MEMBERS`` resumes or ``MAX_ZIP_BYTES`` of declared
+uncompressed text raises ``BatchRejected`` before anything is scored, and
+members are read under the same byte budget as single uploads.
+
+The web endpoint scores on one shared pool (``get_pool()``, at most
+``BATCH_POOL_SIZE`` processes, started with ``spawn`` since the web
+worker is threaded) and runs at most ``MAX_CONCURRENT_BATCHES`` batches
+at a time (``try_acquire_slot()``).
+"""
+import json
+import multiprocessing
+import os
+import threading
+import time
+import zipfile
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from itertools import islice
+
+from resume_ingest import DEFAULT_MAX_BYTES, ResumeTooLarge, _Budget, _read_chunks
+from resume_scoring import score_resume
+
+DEFAULT_CHUNK_SIZE = 64
+
+MAX_DOCUMENT_BYTES = int(os.getenv("BATCH_MAX_DOCUMENT_BYTES", DEFAULT_MAX_BYTES))
+MAX_ZIP_MEMBERS = int(os.getenv("BATCH_MAX_ZIP_MEMBERS", "10000"))
+MAX_ZIP_BYTES = int(os.getenv("BATCH_MAX_ZIP_BYTES", 256 * 1024 * 1024))
+
+POOL_SIZE = int(os.getenv("BATCH_POOL_SIZE", min(os.cpu_count() or 1, 4)))
+MAX_CONCURRENT_BATCHES = int(os.getenv("BATCH_MAX_CONCURRENT", "2"))
+
+# Errors a damaged zip member can raise while it is read.
+MEMBER_ERRORS = (zipfile.BadZipFile, zlib.error, EOFError, OSError, NotImplementedError)
+
+
+class BatchRejected(Exception):
+    pass
+
+
+# -------------------- INPUT --------------------
+
+def _read_lines(stream, limit):
+    """Lines of ``stream``; one longer than ``limit`` bytes comes out as
+    None, its rest skipped in ``limit``-sized reads rather than held."""
+    while True:
+        line = stream.readline(limit + 1)
+        if not line:
+            return
+        if len(line) > limit and not line.endswith(b"\n"):
+            while True:
+                rest = stream.readline(limit + 1)
+                if not rest or rest.endswith(b"\n"):
+                    break
+            yield None
+            continue
+        yield line
+
+
+def read_ndjson(stream, default_role=""):
+    """Documents from a binary NDJSON stream, plus error records."""
+    for lineno, line in enumerate(_read_lines(stream, MAX_DOCUMENT_BYTES), 1):
+        if line is None:
+            yield {"id": lineno, "error": f"line exceeds {MAX_DOCUMENT_BYTES} bytes"}
+            continue
+        line = line.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield {"id": lineno, "error": "invalid JSON"}
+            continue
+        if not isinstance(row, dict):
+            yield {"id": lineno, "error": "expected a JSON object"}
+            continue
+        doc = {
+            "id": row.get("id", lineno),
+            "text": row.get("text", ""),
+            "role": row.get("role", default_role),
+        }
+        if not isinstance(doc["text"], str) or not isinstance(doc["role"], str):
+            yield {"id": doc["id"], "error": "text and role must be strings"}
+            continue
+        yield doc
+
+
+def read_zip(fileobj, default_role=""):
+    """Check the archive against the caps now; return a generator of docs.
+
+    Raises ``BatchRejected`` for a non-zip or one over the caps.
+    """
+    try:
+        archive = zipfile.ZipFile(fileobj)
+    except (zipfile.BadZipFile, OSError):
+        raise BatchRejected("not a valid zip file")
+    members = [
+        info for info in archive.infolist()
+        if not info.is_dir() and info.filename.lower().endswith(".txt")
+    ]
+    if len(members) > MAX_ZIP_MEMBERS:
+        archive.close()
+        raise BatchRejected(f"zip holds more than {MAX_ZIP_MEMBERS} resumes")
+    if sum(info.file_size for info in members) > MAX_ZIP_BYTES:
+        archive.close()
+        raise BatchRejected(f"zip inflates to more than {MAX_ZIP_BYTES} bytes")
+    return _read_members(archive, members, default_role)
+
+
+def _read_members(archive, members, default_role):
+    # The declared sizes passed the caps; the budgets also bound what is
+    # actually inflated, in case a header lies.
+    inflated = 0
+    with archive:
+        for info in members:
+            budget = _Budget(MAX_DOCUMENT_BYTES)
+            try:
+                with archive.open(info) as member:
+                    data = b"".join(_read_chunks(member, budget))
+                doc = {"id": info.filename, "text": data.decode("utf-8", errors="replace"), "role": default_role}
+            except ResumeTooLarge as e:
+                doc = {"id": info.filename, "error": str(e)}
+            except MEMBER_ERRORS:
+                doc = {"id": info.filename, "error": "damaged zip member"}
+            inflated += budget.used
+            if inflated > MAX_ZIP_BYTES:
+                yield {"id": info.filename, "error": f"zip inflates to more than {MAX_ZIP_BYTES} bytes"}
+                return
+            yield doc
+
+
+def read_documents(fileobj, filename, default_role=""):
+    if filename.lower().endswith(".zip"):
+        return read_zip(fileobj, default_role)
+    return read_ndjson(fileobj, default_role)
+
+
+# -------------------- SCORING --------------------
+
+def _score_chunk(chunk):
+    started = time.perf_counter()
+    results = [
+        doc if "error" in doc else {"id": doc["id"], **score_resume(doc["text"], doc["role"])}
+        for doc in chunk
+    ]
+    return os.getpid(), time.perf_counter() - started, results
+
+
+def _chunks(docs, size):
+    docs = iter(docs)
+    while True:
+        chunk = list(islice(docs, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def score_batch(docs, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, pool=None):
+    """Yield one result dict per document, then a summary dict.
+
+    At most ``2 * workers`` chunks are in flight, so a large input is read
+    only as fast as the pool can score it. ``workers=0`` scores in-process.
+    Without ``pool`` a private pool of ``workers`` processes is started
+    for the batch (the CLI); with one, ``workers`` is capped at its size.
+    """
+    if pool is not None:
+        workers = min(workers or POOL_SIZE, POOL_SIZE) if workers != 0 else 0
+    elif workers is None:
+        workers = os.cpu_count() or 1
+    started = time.perf_counter()
+    per_worker = {}
+    total = errors = 0
+
+    def collect(pid, busy, results):
+        nonlocal total, errors
+        count, spent = per_worker.get(pid, (0, 0.0))
+        per_worker[pid] = (count + len(results), spent + busy)
+        total += len(results)
+        errors += sum(1 for result in results if "error" in result)
+        return results
+
+    def run(pool):
+        pending = set()
+        for chunk in _chunks(docs, chunk_size):
+            pending.add(pool.submit(_score_chunk, chunk))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from collect(*future.result())
+        for future in as_completed(pending):
+            yield from collect(*future.result())
+
+    if workers == 0:
+        for chunk in _chunks(docs, chunk_size):
+            yield from collect(*_score_chunk(chunk))
+    elif pool is not None:
+        yield from run(pool)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as own_pool:
+            yield from run(own_pool)
+
+    elapsed = time.perf_counter() - started
+    yield {"summary": {
+        "documents": total,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "docs_per_sec": round(total / elapsed, 1) if elapsed else None,
+        "workers": [
+            {
+                "pid": pid,
+                "documents": count,
+                "docs_per_sec": round(count / busy, 1) if busy else None,
+            }
+            for pid, (count, busy) in sorted(per_worker.items())
+        ],
+    }}
+
+
+# -------------------- SHARED POOL --------------------
+
+_pool = None
+_pool_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(MAX_CONCURRENT_BATCHES)
+
+
+def get_pool():
+    """The process-wide scoring pool, started on first use.
+
+    Workers are spawned rather than forked: forking a threaded web worker
+    can copy locks held by other threads into the child.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=POOL_SIZE, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def try_acquire_slot():
+    """Claim one of the ``MAX_CONCURRENT_BATCHES`` slots without waiting."""
+    return _slots.acquire(blocking=False)
+
+
+def release_slot():
+    _slots.release()
+
+
+def to_ndjson(results):
+    for result in results:
+        yield json.dumps(result) + "\n"
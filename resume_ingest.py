@@ -0,0 +1,243 @@
+"""Streaming resume upload ingestion.
+
+Uploads are read in fixed-size chunks and turned into text incrementally
+(plain text, DOCX and simple text-based PDFs). The text is fed straight
+into a ``matcher.Scanner`` so the whole document -- let alone a lowercased
+copy of it -- is never held in memory. Every upload is subject to a hard
+byte cap that covers both the bytes read and the bytes decompressed, so a
+zip or deflate bomb stops at the same limit as a plain oversized file.
+"""
+import codecs
+import re
+import tempfile
+import zipfile
+import zlib
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class ResumeTooLarge(Exception):
+    pass
+
+
+class UnsupportedResume(Exception):
+    pass
+
+
+class _Budget:
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.used = 0
+
+    def charge(self, n):
+        self.used += n
+        if self.used > self.max_bytes:
+            raise ResumeTooLarge(f"resume exceeds {self.max_bytes} bytes")
+
+
+def _read_chunks(stream, budget, chunk_size=CHUNK_SIZE):
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        budget.charge(len(chunk))
+        yield chunk
+
+
+# -------------------- PLAIN TEXT --------------------
+
+def iter_text(stream, budget):
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in _read_chunks(stream, budget):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+# -------------------- DOCX --------------------
+
+# Anything a damaged archive or document can raise while it is read:
+# a bad zip, a CRC mismatch or corrupt deflate data in the member,
+# malformed XML, or an unsupported compression method.
+DOCX_ERRORS = (zipfile.BadZipFile, KeyError, zlib.error, OSError, EOFError, NotImplementedError, ParseError)
+
+
+def iter_docx(stream, budget):
+    # The zip central directory sits at the end of the file, so DOCX needs
+    # a seekable stream (Flask spools uploads to a temporary file). The
+    # document body itself is inflated and parsed piece by piece.
+    try:
+        archive = zipfile.ZipFile(stream)
+        with archive, archive.open("word/document.xml") as member:
+            parser = XMLPullParser(events=("end",))
+            for chunk in _read_chunks(member, budget):
+                parser.feed(chunk)
+                yield from _docx_text(parser)
+            parser.close()
+            yield from _docx_text(parser)
+    except DOCX_ERRORS:
+        raise UnsupportedResume("not a valid .docx file")
+
+
+def _docx_text(parser):
+    for _, elem in parser.read_events():
+        if elem.tag == WORD_NS + "t":
+            if elem.text:
+                yield elem.text
+        elif elem.tag == WORD_NS + "tab":
+            yield " "
+        elif elem.tag == WORD_NS + "p":
+            yield "\n"
+            elem.clear()
+
+
+# -------------------- PDF --------------------
+# Handles the common "simple" PDF: text drawn with Tj/TJ from content
+# streams that are uncompressed or FlateDecode'd. Fonts with custom
+# encodings, object streams and scanned pages are out of scope.
+
+STREAM_START_RE = re.compile(rb"(?<!end)stream\r?\n")
+STREAM_END = b"endstream"
+TEXT_OP_RE = re.compile(rb"\((?:[^()\\]|\\.)*\)\s*(?:Tj|'|\")|\[(?:[^\]\\]|\\.)*\]\s*TJ|T\*|ET", re.S)
+LITERAL_RE = re.compile(rb"\(((?:[^()\\]|\\.)*)\)", re.S)
+PDF_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+ESCAPE_RE = re.compile(rb"\\([0-7]{1,3}|.)", re.S)
+
+
+def _unescape(raw):
+    def sub(m):
+        esc = m.group(1)
+        if esc[:1].isdigit():
+            return bytes([int(esc, 8) & 0xFF])
+        return PDF_ESCAPES.get(esc, esc if esc != b"\n" else b"")
+    return ESCAPE_RE.sub(sub, raw)
+
+
+def _content_text(content):
+    for m in TEXT_OP_RE.finditer(content):
+        op = m.group()
+        if op in (b"T*", b"ET"):
+            yield "\n"
+            continue
+        pieces = [_unescape(s) for s in LITERAL_RE.findall(op)]
+        yield b"".join(pieces).decode("latin-1") + " "
+
+
+def iter_pdf(stream, budget):
+    buf = b""
+    chunks = _read_chunks(stream, budget)
+    for chunk in chunks:
+        buf += chunk
+        while True:
+            start = STREAM_START_RE.search(buf)
+            if not start:
+                # Keep enough of the tail to recognise a split "stream" keyword
+                # and the object dictionary that precedes it.
+                buf = buf[-1024:]
+                break
+            header = buf[max(0, start.start() - 1024):start.start()]
+            flate = b"/FlateDecode" in header[header.rfind(b"<<"):]
+            body, buf = _read_stream(buf[start.end():], chunks, flate, budget)
+            if body is None:
+                return
+            yield from _content_text(body)
+
+
+def _read_stream(buf, chunks, flate, budget):
+    """Consume one stream body; return (content, remaining buffer)."""
+    inflater = zlib.decompressobj() if flate else None
+    content = []
+
+    def take(data):
+        if inflater is None:
+            content.append(data)
+            return
+        try:
+            # Bound each inflate step so a deflate bomb cannot overshoot the cap.
+            out = inflater.decompress(data, CHUNK_SIZE)
+            while True:
+                budget.charge(len(out))
+                content.append(out)
+                if not inflater.unconsumed_tail:
+                    break
+                out = inflater.decompress(inflater.unconsumed_tail, CHUNK_SIZE)
+        except zlib.error:
+            pass  # Not real deflate data (e.g. an image); skip it.
+
+    while True:
+        end = buf.find(STREAM_END)
+        if end != -1:
+            take(buf[:end])
+            return b"".join(content), buf[end + len(STREAM_END):]
+        # Hold back a few bytes in case "endstream" straddles two chunks.
+        keep = len(STREAM_END)
+        take(buf[:-keep])
+        buf = buf[-keep:]
+        nxt = next(chunks, None)
+        if nxt is None:
+            return None, b""
+        buf += nxt
+
+
+# -------------------- DISPATCH --------------------
+
+EXTRACTORS = {
+    ".txt": iter_text,
+    ".docx": iter_docx,
+    ".pdf": iter_pdf,
+}
+
+CONTENT_TYPES = {
+    "text/plain": ".txt",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+    "application/pdf": ".pdf",
+}
+
+
+def extractor_for(filename="", content_type=""):
+    name = (filename or "").lower()
+    for ext, extractor in EXTRACTORS.items():
+        if name.endswith(ext):
+            return extractor
+    ext = CONTENT_TYPES.get((content_type or "").split(";")[0].strip())
+    if ext:
+        return EXTRACTORS[ext]
+    raise UnsupportedResume("upload a .txt, .docx or .pdf file")
+
+
+def _seekable(stream):
+    try:
+        return stream.seekable()
+    except AttributeError:
+        return False
+
+
+def _spool(stream, budget):
+    # Small uploads stay in memory; larger ones go to disk, never both.
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    for chunk in _read_chunks(stream, budget):
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def scan_upload(stream, matcher, filename="", content_type="", max_bytes=DEFAULT_MAX_BYTES):
+    """Stream an uploaded resume through ``matcher`` and return the keywords found."""
+    extractor = extractor_for(filename, content_type)
+    budget = _Budget(max_bytes)
+    if extractor is iter_docx and not _seekable(stream):
+        stream = _spool(stream, budget)
+        budget = _Budget(max_bytes)
+
+    scanner = matcher.scanner()
+    for text in extractor(stream, budget):
+        scanner.feed(text)
+    return scanner.close()
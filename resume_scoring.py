@@ -0,0 +1,57 @@
+"""Resume scoring rules shared by /resume and the batch scorer.
+
+Everything here is pure (no Flask, no database) so it can run inside
+worker processes.
+"""
+from matcher import KeywordMatcher
+
+RESUME_SECTIONS = {
+    "education": ["education", "degree", "college", "university"],
+    "skills": ["skills", "technologies", "tools"],
+    "projects": ["project", "projects"],
+    "experience": ["experience", "internship", "work"]
+}
+
+RESUME_ROLE_SKILLS = {
+    "data scientist": ["python", "pandas", "numpy", "machine learning", "sql"],
+    "web developer": ["html", "css", "javascript", "react", "flask"],
+    "ai engineer": ["python", "machine learning", "deep learning", "tensorflow"]
+}
+
+# Built once: every section and skill keyword is found in a single pass.
+RESUME_MATCHER = KeywordMatcher(
+    [k for keywords in RESUME_SECTIONS.values() for k in keywords]
+    + [s for skills in RESUME_ROLE_SKILLS.values() for s in skills]
+)
+
+
+def score_found(found, target_role):
+    """Score a resume from the set of keywords found in it."""
+    score = 0
+    strengths = []
+    missing = []
+
+    # ---------- BASIC CHECKS ----------
+    for section, keywords in RESUME_SECTIONS.items():
+        if any(k in found for k in keywords):
+            score += 15
+            strengths.append(section.capitalize())
+        else:
+            missing.append(section.capitalize())
+
+    # ---------- SKILL GAP ----------
+    required_skills = RESUME_ROLE_SKILLS.get(target_role.lower(), [])
+    missing_skills = [s for s in required_skills if s not in found]
+
+    score += max(0, 40 - len(missing_skills) * 8)
+
+    return {
+        "score": min(score, 100),
+        "strengths": strengths,
+        "missing_sections": missing,
+        "missing_skills": missing_skills
+    }
+
+
+def score_resume(resume_text, target_role):
+    return score_found(RESUME_MATCHER.found(resume_text), target_role)
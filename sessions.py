@@ -0,0 +1,486 @@
+"""Server-side sessions.
+
+Flask's default session is the whole dict, serialized and HMAC-signed into
+a cookie on every response that touches it. ``ServerSessionInterface``
+keeps the data in a store instead and the cookie only carries a random
+session id:
+
+* ``SQLiteSessionStore`` -- the ``sessions`` table of career.db;
+* ``MemorySessionStore`` -- a bounded in-process LRU (one process only);
+* ``FileSessionStore`` -- one file per session in a local directory;
+* ``DynamoSessionStore`` -- a DynamoDB table with a TTL attribute.
+
+The session is lazy: opening it only reads the cookie, and the store is
+hit the first time a view or template reads or writes a key. Pages built
+on base.html always do (the navbar and the daily tip look at
+``username``), so the saving there is the cookie size and signing;
+redirects, JSON endpoints and /assets/ never load it. It is written back
+only when it was modified, and deleted (with its cookie) once it is
+emptied, e.g. by ``session.clear()`` on logout.
+
+Clearing the session, or setting one of ``PRIVILEGED_KEYS`` (logging in),
+drops its id, so what is stored next gets a fresh one: an id planted
+before login never becomes a logged-in session.
+
+Stored sessions expire ``PERMANENT_SESSION_LIFETIME`` after they were last
+written. Values are encoded with ``encode()``, a small tagged binary format
+for None, bools, ints, floats, str, bytes, lists (tuples come back as lists)
+and dicts.
+"""
+import os
+import re
+import secrets
+import struct
+import tempfile
+import threading
+import time
+
+from flask.sessions import SessionInterface, SessionMixin
+
+import db
+from cache import MISSING, TTLCache
+
+FORMAT_VERSION = 1
+SESSION_ID = re.compile(r"[A-Za-z0-9_-]{32}")
+
+DEFAULT_MAXSIZE = 10000
+DEFAULT_PURGE_EVERY = 1000
+
+# Setting any of these rotates the session id (see ServerSession.regenerate).
+PRIVILEGED_KEYS = frozenset(("user_id", "username", "admin"))
+
+
+# -------------------- ENCODING --------------------
+
+def _varint(n, out):
+    while n > 0x7F:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _encode(value, out):
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        out += b"i"
+        # Zigzag, so small negative numbers stay short too.
+        _varint(value << 1 if value >= 0 else (-value << 1) - 1, out)
+    elif isinstance(value, float):
+        out += b"f" + struct.pack("<d", value)
+    elif isinstance(value, str):
+        data = value.encode()
+        out += b"s"
+        _varint(len(data), out)
+        out += data
+    elif isinstance(value, bytes):
+        out += b"b"
+        _varint(len(value), out)
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out += b"l"
+        _varint(len(value), out)
+        for item in value:
+            _encode(item, out)
+    elif isinstance(value, dict):
+        out += b"d"
+        _varint(len(value), out)
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    else:
+        raise TypeError(f"cannot store {type(value).__name__} in a session")
+
+
+def encode(data):
+    out = bytearray([FORMAT_VERSION])
+    _encode(data, out)
+    return bytes(out)
+
+
+def _read_varint(buf, pos):
+    n = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _decode(buf, pos):
+    tag = buf[pos:pos + 1]
+    pos += 1
+    if tag == b"N":
+        return None, pos
+    if tag == b"T":
+        return True, pos
+    if tag == b"F":
+        return False, pos
+    if tag == b"i":
+        n, pos = _read_varint(buf, pos)
+        return (n >> 1) ^ -(n & 1), pos
+    if tag == b"f":
+        return struct.unpack_from("<d", buf, pos)[0], pos + 8
+    if tag in (b"s", b"b"):
+        size, pos = _read_varint(buf, pos)
+        data = bytes(buf[pos:pos + size])
+        if len(data) != size:
+            raise ValueError("truncated session data")
+        return (data.decode() if tag == b"s" else data), pos + size
+    if tag == b"l":
+        size, pos = _read_varint(buf, pos)
+        items = []
+        for _ in range(size):
+            item, pos = _decode(buf, pos)
+            items.append(item)
+        return items, pos
+    if tag == b"d":
+        size, pos = _read_varint(buf, pos)
+        items = {}
+        for _ in range(size):
+            key, pos = _decode(buf, pos)
+            items[key], pos = _decode(buf, pos)
+        return items, pos
+    raise ValueError(f"bad session tag {tag!r}")
+
+
+def decode(data):
+    """The dict ``encode()`` made, or None if ``data`` is not one."""
+    if not data or data[0] != FORMAT_VERSION:
+        return None
+    try:
+        value, pos = _decode(data, 1)
+    except (ValueError, IndexError, struct.error, UnicodeDecodeError):
+        return None
+    return value if pos == len(data) and isinstance(value, dict) else None
+
+
+# -------------------- STORES --------------------
+# load(sid) -> bytes or None, save(sid, data, lifetime), delete(sid).
+
+class MemorySessionStore:
+    """LRU of encoded sessions; lost on restart and not shared by workers."""
+
+    name = "memory"
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.entries = TTLCache(maxsize)
+
+    def load(self, sid):
+        data = self.entries.get(sid)
+        return None if data is MISSING else data
+
+    def save(self, sid, data, lifetime):
+        self.entries.set(sid, data, ttl=lifetime)
+
+    def delete(self, sid):
+        self.entries.delete(sid)
+
+
+class SQLiteSessionStore:
+    """The ``sessions`` table (see migrations.py) through ``db.ConnectionPool``.
+
+    Expired rows are skipped on load and purged every ``purge_every`` saves.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, pool, purge_every=DEFAULT_PURGE_EVERY):
+        self.pool = pool
+        self.purge_every = purge_every
+        self._saves = 0
+        self._lock = threading.Lock()
+
+    def load(self, sid):
+        with db.connection(self.pool) as conn:
+            row = conn.execute(
+                "SELECT data FROM sessions WHERE id = ? AND expires > ?", (sid, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(self, sid, data, lifetime):
+        with self._lock:
+            self._saves += 1
+            purge = self._saves % self.purge_every == 0
+        now = time.time()
+        with db.connection(self.pool) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (id, data, expires) VALUES (?, ?, ?)",
+                (sid, data, now + lifetime),
+            )
+            if purge:
+                conn.execute("DELETE FROM sessions WHERE expires <= ?", (now,))
+            conn.commit()
+
+    def delete(self, sid):
+        with db.connection(self.pool) as conn:
+            conn.execute("DELETE FROM sessions WHERE id = ?", (sid,))
+            conn.commit()
+
+
+class FileSessionStore:
+    """One file per session under ``directory``; the mtime dates the write.
+
+    Expired files are skipped on load and removed every ``purge_every``
+    saves.
+    """
+
+    name = "file"
+
+    def __init__(self, directory, purge_every=DEFAULT_PURGE_EVERY):
+        self.directory = directory
+        self.purge_every = purge_every
+        self._saves = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, sid):
+        return os.path.join(self.directory, sid)
+
+    @staticmethod
+    def _expired(path, now):
+        with open(path, "rb") as fh:
+            lifetime, = struct.unpack("<I", fh.read(4))
+        return os.path.getmtime(path) + lifetime <= now
+
+    def load(self, sid):
+        path = self._path(sid)
+        try:
+            with open(path, "rb") as fh:
+                lifetime, = struct.unpack("<I", fh.read(4))
+                data = fh.read()
+            if os.path.getmtime(path) + lifetime <= time.time():
+                return None
+        except (OSError, struct.error):
+            return None
+        return data
+
+    def save(self, sid, data, lifetime):
+        # Write-then-rename, so a concurrent load never reads half a session.
+        fd, tmp = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(struct.pack("<I", int(lifetime)))
+            fh.write(data)
+        os.replace(tmp, self._path(sid))
+
+        with self._lock:
+            self._saves += 1
+            purge = self._saves % self.purge_every == 0
+        if purge:
+            self.purge()
+
+    def purge(self):
+        """Remove expired session files; returns how many went."""
+        removed = 0
+        now = time.time()
+        for entry in os.scandir(self.directory):
+            if not SESSION_ID.fullmatch(entry.name):
+                continue
+            try:
+                if self._expired(entry.path, now):
+                    os.remove(entry.path)
+                    removed += 1
+            except (OSError, struct.error):
+                # Rewritten or removed by another worker meanwhile.
+                continue
+        return removed
+
+    def delete(self, sid):
+        try:
+            os.remove(self._path(sid))
+        except FileNotFoundError:
+            pass
+
+
+class DynamoSessionStore:
+    """A table keyed on ``id``; enable DynamoDB TTL on ``expires`` to have
+    expired items removed (loads skip them until then)."""
+
+    name = "dynamodb"
+
+    def __init__(self, table):
+        self.table = table
+
+    def load(self, sid):
+        item = self.table.get_item(Key={"id": sid}).get("Item")
+        if not item or item["expires"] <= time.time():
+            return None
+        return bytes(item["data"])
+
+    def save(self, sid, data, lifetime):
+        self.table.put_item(Item={"id": sid, "data": data, "expires": int(time.time() + lifetime)})
+
+    def delete(self, sid):
+        self.table.delete_item(Key={"id": sid})
+
+
+# -------------------- SESSION --------------------
+
+class ServerSession(SessionMixin):
+    """Loads its data from the store on first use."""
+
+    def __init__(self, store, sid=None):
+        self.store = store
+        self.sid = sid
+        self.new = sid is None
+        self.modified = False
+        self.accessed = False
+        self.dropped = None
+        self.stored = False
+        self._data = None
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self.accessed = True
+            self.stored = self.sid is not None
+            data = decode(self.store.load(self.sid)) if self.stored else None
+            if data is None:
+                # Unknown or expired: never adopt an id the store did not issue.
+                self.sid, self.new = None, True
+            self._data = data or {}
+        return self._data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        if key in PRIVILEGED_KEYS and self.data.get(key) != value:
+            self.regenerate()
+        self.data[key] = value
+        self.modified = True
+
+    def __delitem__(self, key):
+        del self.data[key]
+        self.modified = True
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def regenerate(self):
+        """Keep the data under a fresh id; the old entry is deleted on save."""
+        self.data  # load first: the stored contents move to the new id
+        if self.sid is not None:
+            self.dropped, self.sid = self.sid, None
+        self.modified = True
+
+    def clear(self):
+        self.regenerate()
+        self._data = {}
+
+
+class ServerSessionInterface(SessionInterface):
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.loads = 0
+        self.saves = 0
+        self.deletes = 0
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid is not None and not SESSION_ID.fullmatch(sid):
+            sid = None
+        with self._lock:
+            self.opened += 1
+        return ServerSession(self.store, sid)
+
+    def save_session(self, app, session, response):
+        if not session.loaded:
+            return
+        if session.stored:
+            self._count("loads")
+        if not session.modified:
+            return
+
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+        response.vary.add("Cookie")
+
+        if session.dropped is not None:
+            self.store.delete(session.dropped)
+            self._count("deletes")
+        if not session:
+            if session.sid is not None:
+                self.store.delete(session.sid)
+                self._count("deletes")
+            if not session.new:
+                response.delete_cookie(
+                    name, domain=domain, path=path, secure=secure, samesite=samesite, httponly=httponly
+                )
+            return
+
+        rotated = session.sid is None
+        if rotated:
+            session.sid = secrets.token_urlsafe(24)
+        lifetime = int(app.permanent_session_lifetime.total_seconds())
+        self.store.save(session.sid, encode(dict(session)), lifetime)
+        self._count("saves")
+        if rotated or session.permanent:
+            response.set_cookie(
+                name, session.sid, expires=self.get_expiration_time(app, session),
+                httponly=httponly, domain=domain, path=path, secure=secure, samesite=samesite,
+            )
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "store": self.store.name,
+                "opened": self.opened,
+                "loads": self.loads,
+                "saves": self.saves,
+                "deletes": self.deletes,
+            }
+
+
+# -------------------- FLASK BINDING --------------------
+
+def create_store(backend, pool=None, directory=None, table=None, maxsize=DEFAULT_MAXSIZE):
+    if backend == "sqlite":
+        return SQLiteSessionStore(pool)
+    if backend == "memory":
+        return MemorySessionStore(maxsize)
+    if backend == "file":
+        return FileSessionStore(directory)
+    if backend == "dynamodb":
+        return DynamoSessionStore(table)
+    raise ValueError(f"unknown session backend: {backend}")
+
+
+def init_app(app, store):
+    """Keep ``app``'s sessions in ``store``; None keeps Flask's cookie sessions."""
+    if store is None:
+        return None
+    interface = ServerSessionInterface(store)
+    app.session_interface = interface
+    app.extensions["sessions"] = interface
+    return interface
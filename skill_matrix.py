@@ -0,0 +1,78 @@
+"""Role x skill matrix stored as integer bitsets.
+
+Every distinct skill gets one bit; each role is the bitset of the skills
+it requires. A user's skills encode to a single bitset as well, so the gap
+against a role is ``required & ~known`` and its size is one ``bit_count``.
+Ranking every role by gap size is then one AND/popcount per role on
+machine-word-packed integers, with no per-skill Python loop.
+"""
+import heapq
+from functools import lru_cache
+
+from catalog import get_catalog
+
+
+class SkillMatrix:
+
+    def __init__(self, skill_maps):
+        self.skills = list(dict.fromkeys(s for skills in skill_maps.values() for s in skills))
+        self._bits = {skill: 1 << i for i, skill in enumerate(self.skills)}
+
+        self.roles = list(skill_maps)
+        self._required = {
+            role: (tuple(skills), self.encode(skills))
+            for role, skills in skill_maps.items()
+        }
+        # Parallel arrays for the all-roles scan.
+        self._role_masks = [self._required[role][1] for role in self.roles]
+        self._role_sizes = [mask.bit_count() for mask in self._role_masks]
+
+    def encode(self, skills):
+        """Bitset for ``skills``; names outside the catalog are ignored."""
+        mask = 0
+        bits = self._bits
+        for skill in skills:
+            mask |= bits.get(skill, 0)
+        return mask
+
+    def decode(self, mask):
+        skills = self.skills
+        out = []
+        while mask:
+            low = mask & -mask
+            out.append(skills[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+    def missing(self, role, known):
+        """Skills ``role`` requires that ``known`` lacks, in the role's own order."""
+        skills, _ = self._required.get(role, ((), 0))
+        known_mask = known if isinstance(known, int) else self.encode(known)
+        bits = self._bits
+        return [s for s in skills if not bits[s] & known_mask]
+
+    def closest_roles(self, known, limit=None):
+        """Rank every role by how many of its skills ``known`` is missing.
+
+        Returns ``(role, missing_count, required_count)`` tuples, smallest
+        gap first; ties keep catalog order. ``limit`` keeps only the top
+        entries using a partial selection instead of a full sort.
+        """
+        known_mask = known if isinstance(known, int) else self.encode(known)
+        # |required - known| == |required| - |required & known|; staying with
+        # non-negative ints avoids CPython's slower two's-complement path.
+        gaps = [
+            size - (mask & known_mask).bit_count()
+            for mask, size in zip(self._role_masks, self._role_sizes)
+        ]
+        order = range(len(gaps))
+        if limit is None:
+            ranked = sorted(order, key=gaps.__getitem__)
+        else:
+            ranked = heapq.nsmallest(limit, order, key=gaps.__getitem__)
+        return [(self.roles[i], gaps[i], self._role_sizes[i]) for i in ranked]
+
+
+@lru_cache(maxsize=None)
+def get_skill_matrix():
+    return SkillMatrix(get_catalog().skill_maps)
@@ -0,0 +1,118 @@
+/* CareerBot widget: toggle, streamed replies, draggable button (base.html) */
+const botBtn = document.getElementById("chatbot-button")
+const botBox = document.getElementById("chatbot-box")
+const closeBtn = document.getElementById("chatbot-close")
+const form = document.getElementById("chatbot-form")
+const input = document.getElementById("chatbot-input")
+const messages = document.getElementById("chatbot-messages")
+
+/* Toggle chatbot */
+botBtn.onclick = () => {
+    botBox.style.display = botBox.style.display === "flex" ? "none" : "flex"
+}
+
+closeBtn.onclick = () => {
+    botBox.style.display = "none"
+}
+
+/* Send message */
+form.onsubmit = e => {
+    e.preventDefault()
+    const msg = input.value.trim()
+    if (!msg) return
+
+    /* appendChild, not innerHTML +=, which would rebuild the list and
+       detach a bot bubble that is still streaming */
+    const mine = document.createElement("div")
+    mine.className = "user-message"
+    mine.textContent = msg
+    messages.appendChild(mine)
+    messages.scrollTop = messages.scrollHeight
+    input.value = ""
+
+    const bubble = document.createElement("div")
+    bubble.className = "bot-message"
+    messages.appendChild(bubble)
+
+    streamReply(msg, bubble).catch(() => {
+        /* Stream unavailable or over capacity: plain JSON reply */
+        fetch("/chat", {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify({ message: msg })
+        })
+        .then(res => res.json())
+        .then(data => {
+            bubble.textContent = data.reply
+            messages.scrollTop = messages.scrollHeight
+        })
+    })
+}
+
+/* Read the Server-Sent Events from /chat/stream, one word at a time */
+async function streamReply(msg, bubble) {
+    const res = await fetch("/chat/stream", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ message: msg })
+    })
+    if (!res.ok || !res.body) throw new Error(res.status)
+
+    const reader = res.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ""
+
+    while (true) {
+        const { value, done } = await reader.read()
+        if (done) break
+        buffer += decoder.decode(value, { stream: true })
+
+        const events = buffer.split("\n\n")
+        buffer = events.pop()
+        for (const raw of events) {
+            let name = "message"
+            let data = ""
+            for (const line of raw.split("\n")) {
+                if (line.startsWith("event:")) name = line.slice(6).trim()
+                else if (line.startsWith("data:")) data += line.slice(5).trim()
+            }
+            if (!data) continue  /* heartbeat comment */
+
+            const payload = JSON.parse(data)
+            if (name === "error") throw new Error(payload.error)
+            if (name === "done") {
+                bubble.textContent = payload.reply
+                messages.scrollTop = messages.scrollHeight
+                return
+            }
+            bubble.textContent += payload.token
+            messages.scrollTop = messages.scrollHeight
+        }
+    }
+    if (!bubble.textContent) throw new Error("empty stream")
+}
+
+/* ================= DRAGGABLE FLOATING BUTTON ================= */
+let isDragging = false
+let offsetX = 0
+let offsetY = 0
+
+botBtn.addEventListener("mousedown", e => {
+    isDragging = true
+    const rect = botBtn.getBoundingClientRect()
+    offsetX = e.clientX - rect.left
+    offsetY = e.clientY - rect.top
+})
+
+document.addEventListener("mousemove", e => {
+    if (!isDragging) return
+    botBtn.style.left = e.clientX - offsetX + "px"
+    botBtn.style.top = e.clientY - offsetY + "px"
+    botBtn.style.right = "auto"
+    botBtn.style.bottom = "auto"
+    botBtn.style.position = "fixed"
+})
+
+document.addEventListener("mouseup", () => {
+    isDragging = false
+})
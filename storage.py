@@ -0,0 +1,387 @@
+"""Storage backends for users, admins, profiles and projects.
+
+Routes talk to a ``Storage`` object instead of sqlite3 or boto3 directly,
+so the same view code runs on any backend:
+
+* ``SQLiteStorage`` -- career.db through the ``db`` connection pool;
+* ``DynamoStorage`` -- the Users/Admins/Profiles/Projects tables;
+* ``MemoryStorage`` -- dicts, for tests, demos and benchmarks.
+
+``create_storage()`` picks one from configuration (``STORAGE_BACKEND``)
+and ``init_app()`` binds it to an app; views reach it through
+``get_storage()``.
+
+Every backend returns plain dicts. A user's ``id`` is whatever keys their
+profile: the row id on SQLite, the username on DynamoDB. Lists come back
+one page at a time as ``Page(items, cursor)``; pass the cursor back in for
+the next page (None means there is none).
+"""
+import sqlite3
+import threading
+import uuid
+from itertools import count
+
+from flask import current_app
+
+import db
+import dynamo_access
+from dynamo_access import DEFAULT_PAGE_SIZE, Page
+
+PROFILE_FIELDS = ("career_goal", "current_level", "interests", "time_per_week")
+
+
+class Storage:
+    """The interface; every method is implemented by each backend."""
+
+    name = "base"
+
+    # ---- users ----
+    def create_user(self, username, email, password):
+        """Add a user; False if the username is taken."""
+        raise NotImplementedError
+
+    def check_user(self, username, password):
+        """``{"id", "username", "email"}`` if the credentials match, else None."""
+        raise NotImplementedError
+
+    def list_users(self, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        raise NotImplementedError
+
+    def get_users(self, usernames):
+        """Users for many usernames at once; unknown names are left out."""
+        raise NotImplementedError
+
+    # ---- admins ----
+    def create_admin(self, name, email, password):
+        """Add an admin; False if the email is taken."""
+        raise NotImplementedError
+
+    def check_admin(self, email, password):
+        raise NotImplementedError
+
+    # ---- profiles ----
+    def get_profile(self, user_id):
+        raise NotImplementedError
+
+    def save_profile(self, user_id, fields):
+        """Create or replace the profile of ``user_id`` from ``PROFILE_FIELDS``."""
+        raise NotImplementedError
+
+    # ---- projects ----
+    def create_project(self, title, description):
+        raise NotImplementedError
+
+    def list_projects(self, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        raise NotImplementedError
+
+    def stats(self):
+        return {"backend": self.name}
+
+
+def _public_user(user):
+    return {"id": user["id"], "username": user["username"], "email": user.get("email")}
+
+
+# -------------------- SQLITE --------------------
+
+class SQLiteStorage(Storage):
+    """career.db via ``db.ConnectionPool``.
+
+    Inside a request the connection borrowed by ``db.get_db()`` is reused,
+    so a request never holds two pool connections; outside one (CLI,
+    benchmarks) each call borrows and returns its own.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def _conn(self):
+        return db.connection(self.pool)
+
+    def _insert(self, sql, params):
+        with self._conn() as conn:
+            try:
+                conn.execute(sql, params)
+                conn.commit()
+            except sqlite3.IntegrityError:
+                conn.rollback()
+                return False
+        return True
+
+    def _fetchone(self, sql, params):
+        with self._conn() as conn:
+            row = conn.execute(sql, params).fetchone()
+        return dict(row) if row else None
+
+    def _page(self, sql, limit, cursor):
+        # Keyset pagination on the integer primary key.
+        after = int(cursor) if cursor and cursor.isdigit() else 0
+        with self._conn() as conn:
+            rows = [dict(r) for r in conn.execute(sql, (after, limit + 1))]
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return Page(rows, str(rows[-1]["id"]) if more else None)
+
+    def create_user(self, username, email, password):
+        return self._insert(
+            "INSERT INTO users (username, email, password) VALUES (?, ?, ?)",
+            (username, email, password)
+        )
+
+    def check_user(self, username, password):
+        return self._fetchone(
+            "SELECT id, username, email FROM users WHERE username=? AND password=?",
+            (username, password)
+        )
+
+    def list_users(self, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        return self._page(
+            "SELECT id, username, email FROM users WHERE id > ? ORDER BY id LIMIT ?",
+            limit, cursor
+        )
+
+    def get_users(self, usernames):
+        usernames = list(dict.fromkeys(usernames))
+        users = []
+        with self._conn() as conn:
+            # Stay well under SQLite's bound-parameter limit.
+            for i in range(0, len(usernames), 500):
+                chunk = usernames[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                users.extend(dict(r) for r in conn.execute(
+                    f"SELECT id, username, email FROM users WHERE username IN ({marks})", chunk
+                ))
+        return users
+
+    def create_admin(self, name, email, password):
+        return self._insert(
+            "INSERT INTO admins (name, email, password) VALUES (?, ?, ?)",
+            (name, email, password)
+        )
+
+    def check_admin(self, email, password):
+        return self._fetchone(
+            "SELECT id, name, email FROM admins WHERE email=? AND password=?",
+            (email, password)
+        )
+
+    def get_profile(self, user_id):
+        return self._fetchone("SELECT * FROM profiles WHERE user_id=?", (user_id,))
+
+    def save_profile(self, user_id, fields):
+        with self._conn() as conn:
+            conn.execute("""
+                INSERT INTO profiles (user_id, career_goal, current_level, interests, time_per_week)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    career_goal = excluded.career_goal,
+                    current_level = excluded.current_level,
+                    interests = excluded.interests,
+                    time_per_week = excluded.time_per_week
+            """, (user_id, *(fields.get(f) for f in PROFILE_FIELDS)))
+            conn.commit()
+
+    def create_project(self, title, description):
+        self._insert("INSERT INTO projects (title, description) VALUES (?, ?)", (title, description))
+
+    def list_projects(self, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        return self._page(
+            "SELECT id, title, description FROM projects WHERE id > ? ORDER BY id LIMIT ?",
+            limit, cursor
+        )
+
+    def stats(self):
+        return dict(self.pool.stats(), backend=self.name)
+
+
+# -------------------- DYNAMODB --------------------
+
+class DynamoStorage(Storage):
+    """The four DynamoDB tables; ``tables`` maps each kind to a boto3 Table."""
+
+    name = "dynamodb"
+
+    def __init__(self, tables):
+        self.users = tables["users"]
+        self.admins = tables["admins"]
+        self.profiles = tables["profiles"]
+        self.projects = tables["projects"]
+
+    @classmethod
+    def from_clients(cls, aws):
+        """Lazy tables from an ``aws_clients.AWSClients``."""
+        return cls({
+            "users": aws.lazy_table("Users"),
+            "admins": aws.lazy_table("Admins"),
+            "profiles": aws.lazy_table("Profiles"),
+            "projects": aws.lazy_table("Projects"),
+        })
+
+    @staticmethod
+    def _put_new(table, item, key):
+        from botocore.exceptions import ClientError
+
+        try:
+            table.put_item(Item=item, ConditionExpression=f"attribute_not_exists({key})")
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
+
+    def create_user(self, username, email, password):
+        return self._put_new(
+            self.users, {"username": username, "email": email, "password": password}, "username"
+        )
+
+    def check_user(self, username, password):
+        item = self.users.get_item(Key={"username": username}).get("Item")
+        if item and item.get("password") == password:
+            return _public_user(dict(item, id=item["username"]))
+        return None
+
+    def list_users(self, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        page = dynamo_access.scan_page(
+            self.users, limit, cursor, ProjectionExpression="username, email"
+        )
+        return Page([dict(u, id=u["username"]) for u in page.items], page.cursor)
+
+    def get_users(self, usernames):
+        users = dynamo_access.batch_get(
+            self.users, [{"username": u} for u in usernames],
+            ProjectionExpression="username, email"
+        )
+        return [dict(u, id=u["username"]) for u in users]
+
+    def create_admin(self, name, email, password):
+        return self._put_new(
+            self.admins, {"email": email, "name": name, "password": password}, "email"
+        )
+
+    def check_admin(self, email, password):
+        item = self.admins.get_item(Key={"email": email}).get("Item")
+        if item and item.get("password") == password:
+            return {"id": item["email"], "name": item.get("name"), "email": item["email"]}
+        return None
+
+    def get_profile(self, user_id):
+        return self.profiles.get_item(Key={"user_id": user_id}).get("Item")
+
+    def save_profile(self, user_id, fields):
+        item = {f: fields.get(f) for f in PROFILE_FIELDS}
+        item["user_id"] = user_id
+        self.profiles.put_item(Item=item)
+
+    def create_project(self, title, description):
+        self.projects.put_item(
+            Item={"id": str(uuid.uuid4()), "title": title, "description": description}
+        )
+
+    def list_projects(self, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        return dynamo_access.scan_page(self.projects, limit, cursor)
+
+
+# -------------------- MEMORY --------------------
+
+class MemoryStorage(Storage):
+    """Process-local dicts; nothing survives a restart."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids = count(1)
+        self._users = {}        # username -> user
+        self._user_list = []    # insertion order, for paging
+        self._admins = {}       # email -> admin
+        self._profiles = {}     # user id -> profile
+        self._projects = []
+
+    @staticmethod
+    def _page(rows, limit, cursor, shape=dict):
+        start = int(cursor) if cursor and cursor.isdigit() else 0
+        end = start + limit
+        return Page([shape(r) for r in rows[start:end]], str(end) if end < len(rows) else None)
+
+    def create_user(self, username, email, password):
+        with self._lock:
+            if username in self._users:
+                return False
+            user = {"id": next(self._ids), "username": username, "email": email, "password": password}
+            self._users[username] = user
+            self._user_list.append(user)
+        return True
+
+    def check_user(self, username, password):
+        user = self._users.get(username)
+        return _public_user(user) if user and user["password"] == password else None
+
+    def list_users(self, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        return self._page(self._user_list, limit, cursor, _public_user)
+
+    def get_users(self, usernames):
+        return [_public_user(self._users[u]) for u in dict.fromkeys(usernames) if u in self._users]
+
+    def create_admin(self, name, email, password):
+        with self._lock:
+            if email in self._admins:
+                return False
+            self._admins[email] = {
+                "id": next(self._ids), "name": name, "email": email, "password": password
+            }
+        return True
+
+    def check_admin(self, email, password):
+        admin = self._admins.get(email)
+        if admin and admin["password"] == password:
+            return {k: admin[k] for k in ("id", "name", "email")}
+        return None
+
+    def get_profile(self, user_id):
+        profile = self._profiles.get(user_id)
+        return dict(profile) if profile else None
+
+    def save_profile(self, user_id, fields):
+        profile = {f: fields.get(f) for f in PROFILE_FIELDS}
+        profile["user_id"] = user_id
+        self._profiles[user_id] = profile
+
+    def create_project(self, title, description):
+        with self._lock:
+            self._projects.append({"id": next(self._ids), "title": title, "description": description})
+
+    def list_projects(self, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        return self._page(self._projects, limit, cursor)
+
+
+# -------------------- FACTORY --------------------
+
+BACKENDS = ("sqlite", "dynamodb", "memory")
+
+
+def create_storage(backend, pool=None, aws=None):
+    """Build the backend named by ``STORAGE_BACKEND``.
+
+    ``sqlite`` needs the app's connection pool, ``dynamodb`` an
+    ``aws_clients.AWSClients``.
+    """
+    if backend == "sqlite":
+        return SQLiteStorage(pool)
+    if backend == "dynamodb":
+        return DynamoStorage.from_clients(aws)
+    if backend == "memory":
+        return MemoryStorage()
+    raise ValueError(f"unknown storage backend {backend!r}; expected one of {BACKENDS}")
+
+
+# -------------------- FLASK BINDING --------------------
+
+def init_app(app, store):
+    """Make ``store`` the storage behind ``get_storage()`` for ``app``."""
+    app.extensions["storage"] = store
+
+
+def get_storage():
+    return current_app.extensions["storage"]
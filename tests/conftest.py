@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """``create_app`` on a throwaway career.db, memory storage and no
+    on-disk template or asset caches."""
+    import app
+
+    def make(**config):
+        settings = {
+            "DB_NAME": str(tmp_path / "career.db"),
+            "STORAGE_BACKEND": "memory",
+            "JINJA_CACHE_DIR": "",
+            "CACHE_STAMP_DIR": str(tmp_path / "stamps"),
+            "ASSETS_AUTO_BUILD": False,
+            "TESTING": True,
+        }
+        settings.update(config)
+        return app.create_app(settings)
+
+    return make
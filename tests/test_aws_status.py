@@ -0,0 +1,68 @@
+from aws_status import StatusPoller
+
+
+class StubEC2:
+
+    def __init__(self):
+        self.reservations = []
+        self.error = None
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self):
+        if self.error:
+            raise self.error
+        return [{"Reservations": self.reservations}]
+
+
+class StubIAM:
+
+    def __init__(self):
+        self.error = None
+
+    def get_user(self):
+        if self.error:
+            raise self.error
+        return {"User": {"UserName": "admin", "Arn": "arn:aws:iam::1:user/admin"}}
+
+
+def test_failed_half_keeps_its_last_success_time(monkeypatch):
+    ec2, iam = StubEC2(), StubIAM()
+    poller = StatusPoller(ec2, iam)
+    clock = [1000.0]
+    monkeypatch.setattr("aws_status.time.time", lambda: clock[0])
+
+    poller.refresh()
+    clock[0] += 120
+    ec2.error = RuntimeError("throttled")
+    poller.refresh()
+    snapshot = poller.snapshot()
+    poller.stop()
+
+    assert snapshot["ages"] == {"instances": 120.0, "user": 0.0}
+    assert snapshot["age_seconds"] == 120.0
+    assert snapshot["errors"] == {"instances": "throttled"}
+
+
+def test_empty_instance_list_survives_a_failure():
+    ec2, iam = StubEC2(), StubIAM()
+    poller = StatusPoller(ec2, iam)
+
+    poller.refresh()
+    ec2.error = RuntimeError("throttled")
+    snapshot = poller.refresh()
+
+    assert snapshot["instances"] == []
+
+
+def test_never_loaded_half_has_no_age():
+    ec2, iam = StubEC2(), StubIAM()
+    iam.error = RuntimeError("AccessDenied")
+    poller = StatusPoller(ec2, iam)
+
+    snapshot = poller.snapshot()
+    poller.stop()
+
+    assert snapshot["user"]["UserName"] == "Access Denied"
+    assert snapshot["ages"]["user"] is None and snapshot["age_seconds"] is None
@@ -0,0 +1,48 @@
+import io
+from types import SimpleNamespace
+
+import bulk_import
+
+
+class FakeTable:
+    """Just enough of a boto3 Table for dynamo_access's batch helpers."""
+
+    def __init__(self, name, key, items=()):
+        self.name = name
+        self.key = key
+        self.items = {item[key]: dict(item) for item in items}
+        self.meta = SimpleNamespace(client=self)
+
+    def batch_get_item(self, RequestItems):
+        keys = RequestItems[self.name]["Keys"]
+        found = [{self.key: k[self.key]} for k in keys if k[self.key] in self.items]
+        return {"Responses": {self.name: found}}
+
+    def batch_write_item(self, RequestItems):
+        for request in RequestItems[self.name]:
+            item = request["PutRequest"]["Item"]
+            self.items[item[self.key]] = item
+        return {}
+
+
+def test_import_leaves_existing_users_untouched():
+    users = FakeTable("users", "username", [{"username": "alice", "password": "original"}])
+    rows = bulk_import.read_items(io.StringIO(
+        "username,password\nalice,hijacked\nbob,secret\n,nokey\n"
+    ), "csv")
+
+    stats = bulk_import.import_items(users, rows, "username", keep_existing=True)
+
+    assert users.items["alice"]["password"] == "original"
+    assert users.items["bob"]["password"] == "secret"
+    assert (stats["items"], stats["existing"], stats["skipped"]) == (1, 1, 1)
+
+
+def test_profiles_import_still_overwrites():
+    profiles = FakeTable("profiles", "user_id", [{"user_id": "alice", "skills": "old"}])
+    rows = [{"user_id": "alice", "skills": "new"}]
+
+    stats = bulk_import.import_items(profiles, rows, "user_id")
+
+    assert profiles.items["alice"]["skills"] == "new"
+    assert stats["existing"] == 0
@@ -0,0 +1,56 @@
+import cache
+
+
+def test_invalidation_reaches_other_workers_through_the_stamp(tmp_path):
+    # Two workers: separate in-process caches, one stamp file on the host.
+    db = {"alice": "v1"}
+    workers = [
+        cache.ReadThroughCache("profiles", 60, stamp_dir=str(tmp_path))
+        for _ in range(2)
+    ]
+    for worker in workers:
+        assert worker.get("alice", lambda: db["alice"]) == "v1"
+
+    db["alice"] = "v2"
+    workers[0].invalidate("alice")
+
+    assert workers[1].get("alice", lambda: db["alice"]) == "v2"
+    assert workers[1].get("alice", lambda: "not called") == "v2"
+
+
+def test_invalidation_only_drops_the_keys_bucket(tmp_path):
+    workers = [cache.ReadThroughCache("profiles", 60, stamp_dir=str(tmp_path)) for _ in range(2)]
+    users = [f"user{i}" for i in range(200)]
+    for user in users:
+        workers[1].get(user, lambda: "cached")
+
+    workers[0].invalidate("user0")
+
+    bucket = workers[1]._stamp("user0")
+    kept = [u for u in users if workers[1].get(u, lambda: "reloaded") == "cached"]
+    assert "user0" not in kept
+    assert kept == [u for u in users if workers[1]._stamp(u) is not bucket]
+    assert len(kept) > 150
+
+
+def test_invalidate_all_reaches_every_bucket(tmp_path):
+    workers = [cache.ReadThroughCache("projects", 60, stamp_dir=str(tmp_path)) for _ in range(2)]
+    for cursor in ("", "a", "b"):
+        workers[1].get(cursor, lambda: "old")
+    workers[0].invalidate_all()
+    assert [workers[1].get(c, lambda: "new") for c in ("", "a", "b")] == ["new"] * 3
+
+
+def test_stamp_changes_on_every_bump(tmp_path):
+    stamp = cache.FileStamp(str(tmp_path / "s"))
+    seen = {stamp.read()}
+    for _ in range(20):
+        stamp.bump()
+        seen.add(stamp.read())
+    assert len(seen) == 21
+
+
+def test_without_stamp_local_entries_are_served(tmp_path):
+    local = cache.ReadThroughCache("projects", 60)
+    assert local.get("", lambda: 1) == 1
+    assert local.get("", lambda: 2) == 1
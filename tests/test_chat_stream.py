@@ -0,0 +1,45 @@
+import asyncio
+import json
+
+from chat_stream import ChatStream
+
+
+def run(app, message):
+    """Drive one POST through the ASGI app and return what it sent."""
+    sent = []
+    disconnect = asyncio.Event()
+
+    async def receive():
+        if not sent:
+            return {"type": "http.request", "body": json.dumps({"message": message}).encode()}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(event):
+        sent.append(event)
+
+    scope = {"type": "http", "path": "/chat/stream", "method": "POST"}
+    asyncio.run(asyncio.wait_for(app(scope, receive, send), 5))
+    return sent
+
+
+def test_stream_ends_with_done():
+    app = ChatStream(lambda message: "hello there")
+    sent = run(app, "hi")
+
+    assert sent[0]["status"] == 200
+    assert sent[-1]["body"].startswith(b"event: done\n")
+    assert not sent[-1].get("more_body")
+    assert app.stats()["served"] == 1
+
+
+def test_failing_reply_sends_terminal_error():
+    def reply(message):
+        raise RuntimeError("engine down")
+
+    app = ChatStream(reply, heartbeat=0.05)
+    sent = run(app, "hi")
+
+    assert sent[-1]["body"].startswith(b"event: error\n")
+    assert not sent[-1].get("more_body")
+    assert app.stats()["failed"] == 1 and app.active == 0
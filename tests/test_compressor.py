@@ -0,0 +1,37 @@
+import compressor
+
+
+def test_range_request_on_static_file_is_not_compressed(make_app):
+    client = make_app(COMPRESS_MIN_SIZE=0).test_client()
+    full = client.get("/static/style.css").data
+
+    res = client.get("/static/style.css", headers={
+        "Range": "bytes=0-1023", "Accept-Encoding": "gzip",
+    })
+
+    assert res.status_code == 206
+    assert "Content-Encoding" not in res.headers
+    assert res.headers["Content-Range"] == f"bytes 0-1023/{len(full)}"
+    assert res.data == full[:1024]
+
+
+def test_partial_content_is_never_compressed():
+    def app(environ, start_response):
+        start_response("206 Partial Content", [
+            ("Content-Type", "text/css"), ("Content-Range", "bytes 0-4095/8192"),
+            ("Content-Length", "4096"),
+        ])
+        return [b"a" * 4096]
+
+    middleware = compressor.CompressionMiddleware(app)
+    sent = {}
+
+    def start_response(status, headers, exc_info=None):
+        sent.update(status=status, headers=dict(headers))
+
+    body = b"".join(middleware({"HTTP_ACCEPT_ENCODING": "gzip", "REQUEST_METHOD": "GET"},
+                               start_response))
+
+    assert body == b"a" * 4096
+    assert "Content-Encoding" not in sent["headers"]
+    assert middleware.stats()["skipped"] == {"status": 1}
@@ -0,0 +1,21 @@
+from catalog import get_catalog
+from goal_resolver import GoalResolver
+
+
+def resolver():
+    return GoalResolver(get_catalog())
+
+
+def test_generic_one_word_goal_gets_the_default_roadmap():
+    goals = resolver()
+    for goal in ("engineer", "developer", "designer"):
+        assert goals.resolve(goal) is None
+        assert goals.roadmap_for(goal) == get_catalog().default_roadmap
+
+
+def test_typos_and_synonyms_still_resolve():
+    goals = resolver()
+    assert goals.resolve("data scienist") == "data scientist"
+    assert goals.resolve("machine lerning engineer") == "data scientist"
+    assert goals.resolve("graphic desinger") == "ui ux designer"
+    assert goals.resolve("senior backend engineer") == "software developer"
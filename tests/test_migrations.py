@@ -0,0 +1,24 @@
+import sqlite3
+
+import migrations
+
+
+def test_database_seeded_at_version_3_catches_up(tmp_path):
+    # A dev database that ran the withdrawn seed_default_projects.
+    conn = sqlite3.connect(tmp_path / "career.db")
+    for step in migrations.MIGRATIONS[:2]:
+        step(conn.cursor())
+    conn.executemany("INSERT INTO projects (title, description) VALUES (?, ?)",
+                     migrations.SEEDED_PROJECTS + (("Capstone", "Admin's own project"),))
+    conn.execute("PRAGMA user_version = 3")
+    conn.commit()
+
+    assert migrations.migrate(conn) == len(migrations.MIGRATIONS)
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'sessions'").fetchone()
+    assert conn.execute("SELECT title FROM projects").fetchall() == [("Capstone",)]
+
+
+def test_fresh_database_has_no_seeded_projects(tmp_path):
+    conn = sqlite3.connect(tmp_path / "career.db")
+    migrations.migrate(conn)
+    assert conn.execute("SELECT COUNT(*) FROM projects").fetchone() == (0,)
@@ -0,0 +1,112 @@
+import json
+import threading
+
+import notifications
+
+
+class StubSNS:
+
+    def __init__(self):
+        self.entries = []
+
+    def publish_batch(self, TopicArn, PublishBatchRequestEntries):
+        self.entries.extend(PublishBatchRequestEntries)
+        return {"Successful": [{"Id": e["Id"]} for e in PublishBatchRequestEntries]}
+
+
+def test_spill_file_is_replayed_once(tmp_path):
+    spill = tmp_path / "spill.ndjson"
+    spill.write_text(json.dumps({"message": "queued earlier", "subject": None}) + "\n{torn")
+    sns = StubSNS()
+    first = notifications.Notifier(sns, "arn", linger=0, spill_path=str(spill))
+    second = notifications.Notifier(sns, "arn", linger=0, spill_path=str(spill))
+
+    first.notify("a")
+    second.notify("b")  # the spill file is already gone
+    assert first.flush() and second.flush()
+
+    assert sorted(e["Message"] for e in sns.entries) == ["a", "b", "queued earlier"]
+    first.close()
+    second.close()
+
+
+def test_replay_race_does_not_raise(tmp_path, monkeypatch):
+    spill = tmp_path / "spill.ndjson"
+    spill.write_text(json.dumps({"message": "m", "subject": None}) + "\n")
+
+    def lost_the_race(src, dst):
+        raise FileNotFoundError(src)
+
+    monkeypatch.setattr(notifications.os, "replace", lost_the_race)
+    notifier = notifications.Notifier(StubSNS(), "arn", linger=0, spill_path=str(spill))
+    notifier.notify("signup")
+    assert notifier.flush()
+    assert notifier.stats()["published"] == 1
+    notifier.close()
+
+
+def test_undecodable_spill_lines_are_skipped(tmp_path):
+    spill = tmp_path / "spill.ndjson"
+    spill.write_bytes(b"\xff\xfe\x00garbage\n" + json.dumps({"message": "kept", "subject": None}).encode() + b"\n")
+    sns = StubSNS()
+    notifier = notifications.Notifier(sns, "arn", linger=0, spill_path=str(spill))
+    notifier.start()
+    assert notifier.flush()
+
+    assert [e["Message"] for e in sns.entries] == ["kept"]
+    assert list(tmp_path.iterdir()) == []
+    notifier.close()
+
+
+def test_failed_replay_is_retried_by_next_start(tmp_path, monkeypatch):
+    spill = tmp_path / "spill.ndjson"
+    spill.write_text(json.dumps({"message": "queued earlier", "subject": None}) + "\n")
+
+    def unreadable(*args, **kwargs):
+        raise OSError("I/O error")
+
+    monkeypatch.setattr(notifications, "open", unreadable, raising=False)
+    sns = StubSNS()
+    first = notifications.Notifier(sns, "arn", linger=0, spill_path=str(spill))
+    first.start()
+    assert first.flush()
+    first.close()
+    assert sns.entries == []
+    assert [p.suffix for p in tmp_path.iterdir()] == [".replay"]
+
+    monkeypatch.undo()
+    second = notifications.Notifier(sns, "arn", linger=0, spill_path=str(spill))
+    second.start()
+    assert second.flush()
+    assert [e["Message"] for e in sns.entries] == ["queued earlier"]
+    assert list(tmp_path.iterdir()) == []
+    second.close()
+
+
+class BlockingSNS(StubSNS):
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def publish_batch(self, TopicArn, PublishBatchRequestEntries):
+        self.entered.set()
+        self.release.wait(5)
+        return super().publish_batch(TopicArn, PublishBatchRequestEntries)
+
+
+def test_unwritable_spill_counts_lost(tmp_path):
+    sns = BlockingSNS()
+    notifier = notifications.Notifier(
+        sns, "arn", maxsize=1, linger=0, spill_path=str(tmp_path / "missing" / "spill.ndjson")
+    )
+    notifier.notify("first")
+    assert sns.entered.wait(5)  # the worker is stuck publishing "first"
+    notifier.notify("second")   # fills the queue
+    notifier.notify("overflow")
+    assert notifier.stats()["lost"] == 1
+
+    sns.release.set()
+    notifier.close()
+    assert notifier.stats()["published"] == 2
@@ -0,0 +1,42 @@
+from page_cache import get_page_cache, render_cached
+from storage import get_storage
+
+
+def _add_project_list(flask_app):
+    # aws_app's /projects: the projects table through the page cache.
+    @flask_app.route("/test/projects")
+    def project_list():
+        load = lambda: {"projects": get_storage().list_projects().items}
+        return render_cached("projects_list.html", load, max_age=0)
+
+
+def test_invalidation_reaches_other_workers(make_app, tmp_path):
+    # Two workers: separate apps and page caches, one sqlite db and stamp dir.
+    config = dict(STORAGE_BACKEND="sqlite", CACHE_STAMP_DIR=str(tmp_path / "stamps"))
+    writer, reader = make_app(**config), make_app(**config)
+    for flask_app in (writer, reader):
+        _add_project_list(flask_app)
+    visitor = reader.test_client()
+
+    first = visitor.get("/test/projects")
+    assert b"Quantum Gardening" not in first.data
+
+    with writer.app_context():
+        get_storage().create_project("Quantum Gardening", "d")
+        get_page_cache().invalidate("projects_list.html")
+
+    revalidated = visitor.get("/test/projects", headers={"If-None-Match": first.headers["ETag"]})
+    assert revalidated.status_code == 200
+    assert b"Quantum Gardening" in revalidated.data
+
+
+def test_cached_page_answers_304(make_app):
+    client = make_app().test_client()
+    etag = client.get("/about").headers["ETag"]
+    assert client.get("/about", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_projects_shows_the_career_paths(make_app):
+    response = make_app().test_client().get("/projects")
+    assert b"Career Paths" in response.data
+    assert b"Build applications, websites, and systems" in response.data
@@ -0,0 +1,132 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+import resume_batch
+
+
+@pytest.fixture(autouse=True)
+def fresh_slots(monkeypatch):
+    # The test client leaves responses open, so slots would leak across tests.
+    monkeypatch.setattr(resume_batch, "_slots", resume_batch.threading.BoundedSemaphore(2))
+
+
+@pytest.fixture
+def admin_client(make_app):
+    client = make_app().test_client()
+    client.post("/admin/signup", data={"name": "a", "email": "a@example.com", "password": "pw"})
+    client.post("/admin/login", data={"email": "a@example.com", "password": "pw"})
+    return client
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_bad_ndjson_lines_become_error_records(admin_client):
+    body = "\n".join([
+        json.dumps({"id": "ok", "text": "python sql"}),
+        "{not json",
+        "[1, 2]",
+        json.dumps({"id": "n", "text": 5}),
+    ])
+    response = admin_client.post("/api/resume/batch", data=body)
+
+    assert response.status_code == 200
+    lines = _lines(response)
+    by_id = {line["id"]: line for line in lines if "id" in line}
+    assert "error" not in by_id["ok"]
+    assert by_id[2]["error"] == "invalid JSON"
+    assert by_id[3]["error"] == "expected a JSON object"
+    assert "error" in by_id["n"]
+    assert lines[-1]["summary"]["errors"] == 3
+
+
+def _zip(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+def test_oversized_line_is_rejected_without_reading_it_whole(monkeypatch):
+    monkeypatch.setattr(resume_batch, "MAX_DOCUMENT_BYTES", 100)
+    stream = io.BytesIO(b"\n".join([
+        json.dumps({"id": "big", "text": "x" * 1000}).encode(),
+        json.dumps({"id": "ok", "text": "python"}).encode(),
+    ]))
+    reads = []
+    readline = stream.readline
+    stream.readline = lambda size=-1: reads.append(size) or readline(size)
+
+    docs = list(resume_batch.read_ndjson(stream))
+
+    assert docs[0] == {"id": 1, "error": "line exceeds 100 bytes"}
+    assert docs[1]["id"] == "ok"
+    assert set(reads) == {101}
+
+
+def test_workers_below_one_are_rejected(admin_client):
+    response = admin_client.post("/api/resume/batch?workers=-2", data="")
+    assert response.status_code == 400
+
+
+def test_cli_rejects_negative_workers(make_app, tmp_path):
+    path = tmp_path / "cv.ndjson"
+    path.write_text(json.dumps({"text": "python"}) + "\n")
+    runner = make_app().test_cli_runner()
+
+    result = runner.invoke(args=["score-resumes", str(path), "--workers", "-1"])
+    assert result.exit_code == 2
+    assert "Invalid value for '--workers'" in result.output
+
+    result = runner.invoke(args=["score-resumes", str(path), "--workers", "0"])
+    assert result.exit_code == 0
+    assert json.loads(result.output.splitlines()[-1])["summary"]["documents"] == 1
+
+
+def test_zip_over_the_caps_is_rejected_before_streaming(admin_client, monkeypatch):
+    monkeypatch.setattr(resume_batch, "MAX_ZIP_BYTES", 1024)
+    response = admin_client.post(
+        "/api/resume/batch", data={"file": (_zip({"bomb.txt": b"0" * 4096}), "cv.zip")}
+    )
+    assert response.status_code == 400
+
+    monkeypatch.setattr(resume_batch, "MAX_ZIP_MEMBERS", 1)
+    response = admin_client.post(
+        "/api/resume/batch", data={"file": (_zip({"a.txt": b"a", "b.txt": b"b"}), "cv.zip")}
+    )
+    assert response.status_code == 400
+
+
+def test_oversized_zip_member_is_an_error_record(monkeypatch):
+    monkeypatch.setattr(resume_batch, "MAX_DOCUMENT_BYTES", 100)
+    docs = list(resume_batch.read_zip(_zip({"big.txt": b"x" * 1000, "small.txt": b"python"})))
+    assert "error" in docs[0]
+    assert docs[1]["text"] == "python"
+
+
+def test_concurrent_batches_are_capped(admin_client, monkeypatch):
+    monkeypatch.setattr(resume_batch, "_slots", resume_batch.threading.BoundedSemaphore(1))
+    assert resume_batch.try_acquire_slot()
+    try:
+        response = admin_client.post("/api/resume/batch", data="")
+        assert response.status_code == 429
+    finally:
+        resume_batch.release_slot()
+    response = admin_client.post("/api/resume/batch", data="")
+    assert response.status_code == 200
+    response.close()
+    # The finished response gave its slot back.
+    assert resume_batch.try_acquire_slot()
+    resume_batch.release_slot()
+
+
+def test_shared_pool_scores(admin_client):
+    body = "\n".join(json.dumps({"id": i, "text": "python sql pandas"}) for i in range(10))
+    lines = _lines(admin_client.post("/api/resume/batch?workers=1", data=body))
+    assert lines[-1]["summary"]["documents"] == 10
@@ -0,0 +1,55 @@
+import io
+import zipfile
+
+import pytest
+
+import resume_ingest
+from matcher import KeywordMatcher
+
+DOCUMENT = (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body><w:p><w:r><w:t>python and sql</w:t></w:r></w:p></w:body></w:document>"
+)
+
+
+def _docx(document, compression=zipfile.ZIP_DEFLATED):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression) as archive:
+        archive.writestr("word/document.xml", document)
+    return buf.getvalue()
+
+
+def _corrupt_member(data, document):
+    # Flip a byte inside the member's data, past its local header.
+    start = data.index(b"word/document.xml") + len("word/document.xml")
+    data = bytearray(data)
+    data[start + len(document) // 2] ^= 0xFF
+    return bytes(data)
+
+
+def _scan(data):
+    return resume_ingest.scan_upload(io.BytesIO(data), KeywordMatcher(["python", "sql"]), "cv.docx")
+
+
+def test_docx_is_scanned():
+    assert set(_scan(_docx(DOCUMENT))) == {"python", "sql"}
+
+
+@pytest.mark.parametrize("data", [
+    b"not a zip at all",
+    _docx(DOCUMENT.replace("</w:t>", "</w:x>")),
+    _corrupt_member(_docx(DOCUMENT, zipfile.ZIP_STORED), DOCUMENT),
+    _corrupt_member(_docx(DOCUMENT * 20), DOCUMENT),
+], ids=["not-zip", "bad-xml", "bad-crc", "bad-deflate"])
+def test_malformed_docx_is_unsupported(data):
+    with pytest.raises(resume_ingest.UnsupportedResume):
+        _scan(data)
+
+
+def test_malformed_docx_upload_is_415(make_app):
+    client = make_app().test_client()
+    response = client.post(
+        "/api/resume/upload?filename=cv.docx", data=_docx(DOCUMENT.replace("</w:t>", "</w:x>"))
+    )
+    assert response.status_code == 415
+    assert response.get_json() == {"error": "not a valid .docx file"}
@@ -0,0 +1,81 @@
+import os
+import time
+
+import pytest
+from flask import session
+
+import sessions
+
+
+def _plant_route(flask_app):
+    @flask_app.route("/test/plant")
+    def plant():
+        session["quiz_result"] = "Data Scientist"
+        return ""
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_login_rotates_planted_session_id(make_app, backend):
+    flask_app = make_app(SESSION_BACKEND=backend)
+    _plant_route(flask_app)
+
+    attacker = flask_app.test_client()
+    attacker.get("/test/plant")
+    planted = attacker.get_cookie("session").value
+
+    victim = flask_app.test_client()
+    victim.set_cookie("session", planted)
+    victim.post("/signup", data={"username": "victim", "email": "v@example.com", "password": "pw"})
+    response = victim.post("/login", data={"username": "victim", "password": "pw"})
+
+    assert response.status_code == 302
+    assert victim.get_cookie("session").value != planted
+    assert victim.get("/home").status_code == 200
+    # The planted id is gone from the store, so it is not logged in.
+    assert flask_app.session_interface.store.load(planted) is None
+    assert attacker.get("/home").status_code == 302
+
+
+def test_admin_login_rotates_session_id(make_app):
+    flask_app = make_app(SESSION_BACKEND="memory")
+    _plant_route(flask_app)
+    client = flask_app.test_client()
+    client.get("/test/plant")
+    planted = client.get_cookie("session").value
+
+    client.post("/admin/signup", data={"name": "a", "email": "a@example.com", "password": "pw"})
+    client.post("/admin/login", data={"email": "a@example.com", "password": "pw"})
+
+    assert client.get_cookie("session").value != planted
+    assert client.get("/admin/cache-stats").status_code == 200
+
+
+def test_untouched_session_is_not_loaded(make_app):
+    flask_app = make_app(SESSION_BACKEND="memory")
+    _plant_route(flask_app)
+    client = flask_app.test_client()
+    client.get("/test/plant")
+    before = flask_app.extensions["sessions"].stats()["loads"]
+
+    client.get("/static/style.css")
+
+    assert flask_app.extensions["sessions"].stats()["loads"] == before
+
+
+def test_encode_round_trip():
+    data = {"user_id": 7, "n": -300, "ok": True, "x": None, "f": 2.5, "s": "é", "l": [1, {"k": b"v"}]}
+    assert sessions.decode(sessions.encode(data)) == data
+    assert sessions.decode(b"\x01d\x05") is None
+
+
+def test_file_store_purges_expired_files(tmp_path):
+    store = sessions.FileSessionStore(str(tmp_path), purge_every=2)
+    old, fresh = "a" * 32, "b" * 32
+    store.save(old, b"x", 60)
+    past = time.time() - 120
+    os.utime(tmp_path / old, (past, past))
+
+    store.save(fresh, b"y", 60)
+
+    assert sorted(os.listdir(tmp_path)) == [fresh]
+    assert store.load(fresh) == b"y"
@@ -0,0 +1,69 @@
+"""Deterministic daily career tip.
+
+The tips in ``data/catalog.json`` are put into a fixed rotation once
+(shuffled with a constant seed, so the catalog order does not leak into
+the calendar), and each calendar day shows the next one. Every worker
+and every render agrees on today's tip, so pages that show it can be
+cached until it changes.
+
+Users can be spread over ``buckets`` (``TIP_BUCKETS``): bucket ``b`` is the
+rotation shifted by ``b`` days and users are assigned by a stable hash of
+their username. The day boundary is midnight at ``TIP_UTC_OFFSET_MINUTES``
+from UTC (default 0).
+
+``max_age()`` and ``expires()`` give the remaining lifetime of today's tip
+for ``Cache-Control`` and ``Expires``.
+"""
+import os
+import random
+import zlib
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
+
+from catalog import get_catalog
+
+ROTATION_SEED = "career-tips"
+
+
+class TipSchedule:
+
+    def __init__(self, tips, buckets=1, utc_offset_minutes=0, seed=ROTATION_SEED, clock=None):
+        if not tips:
+            raise ValueError("no tips to schedule")
+        rotation = list(tips)
+        random.Random(seed).shuffle(rotation)
+        self.rotation = tuple(rotation)
+        self.buckets = max(1, buckets)
+        self.tz = timezone(timedelta(minutes=utc_offset_minutes))
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+
+    def now(self):
+        return self.clock().astimezone(self.tz)
+
+    def bucket(self, user):
+        if self.buckets == 1 or not user:
+            return 0
+        return zlib.crc32(str(user).encode()) % self.buckets
+
+    def tip(self, user=None, day=None):
+        """The tip for ``day`` (default today) as seen by ``user``'s bucket."""
+        day = day or self.now().date()
+        return self.rotation[(day.toordinal() + self.bucket(user)) % len(self.rotation)]
+
+    def expires(self):
+        """When today's tip changes: the next midnight in the schedule's zone."""
+        return datetime.combine(self.now().date() + timedelta(days=1), time(0), self.tz)
+
+    def max_age(self):
+        """Seconds left until ``expires()``."""
+        return max(0, int((self.expires() - self.now()).total_seconds()))
+
+
+@lru_cache(maxsize=None)
+def get_tip_schedule():
+    """The process-wide schedule over the catalog's tips."""
+    return TipSchedule(
+        get_catalog().tips,
+        buckets=int(os.getenv("TIP_BUCKETS", "1")),
+        utc_offset_minutes=int(os.getenv("TIP_UTC_OFFSET_MINUTES", "0")),
+    )